@@ -0,0 +1,45 @@
+"""Product search indexes: full-text document and trigram
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-18 09:10:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0002'
+down_revision = '0001'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    # Build concurrently so large catalogs stay writable while the indexes are created
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_products_search_document',
+            'products',
+            [sa.text("to_tsvector('english', coalesce(name, '') || ' ' || coalesce(description, ''))")],
+            postgresql_using='gin',
+            postgresql_concurrently=True
+        )
+        op.create_index(
+            'ix_products_sku_trgm', 'products', ['sku'],
+            postgresql_using='gin', postgresql_ops={'sku': 'gin_trgm_ops'},
+            postgresql_concurrently=True
+        )
+        op.create_index(
+            'ix_products_name_trgm', 'products', ['name'],
+            postgresql_using='gin', postgresql_ops={'name': 'gin_trgm_ops'},
+            postgresql_concurrently=True
+        )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_products_name_trgm', table_name='products')
+    op.drop_index('ix_products_sku_trgm', table_name='products')
+    op.drop_index('ix_products_search_document', table_name='products')
@@ -0,0 +1,64 @@
+"""Cache invalidation: NOTIFY changed product/user ids to every app worker
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-18 11:05:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '0004'
+down_revision = '0003'
+branch_labels = None
+depends_on = None
+
+TABLES = ('products', 'users')
+
+
+def upgrade() -> None:
+    op.execute("""
+        CREATE OR REPLACE FUNCTION notify_cache_invalidation() RETURNS trigger AS $$
+        DECLARE
+            ids TEXT;
+        BEGIN
+            IF TG_OP = 'TRUNCATE' THEN
+                ids := '*';
+            ELSE
+                SELECT string_agg(id::text, ',') INTO ids FROM changed_rows;
+                IF ids IS NULL THEN
+                    RETURN NULL;
+                END IF;
+                IF length(ids) > 7900 THEN
+                    ids := '*';
+                END IF;
+            END IF;
+            PERFORM pg_notify('cache_invalidation', TG_TABLE_NAME || ':' || ids);
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    for table in TABLES:
+        op.execute(f"""
+            CREATE TRIGGER {table}_notify_cache_update
+            AFTER UPDATE ON {table} REFERENCING OLD TABLE AS changed_rows
+            FOR EACH STATEMENT EXECUTE FUNCTION notify_cache_invalidation()
+        """)
+        op.execute(f"""
+            CREATE TRIGGER {table}_notify_cache_delete
+            AFTER DELETE ON {table} REFERENCING OLD TABLE AS changed_rows
+            FOR EACH STATEMENT EXECUTE FUNCTION notify_cache_invalidation()
+        """)
+        op.execute(f"""
+            CREATE TRIGGER {table}_notify_cache_truncate
+            AFTER TRUNCATE ON {table}
+            FOR EACH STATEMENT EXECUTE FUNCTION notify_cache_invalidation()
+        """)
+
+
+def downgrade() -> None:
+    for table in TABLES:
+        for event in ('update', 'delete', 'truncate'):
+            op.execute(f"DROP TRIGGER IF EXISTS {table}_notify_cache_{event} ON {table}")
+    op.execute("DROP FUNCTION IF EXISTS notify_cache_invalidation()")
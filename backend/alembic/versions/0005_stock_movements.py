@@ -0,0 +1,52 @@
+"""Stock movement ledger with the balance after each movement
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-18 12:30:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0005'
+down_revision = '0004'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # An app that booted with create_all before this ran may have created the table already
+    if 'stock_movements' not in sa.inspect(op.get_bind()).get_table_names():
+        _create_stock_movements()
+    # Existing products start the ledger with their current quantity, dated from their last
+    # change: the quantity cannot have moved since then. Products that already have
+    # movements were recorded by an app that created the table itself
+    op.execute("""
+        INSERT INTO stock_movements (product_id, delta, quantity_after, reason, created_at)
+        SELECT id, quantity, quantity, 'opening balance', updated_at AT TIME ZONE 'UTC' FROM products
+        WHERE NOT EXISTS (SELECT 1 FROM stock_movements WHERE stock_movements.product_id = products.id)
+    """)
+
+
+def _create_stock_movements() -> None:
+    op.create_table(
+        'stock_movements',
+        sa.Column('id', sa.BigInteger(), autoincrement=True, nullable=False),
+        sa.Column('product_id', sa.Integer(), nullable=False),
+        sa.Column('delta', sa.Integer(), nullable=False),
+        sa.Column('quantity_after', sa.Integer(), nullable=False),
+        sa.Column('reason', sa.String(length=100), nullable=False),
+        sa.Column('user_id', sa.Integer(), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('clock_timestamp()'), nullable=False),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(
+        'ix_stock_movements_product_id_created_at', 'stock_movements', ['product_id', 'created_at', 'id']
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_stock_movements_product_id_created_at', table_name='stock_movements')
+    op.drop_table('stock_movements')
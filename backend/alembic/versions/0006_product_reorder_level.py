@@ -0,0 +1,39 @@
+"""Product reorder level and the partial index behind the low-stock listing
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-18 13:40:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0006'
+down_revision = '0005'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # A constant default is stored in the catalog, so this does not rewrite the table
+    op.add_column(
+        'products',
+        sa.Column('reorder_level', sa.Integer(), server_default=sa.text('0'), nullable=False)
+    )
+    op.create_check_constraint('ck_products_reorder_level_non_negative', 'products', 'reorder_level >= 0')
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_products_low_stock',
+            'products',
+            [sa.text('(quantity - reorder_level)'), 'id'],
+            postgresql_where=sa.text('quantity <= reorder_level'),
+            postgresql_concurrently=True
+        )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_products_low_stock', table_name='products')
+    op.drop_constraint('ck_products_reorder_level_non_negative', 'products', type_='check')
+    op.drop_column('products', 'reorder_level')
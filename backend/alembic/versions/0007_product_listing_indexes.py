@@ -0,0 +1,34 @@
+"""Indexes behind the filtered and sorted product listing
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-18 15:10:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '0007'
+down_revision = '0006'
+branch_labels = None
+depends_on = None
+
+LISTING_INDEXES = {
+    'ix_products_type_created_at_id': ['type', 'created_at', 'id'],
+    'ix_products_type_price_id': ['type', 'price', 'id'],
+    'ix_products_price_id': ['price', 'id'],
+    'ix_products_updated_at_id': ['updated_at', 'id'],
+    'ix_products_name_id': ['name', 'id'],
+}
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, columns in LISTING_INDEXES.items():
+            op.create_index(name, 'products', columns, postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    for name in LISTING_INDEXES:
+        op.drop_index(name, table_name='products')
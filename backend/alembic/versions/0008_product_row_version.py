@@ -0,0 +1,28 @@
+"""Product row version for optimistic concurrency
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-18 17:20:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0008'
+down_revision = '0007'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # A constant default is stored in the catalog, so this does not rewrite the table
+    op.add_column(
+        'products',
+        sa.Column('version', sa.Integer(), server_default=sa.text('1'), nullable=False)
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('products', 'version')
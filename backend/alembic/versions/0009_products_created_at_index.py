@@ -0,0 +1,30 @@
+"""Keyset index behind the default product listing order and export
+
+Revision ID: 0009
+Revises: 0008
+Create Date: 2026-10-18 19:00:00.000000
+
+Databases stamped at 0001 from create_all never had this index; databases that
+ran an earlier 0001 which created it already do, hence IF NOT EXISTS.
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '0009'
+down_revision = '0008'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Raw SQL: op.create_index(if_not_exists=...) needs SQLAlchemy 2.0
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_products_created_at_id ON products (created_at, id)"
+        )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_products_created_at_id', table_name='products')
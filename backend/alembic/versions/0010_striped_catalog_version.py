@@ -0,0 +1,94 @@
+"""Catalog version: stripe the counter and skip statements that changed no rows
+
+Revision ID: 0010
+Revises: 0009
+Create Date: 2026-10-18 20:10:00.000000
+
+A single catalog_state row made every write to products wait for the previous
+writer's commit. The version is now the sum of 16 stripes; each statement bumps
+the stripe of its backend. The existing row keeps its count as stripe 1, so the
+version carries on from where it was.
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '0010'
+down_revision = '0009'
+branch_labels = None
+depends_on = None
+
+STRIPES = 16
+EVENTS = (
+    ('insert', 'INSERT', 'NEW'),
+    ('update', 'UPDATE', 'NEW'),
+    ('delete', 'DELETE', 'OLD'),
+)
+
+
+def upgrade() -> None:
+    op.execute("ALTER TABLE catalog_state DROP CONSTRAINT IF EXISTS ck_catalog_state_single_row")
+    # create_all from a newer app may have striped the table already
+    op.execute("ALTER TABLE catalog_state DROP CONSTRAINT IF EXISTS ck_catalog_state_stripe")
+    op.execute(f"""
+        ALTER TABLE catalog_state ADD CONSTRAINT ck_catalog_state_stripe
+        CHECK (id >= 0 AND id < {STRIPES})
+    """)
+    op.execute(f"""
+        INSERT INTO catalog_state (id, version, updated_at)
+        SELECT stripe, 0, now() FROM generate_series(0, {STRIPES - 1}) AS stripe
+        ON CONFLICT (id) DO NOTHING
+    """)
+    op.execute(f"""
+        CREATE OR REPLACE FUNCTION bump_catalog_version() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP <> 'TRUNCATE' THEN
+                IF NOT EXISTS (SELECT 1 FROM changed_rows) THEN
+                    RETURN NULL;
+                END IF;
+            END IF;
+            UPDATE catalog_state SET version = version + 1, updated_at = now()
+            WHERE id = mod(pg_backend_pid(), {STRIPES});
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("DROP TRIGGER IF EXISTS products_bump_catalog_version ON products")
+    for name, event, table in EVENTS:
+        op.execute(f"""
+            CREATE TRIGGER products_bump_catalog_version_{name}
+            AFTER {event} ON products REFERENCING {table} TABLE AS changed_rows
+            FOR EACH STATEMENT EXECUTE FUNCTION bump_catalog_version()
+        """)
+    op.execute("""
+        CREATE TRIGGER products_bump_catalog_version_truncate
+        AFTER TRUNCATE ON products
+        FOR EACH STATEMENT EXECUTE FUNCTION bump_catalog_version()
+    """)
+
+
+def downgrade() -> None:
+    for name in ('insert', 'update', 'delete', 'truncate'):
+        op.execute(f"DROP TRIGGER IF EXISTS products_bump_catalog_version_{name} ON products")
+    op.execute("""
+        UPDATE catalog_state SET version = totals.version, updated_at = totals.updated_at
+        FROM (SELECT sum(version) AS version, max(updated_at) AS updated_at FROM catalog_state) AS totals
+        WHERE id = 1
+    """)
+    op.execute("DELETE FROM catalog_state WHERE id <> 1")
+    op.execute("ALTER TABLE catalog_state DROP CONSTRAINT IF EXISTS ck_catalog_state_stripe")
+    op.execute("ALTER TABLE catalog_state ADD CONSTRAINT ck_catalog_state_single_row CHECK (id = 1)")
+    op.execute("""
+        CREATE OR REPLACE FUNCTION bump_catalog_version() RETURNS trigger AS $$
+        BEGIN
+            UPDATE catalog_state SET version = version + 1, updated_at = now() WHERE id = 1;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE TRIGGER products_bump_catalog_version
+        AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON products
+        FOR EACH STATEMENT EXECUTE FUNCTION bump_catalog_version()
+    """)
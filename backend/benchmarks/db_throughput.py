@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Compares query throughput of the previous `databases` stack with the single
+SQLAlchemy AsyncEngine facade now used by the repositories.
+
+Each worker alternates a primary-key lookup and a 20-row keyset page, the two
+statements behind most API traffic. Both stacks use the same pool size.
+
+The baseline needs the `databases[postgresql]` package, which is no longer a
+runtime dependency; it is skipped when the package is missing.
+
+Usage: DATABASE_URL=postgresql://... python benchmarks/db_throughput.py [--concurrency N] [--seconds S]
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy.engine import make_url  # noqa: E402
+from src.infrastructure.database.database import Database  # noqa: E402
+
+BY_ID = "SELECT id, name, type, sku, image_url, description, quantity, price, created_at, updated_at FROM products WHERE id = :id"
+PAGE = """
+    SELECT id, name, type, sku, image_url, description, quantity, price, created_at, updated_at
+    FROM products ORDER BY created_at DESC, id DESC LIMIT :limit
+"""
+
+
+async def run_workload(database, ids, concurrency, seconds):
+    """Statements completed per second across all workers"""
+    deadline = time.perf_counter() + seconds
+    completed = 0
+
+    async def worker(offset):
+        nonlocal completed
+        index = offset
+        while time.perf_counter() < deadline:
+            await database.fetch_one(query=BY_ID, values={"id": ids[index % len(ids)]})
+            await database.fetch_all(query=PAGE, values={"limit": 20})
+            completed += 2
+            index += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker(offset) for offset in range(concurrency)))
+    return completed / (time.perf_counter() - started)
+
+
+async def measure(database, concurrency, seconds):
+    await database.connect()
+    try:
+        ids = [row[0] for row in await database.fetch_all(query="SELECT id FROM products LIMIT 1000")]
+        if not ids:
+            raise SystemExit("products table is empty; import some products first")
+        await run_workload(database, ids, concurrency, 1)  # warm up pool and statement caches
+        return await run_workload(database, ids, concurrency, seconds)
+    finally:
+        await database.disconnect()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="databases vs SQLAlchemy AsyncEngine throughput")
+    parser.add_argument("--database-url", default=os.getenv("DATABASE_URL"))
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--pool-size", type=int, default=10)
+    parser.add_argument("--seconds", type=float, default=10)
+    args = parser.parse_args()
+    if not args.database_url:
+        raise SystemExit("Set DATABASE_URL or pass --database-url")
+
+    results = {}
+    try:
+        import databases
+    except ImportError:
+        print("databases    skipped (pip install 'databases[postgresql]' for the baseline)")
+    else:
+        url = make_url(args.database_url).set(drivername="postgresql")
+        baseline = databases.Database(str(url), min_size=args.pool_size, max_size=args.pool_size)
+        results["databases"] = asyncio.run(measure(baseline, args.concurrency, args.seconds))
+
+    engine = Database(
+        make_url(args.database_url).set(drivername="postgresql+asyncpg"),
+        pool_size=args.pool_size,
+        max_overflow=0
+    )
+    results["sqlalchemy"] = asyncio.run(measure(engine, args.concurrency, args.seconds))
+
+    for label, rate in results.items():
+        print(f"{label:<12} {rate:9.0f} statements/s")
+    if "databases" in results:
+        print(f"ratio: {results['sqlalchemy'] / results['databases']:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Measures GET /products latency with and without concurrent logins.
+
+Password hashing runs in a thread pool, so p99 of the product listing should
+stay roughly flat while bcrypt-heavy logins hammer the same worker.
+
+Usage: python benchmarks/login_contention.py [--base-url URL] [--requests N] [--login-threads N]
+"""
+
+import argparse
+import statistics
+import threading
+import time
+import requests
+
+
+def percentile(samples, pct):
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def measure_listing(session, base_url, count):
+    """Time sequential GET /products calls in milliseconds"""
+    samples = []
+    for _ in range(count):
+        started = time.perf_counter()
+        response = session.get(f"{base_url}/products", params={"limit": 20})
+        samples.append((time.perf_counter() - started) * 1000)
+        response.raise_for_status()
+    return samples
+
+
+def login_loop(base_url, credentials, stop, counters):
+    session = requests.Session()
+    while not stop.is_set():
+        response = session.post(f"{base_url}/auth/login", json=credentials)
+        counters[response.status_code] = counters.get(response.status_code, 0) + 1
+
+
+def report(label, samples):
+    print(
+        f"{label:<18} p50={statistics.median(samples):7.1f}ms "
+        f"p95={percentile(samples, 95):7.1f}ms p99={percentile(samples, 99):7.1f}ms"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Product listing latency under login load")
+    parser.add_argument("--base-url", default="http://localhost:3000")
+    parser.add_argument("--requests", type=int, default=300, help="GET /products samples per phase")
+    parser.add_argument("--login-threads", type=int, default=16, help="Concurrent login clients")
+    args = parser.parse_args()
+
+    credentials = {"username": f"bench_{int(time.time())}", "password": "benchpass123"}
+    session = requests.Session()
+    session.post(f"{args.base_url}/auth/register", json=credentials).raise_for_status()
+    token = session.post(f"{args.base_url}/auth/login", json=credentials).json()["data"]["token"]
+    session.headers.update({"Authorization": f"Bearer {token}"})
+
+    measure_listing(session, args.base_url, 20)  # warm up
+    baseline = measure_listing(session, args.base_url, args.requests)
+
+    stop = threading.Event()
+    counters = {}
+    threads = [
+        threading.Thread(target=login_loop, args=(args.base_url, credentials, stop, counters), daemon=True)
+        for _ in range(args.login_threads)
+    ]
+    for thread in threads:
+        thread.start()
+    time.sleep(1)
+    try:
+        under_load = measure_listing(session, args.base_url, args.requests)
+    finally:
+        stop.set()
+        for thread in threads:
+            thread.join()
+
+    report("idle", baseline)
+    report("during logins", under_load)
+    print(f"login responses by status: {dict(sorted(counters.items()))}")
+    print(f"p99 ratio (loaded / idle): {percentile(under_load, 99) / percentile(baseline, 99):.2f}x")
+
+
+if __name__ == "__main__":
+    main()
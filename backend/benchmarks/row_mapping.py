@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Measures the cost of turning one page of product rows into entities.
+
+Compares the previous mapping (dict-backed entity, keyword construction by
+column name, Decimal(str(price))) with the slotted Product and the positional
+_to_products mapper, on real rows fetched from DATABASE_URL.
+
+Usage: DATABASE_URL=postgresql://... python benchmarks/row_mapping.py [--page-size N] [--pages N]
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+from decimal import Decimal
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy.engine import make_url  # noqa: E402
+from src.infrastructure.database.database import Database  # noqa: E402
+from src.infrastructure.repositories.sqlalchemy_product_repository import (  # noqa: E402
+    PRODUCT_COLUMNS,
+    _to_products,
+)
+
+
+class LegacyProduct:
+    """The entity as it was before slots: per-instance __dict__ and eager datetime.now() defaults"""
+
+    def __init__(self, id, name, type, sku, image_url, description, quantity, price,
+                 created_at=None, updated_at=None):
+        self.id = id
+        self.name = name
+        self.type = type
+        self.sku = sku
+        self.image_url = image_url
+        self.description = description
+        self.quantity = quantity
+        self.price = price
+        self.created_at = created_at or datetime.now()
+        self.updated_at = updated_at or datetime.now()
+
+
+def legacy_to_products(rows):
+    rows = [row._mapping for row in rows]
+    return [
+        LegacyProduct(
+            id=row["id"],
+            name=row["name"],
+            type=row["type"],
+            sku=row["sku"],
+            image_url=row["image_url"],
+            description=row["description"],
+            quantity=row["quantity"],
+            price=Decimal(str(row["price"])),
+            created_at=row["created_at"],
+            updated_at=row["updated_at"]
+        )
+        for row in rows
+    ]
+
+
+def time_per_page(mapper, rows, pages):
+    started = time.perf_counter()
+    for _ in range(pages):
+        mapper(rows)
+    return (time.perf_counter() - started) / pages * 1e6
+
+
+def bytes_per_page(mapper, rows):
+    """Bytes still allocated while the mapped page is alive"""
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    page = mapper(rows)
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    del page
+    return sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+
+
+async def fetch_page(database_url, page_size):
+    database = Database(make_url(database_url).set(drivername="postgresql+asyncpg"))
+    await database.connect()
+    try:
+        rows = await database.fetch_all(
+            query=f"SELECT {PRODUCT_COLUMNS} FROM products ORDER BY created_at DESC, id DESC LIMIT :limit",
+            values={"limit": page_size}
+        )
+    finally:
+        await database.disconnect()
+    if not rows:
+        raise SystemExit("products table is empty; import some products first")
+    # Repeat rows from a small catalog to fill the page
+    return (rows * (page_size // len(rows) + 1))[:page_size]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Row to entity mapping cost per page")
+    parser.add_argument("--database-url", default=os.getenv("DATABASE_URL"))
+    parser.add_argument("--page-size", type=int, default=100)
+    parser.add_argument("--pages", type=int, default=2000, help="Pages mapped per timing run")
+    args = parser.parse_args()
+    if not args.database_url:
+        raise SystemExit("Set DATABASE_URL or pass --database-url")
+
+    rows = asyncio.run(fetch_page(args.database_url, args.page_size))
+
+    results = {}
+    for label, mapper in (("legacy", legacy_to_products), ("slotted", _to_products)):
+        mapper(rows)  # warm up
+        results[label] = (time_per_page(mapper, rows, args.pages), bytes_per_page(mapper, rows))
+        print(f"{label:<8} {results[label][0]:8.1f}us/page {results[label][1]:9,d} bytes/page")
+
+    legacy, slotted = results["legacy"], results["slotted"]
+    print(f"speedup: {legacy[0] / slotted[0]:.2f}x, memory: {slotted[1] / legacy[1]:.0%} of legacy")
+
+
+if __name__ == "__main__":
+    main()
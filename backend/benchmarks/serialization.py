@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Measures CPU spent turning one page of products into response bytes.
+
+"standard" is the previous GET /products path: StandardResponse(data=dict),
+FastAPI's response_model validation and jsonable_encoder, then stdlib json.
+"orjson" is the current page cache fill: products as native values (to_native_dict),
+validated once against ProductListResponse and encoded by orjson (encode_response).
+
+The two paths run in alternating rounds and each reports its best round, so a
+noisy machine slows both rather than skewing the ratio.
+
+Usage: python benchmarks/serialization.py [--page-size N] [--pages N] [--rounds N]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+from datetime import datetime
+from decimal import Decimal
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastapi.responses import JSONResponse  # noqa: E402
+from fastapi.routing import serialize_response  # noqa: E402
+from fastapi.utils import create_response_field  # noqa: E402
+from src.domain.entities.product import Product  # noqa: E402
+from src.interface.schemas.product_schemas import (  # noqa: E402
+    PRODUCT_LIST_RESPONSE,
+    StandardResponse,
+    encode_response
+)
+
+
+def make_page(size):
+    now = datetime.now()
+    return [
+        Product(
+            id, f"Product {id}", "Electronics", f"SKU-{id:06d}", "https://example.com/p.jpg",
+            "A representative product description of moderate length.", id % 50, Decimal("19.99"), now, now
+        )
+        for id in range(1, size + 1)
+    ]
+
+
+def page_data(products, to_dict=Product.to_dict):
+    return {
+        "products": [to_dict(product) for product in products],
+        "page": 1,
+        "limit": len(products),
+        "next_cursor": None,
+        "total": len(products),
+        "total_mode": "exact",
+    }
+
+
+STANDARD_FIELD = create_response_field(name="Response_get_products", type_=StandardResponse)
+
+
+async def standard(products):
+    response = StandardResponse(success=True, message="Products retrieved successfully", data=page_data(products))
+    content = await serialize_response(field=STANDARD_FIELD, response_content=response, is_coroutine=True)
+    return JSONResponse(content).body
+
+
+async def fast(products):
+    data = page_data(products, Product.to_native_dict)
+    content = {"success": True, "message": "Products retrieved successfully", "data": data}
+    return encode_response(PRODUCT_LIST_RESPONSE, content)
+
+
+async def cpu_per_page(encode, products, pages):
+    started = time.process_time()
+    for _ in range(pages):
+        await encode(products)
+    return (time.process_time() - started) / pages * 1e6
+
+
+async def best_cpu_per_page(encoders, products, pages, rounds):
+    """Best round of each encoder, alternating between them every round"""
+    for encode in encoders.values():
+        await encode(products)  # warm up
+    results = {label: float("inf") for label in encoders}
+    for _ in range(rounds):
+        for label, encode in encoders.items():
+            results[label] = min(results[label], await cpu_per_page(encode, products, pages // rounds or 1))
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Response serialization CPU per product page")
+    parser.add_argument("--page-size", type=int, default=100)
+    parser.add_argument("--pages", type=int, default=1000)
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args()
+
+    products = make_page(args.page_size)
+    encoders = {"standard": standard, "orjson": fast}
+    documents = [json.loads(asyncio.run(encode(products))) for encode in encoders.values()]
+    assert documents[0] == documents[1], "both paths must produce the same document"
+    results = asyncio.run(best_cpu_per_page(encoders, products, args.pages, args.rounds))
+    for label, cpu in results.items():
+        print(f"{label:<9} {cpu:8.1f}us CPU/page")
+
+    print(f"CPU per page: {results['orjson'] / results['standard']:.0%} of standard "
+          f"({results['standard'] / results['orjson']:.2f}x faster)")
+
+
+if __name__ == "__main__":
+    main()
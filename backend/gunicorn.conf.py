@@ -0,0 +1,25 @@
+# Production server: a gunicorn master supervising uvicorn worker processes.
+#   gunicorn -c gunicorn.conf.py "src.app:create_app()"
+# `kill -HUP <master pid>` starts fresh workers and drains the old ones (graceful reload).
+import multiprocessing
+import os
+
+bind = f"0.0.0.0:{os.getenv('PORT', '3000')}"
+
+# One event loop per worker; each worker has its own DB pool (DB_POOL_MAX_SIZE) and caches
+workers = int(os.getenv("WEB_CONCURRENCY", str(multiprocessing.cpu_count())))
+worker_class = "uvicorn.workers.UvicornWorker"
+
+# Workers import the app themselves, so a reload picks up new code and no DB
+# connection or event loop is ever shared across a fork
+preload_app = False
+
+# Seconds a worker gets to finish in-flight requests on shutdown/reload, and the
+# silence after which the master restarts a stuck worker
+graceful_timeout = int(os.getenv("GRACEFUL_TIMEOUT_SECONDS", "30"))
+timeout = int(os.getenv("WORKER_TIMEOUT_SECONDS", "60"))
+keepalive = 5
+
+accesslog = "-"
+errorlog = "-"
+loglevel = os.getenv("LOG_LEVEL", "info")
@@ -1,13 +1,32 @@
+import argparse
+import os
 import uvicorn
-from src.app import create_app
 
-app = create_app()
 
-if __name__ == "__main__":
+def main():
+    parser = argparse.ArgumentParser(description="Inventory Management API server")
+    parser.add_argument(
+        "--profile-startup",
+        action="store_true",
+        help="Print an import/initialisation timing breakdown up to the first request, then exit"
+    )
+    args = parser.parse_args()
+
+    if args.profile_startup:
+        from src.startup_profile import profile_startup
+        profile_startup()
+        return
+
+    # The auto-reloader spawns a file watcher plus a second interpreter; keep it out of production
     uvicorn.run(
-        "main:app",
+        "src.app:create_app",
+        factory=True,
         host="0.0.0.0",
-        port=3000,
-        reload=True,
+        port=int(os.getenv("PORT", "3000")),
+        reload=os.getenv("ENV", "development") == "development",
         log_level="info"
-    ) 
\ No newline at end of file
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -14,7 +14,7 @@ def run_dev():
     try:
         subprocess.run([
             sys.executable, "-m", "uvicorn", 
-            "main:app", 
+            "src.app:create_app", "--factory",
             "--host", "0.0.0.0",
             "--port", "3000",
             "--reload",
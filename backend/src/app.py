@@ -2,18 +2,26 @@ from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 import os
+import time
 from dotenv import load_dotenv
 
-from src.infrastructure.database.connection import database, engine
-from src.infrastructure.database.models import Base
+from src.infrastructure.database.connection import database, replica_router, DB_POOL_MIN_SIZE
+from src.infrastructure.cache.invalidation import cache_invalidation_listener, CACHE_INVALIDATION_ENABLED
 from src.interface.routes.auth import auth_router
 from src.interface.routes.products import products_router
+from src.interface.routes.metrics import metrics_router
 from src.interface.middleware.error_handler import http_exception_handler, general_exception_handler, validation_exception_handler
 from fastapi.exceptions import RequestValidationError
 
 # Load environment variables
 load_dotenv()
 
+# Production schemas are managed by Alembic (`alembic upgrade head`); creating missing
+# tables at boot is a development convenience
+AUTO_CREATE_SCHEMA = os.getenv(
+    "DB_AUTO_CREATE_SCHEMA", "false" if os.getenv("ENV") == "production" else "true"
+).lower() == "true"
+
 def create_app() -> FastAPI:
     app = FastAPI(
         title="Inventory Management API",
@@ -35,17 +43,42 @@ def create_app() -> FastAPI:
     # Database initialization
     @app.on_event("startup")
     async def startup():
-        # Create tables if they don't exist
-        Base.metadata.create_all(bind=engine)
+        # (phase, seconds) pairs, reported by `python main.py --profile-startup`
+        timings = app.state.startup_timings = []
+
+        started = time.perf_counter()
         await database.connect()
+        await database.prewarm(DB_POOL_MIN_SIZE)
+        timings.append(("connect + prewarm pool", time.perf_counter() - started))
+
+        if replica_router.replica is not None:
+            started = time.perf_counter()
+            await replica_router.start()
+            timings.append(("connect replica + lag check", time.perf_counter() - started))
+
+        if AUTO_CREATE_SCHEMA:
+            started = time.perf_counter()
+            # Imported here so production boots never load the ORM models
+            from src.infrastructure.database.models import Base
+            # Create tables if they don't exist
+            async with database.engine.begin() as connection:
+                await connection.run_sync(Base.metadata.create_all)
+            timings.append(("create_all", time.perf_counter() - started))
+
+        if CACHE_INVALIDATION_ENABLED:
+            # Connects in the background; caches are cleared once it is listening
+            await cache_invalidation_listener.start()
 
     @app.on_event("shutdown")
     async def shutdown():
+        await cache_invalidation_listener.stop()
+        await replica_router.stop()
         await database.disconnect()
 
     # Include routers
     app.include_router(auth_router, prefix="/auth", tags=["Authentication"])
     app.include_router(products_router, prefix="/products", tags=["Products"])
+    app.include_router(metrics_router, prefix="/metrics", tags=["Monitoring"])
 
     # Health check endpoint
     @app.get("/health")
@@ -1,10 +1,7 @@
 import os
 from datetime import datetime, timedelta
-from passlib.context import CryptContext
-from jose import jwt
 from src.domain.repositories.user_repository import UserRepository
-
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+from src.infrastructure.security.password_hasher import password_hasher
 
 
 class LoginUserUseCase:
@@ -22,7 +19,7 @@ class LoginUserUseCase:
             raise ValueError("Invalid credentials")
 
         # Verify password
-        if not pwd_context.verify(password, user.password_hash):
+        if not await password_hasher.verify(password, user.password_hash):
             raise ValueError("Invalid credentials")
 
         # Generate JWT token
@@ -43,6 +40,7 @@ class LoginUserUseCase:
         if not secret_key:
             raise ValueError("JWT_SECRET environment variable is not set")
 
+        from jose import jwt  # deferred to keep python-jose out of startup imports
         token = jwt.encode(token_data, secret_key, algorithm="HS256")
 
         return {
@@ -1,11 +1,8 @@
 import os
 from datetime import datetime, timedelta
-from passlib.context import CryptContext
-from jose import jwt
 from src.domain.entities.user import User
 from src.domain.repositories.user_repository import UserRepository
-
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+from src.infrastructure.security.password_hasher import password_hasher
 
 
 class RegisterUserUseCase:
@@ -23,17 +20,15 @@ class RegisterUserUseCase:
         if len(password) < 6:
             raise ValueError("Password must be at least 6 characters long")
 
-        # Check if user already exists
-        existing_user = await self.user_repository.find_by_username(username)
-        if existing_user:
-            raise ValueError("Username already exists")
-
         # Hash password
-        password_hash = pwd_context.hash(password)
+        password_hash = await password_hasher.hash(password)
 
         # Create user
         user = User.create(username, password_hash)
+        # The insert itself detects a taken username, so there is no separate lookup to race
         saved_user = await self.user_repository.create(user)
+        if not saved_user:
+            raise ValueError("Username already exists")
 
         # Generate JWT token (same as login)
         expires_in = os.getenv("JWT_EXPIRES_IN", "24h")
@@ -53,6 +48,7 @@ class RegisterUserUseCase:
         if not secret_key:
             raise ValueError("JWT_SECRET environment variable is not set")
 
+        from jose import jwt  # deferred to keep python-jose out of startup imports
         token = jwt.encode(token_data, secret_key, algorithm="HS256")
 
         return {
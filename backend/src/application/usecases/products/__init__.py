@@ -1,5 +1,25 @@
 from .create_product_usecase import CreateProductUseCase
+from .get_product_usecase import GetProductUseCase
 from .get_products_usecase import GetProductsUseCase
+from .get_low_stock_products_usecase import GetLowStockProductsUseCase
+from .update_product_usecase import UpdateProductUseCase
 from .update_product_quantity_usecase import UpdateProductQuantityUseCase
+from .bulk_import_products_usecase import BulkImportProductsUseCase
+from .export_products_usecase import ExportProductsUseCase
+from .search_products_usecase import SearchProductsUseCase
+from .lookup_products_usecase import LookupProductsUseCase
+from .get_stock_history_usecase import GetStockHistoryUseCase
 
-__all__ = ["CreateProductUseCase", "GetProductsUseCase", "UpdateProductQuantityUseCase"] 
\ No newline at end of file
+__all__ = [
+    "CreateProductUseCase",
+    "GetProductUseCase",
+    "GetProductsUseCase",
+    "GetLowStockProductsUseCase",
+    "UpdateProductUseCase",
+    "UpdateProductQuantityUseCase",
+    "BulkImportProductsUseCase",
+    "ExportProductsUseCase",
+    "SearchProductsUseCase",
+    "LookupProductsUseCase",
+    "GetStockHistoryUseCase",
+] 
\ No newline at end of file
@@ -0,0 +1,98 @@
+import time
+from decimal import Decimal
+from typing import AsyncIterator, Dict, Any, List, Optional, Tuple
+from src.domain.entities.product import Product
+from src.domain.repositories.product_repository import ProductRepository
+
+DEFAULT_BATCH_SIZE = 1000
+MAX_BATCH_SIZE = 5000
+MAX_REPORTED_ERRORS = 1000
+
+
+class BulkImportProductsUseCase:
+    def __init__(self, product_repository: ProductRepository):
+        self.product_repository = product_repository
+
+    async def execute(
+        self,
+        rows: AsyncIterator[Tuple[int, Optional[Dict[str, Any]], Optional[str]]],
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        user_id: Optional[int] = None
+    ) -> dict:
+        """Import (row number, product data, validation error) rows in bounded batches"""
+        if batch_size < 1 or batch_size > MAX_BATCH_SIZE:
+            raise ValueError(f"Batch size must be between 1 and {MAX_BATCH_SIZE}")
+
+        started = time.perf_counter()
+        stats = {"received": 0, "inserted": 0, "failed": 0, "batches": 0}
+        errors: List[dict] = []
+        batch: List[Tuple[int, Product]] = []
+
+        async for row_number, product_data, error in rows:
+            stats["received"] += 1
+            if error is not None:
+                self._record_error(stats, errors, row_number, product_data, error)
+                continue
+
+            batch.append((row_number, Product.create(
+                name=product_data["name"],
+                type=product_data["type"],
+                sku=product_data["sku"],
+                image_url=product_data.get("imageUrl"),
+                description=product_data.get("description"),
+                quantity=product_data["quantity"],
+                price=Decimal(str(product_data["price"])),
+                reorder_level=product_data.get("reorderLevel", 0)
+            )))
+            if len(batch) >= batch_size:
+                await self._flush(batch, stats, errors, user_id)
+                batch = []
+
+        if batch:
+            await self._flush(batch, stats, errors, user_id)
+
+        elapsed = time.perf_counter() - started
+        return {
+            **stats,
+            "errors": errors,
+            "errors_truncated": stats["failed"] > len(errors),
+            "duration_ms": round(elapsed * 1000, 1),
+            "rows_per_second": round(stats["received"] / elapsed, 1) if elapsed > 0 else None,
+        }
+
+    async def _flush(
+        self,
+        batch: List[Tuple[int, Product]],
+        stats: dict,
+        errors: List[dict],
+        user_id: Optional[int]
+    ) -> None:
+        inserted_skus = set(
+            await self.product_repository.create_many([product for _, product in batch], user_id)
+        )
+        stats["batches"] += 1
+        for row_number, product in batch:
+            if product.sku in inserted_skus:
+                stats["inserted"] += 1
+                # A SKU repeated within the batch is only inserted once
+                inserted_skus.discard(product.sku)
+            else:
+                self._record_error(
+                    stats, errors, row_number, {"sku": product.sku}, "Product with this SKU already exists"
+                )
+
+    @staticmethod
+    def _record_error(
+        stats: dict,
+        errors: List[dict],
+        row_number: int,
+        product_data: Optional[Dict[str, Any]],
+        error: str
+    ) -> None:
+        stats["failed"] += 1
+        if len(errors) < MAX_REPORTED_ERRORS:
+            errors.append({
+                "row": row_number,
+                "sku": product_data.get("sku") if product_data else None,
+                "error": error,
+            })
@@ -8,7 +8,7 @@ class CreateProductUseCase:
     def __init__(self, product_repository: ProductRepository):
         self.product_repository = product_repository
 
-    async def execute(self, product_data: Dict[str, Any]) -> dict:
+    async def execute(self, product_data: Dict[str, Any], user_id: Optional[int] = None) -> dict:
         name = product_data.get("name")
         type_ = product_data.get("type")
         sku = product_data.get("sku")
@@ -16,6 +16,7 @@ class CreateProductUseCase:
         description = product_data.get("description")
         quantity = product_data.get("quantity")
         price = product_data.get("price")
+        reorder_level = product_data.get("reorderLevel", 0)
 
         # Validate required fields
         if not all([name, type_, sku, quantity is not None, price is not None]):
@@ -28,14 +29,12 @@ class CreateProductUseCase:
         if not isinstance(price, (int, float, Decimal)) or price < 0:
             raise ValueError("Price must be a non-negative number")
 
+        if not isinstance(reorder_level, int) or reorder_level < 0:
+            raise ValueError("Reorder level must be a non-negative number")
+
         if len(sku) < 3:
             raise ValueError("SKU must be at least 3 characters long")
 
-        # Check if SKU already exists
-        existing_product = await self.product_repository.find_by_sku(sku)
-        if existing_product:
-            raise ValueError("Product with this SKU already exists")
-
         # Create product
         product = Product.create(
             name=name,
@@ -44,8 +43,12 @@ class CreateProductUseCase:
             image_url=image_url,
             description=description,
             quantity=quantity,
-            price=Decimal(str(price))
+            price=Decimal(str(price)),
+            reorder_level=reorder_level
         )
-        saved_product = await self.product_repository.create(product)
+        # The insert itself detects a taken SKU, so there is no separate lookup to race
+        saved_product = await self.product_repository.create(product, user_id)
+        if not saved_product:
+            raise ValueError("Product with this SKU already exists")
 
         return saved_product.to_dict() 
\ No newline at end of file
@@ -0,0 +1,65 @@
+import base64
+import json
+from datetime import datetime
+from decimal import Decimal
+from typing import Any, Tuple
+from src.domain.entities.product import Product
+from src.domain.repositories.product_repository import DEFAULT_PRODUCT_SORT
+
+
+def _encode(position: list) -> str:
+    payload = json.dumps(position, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def _decode(cursor: str) -> list:
+    padded = cursor + "=" * (-len(cursor) % 4)
+    return json.loads(base64.urlsafe_b64decode(padded.encode()))
+
+
+# How each sort's keyset value round-trips through JSON
+_SORT_VALUES = {
+    "created_at": (lambda value: value.isoformat(), datetime.fromisoformat),
+    "updated_at": (lambda value: value.isoformat(), datetime.fromisoformat),
+    "price": (str, Decimal),
+    "name": (str, str),
+}
+
+
+def _sort_attribute(sort: str) -> str:
+    return sort.lstrip("-")
+
+
+def encode_cursor(product: Product, sort: str = DEFAULT_PRODUCT_SORT) -> str:
+    """Encode the (sort value, id) keyset position of a product, tagged with its sort, as an opaque cursor"""
+    attribute = _sort_attribute(sort)
+    serialize, _ = _SORT_VALUES[attribute]
+    return _encode([sort, serialize(getattr(product, attribute)), product.id])
+
+
+def decode_cursor(cursor: str) -> Tuple[str, Tuple[Any, int]]:
+    """Decode an opaque cursor back into its sort and (sort value, id) keyset position"""
+    try:
+        position = _decode(cursor)
+        if len(position) == 2:
+            # Cursors issued before listings could be sorted
+            position = [DEFAULT_PRODUCT_SORT] + position
+        sort, value, id = position
+        _, parse = _SORT_VALUES[_sort_attribute(sort)]
+        return sort, (parse(value), int(id))
+    except (ValueError, TypeError, KeyError, ArithmeticError):
+        raise ValueError("Invalid cursor")
+
+
+def encode_low_stock_cursor(product: Product) -> str:
+    """Encode the (quantity - reorder_level, id) keyset position of a low-stock product"""
+    return _encode([product.quantity - product.reorder_level, product.id])
+
+
+def decode_low_stock_cursor(cursor: str) -> Tuple[int, int]:
+    """Decode a low-stock cursor back into its (quantity - reorder_level, id) keyset position"""
+    try:
+        shortfall, id = _decode(cursor)
+        return int(shortfall), int(id)
+    except (ValueError, TypeError):
+        raise ValueError("Invalid cursor")
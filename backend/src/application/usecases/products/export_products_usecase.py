@@ -0,0 +1,26 @@
+from typing import AsyncIterator, List
+from src.domain.entities.product import Product
+from src.domain.repositories.product_repository import ProductRepository
+
+DEFAULT_BATCH_SIZE = 1000
+MAX_BATCH_SIZE = 5000
+
+
+class ExportProductsUseCase:
+    def __init__(self, product_repository: ProductRepository):
+        self.product_repository = product_repository
+
+    async def execute(self, batch_size: int = DEFAULT_BATCH_SIZE) -> AsyncIterator[List[Product]]:
+        """Yield the whole catalog in keyset-ordered batches, holding one batch at a time"""
+        if batch_size < 1 or batch_size > MAX_BATCH_SIZE:
+            raise ValueError(f"Batch size must be between 1 and {MAX_BATCH_SIZE}")
+
+        products = await self.product_repository.find_all(limit=batch_size)
+        while products:
+            yield products
+            if len(products) < batch_size:
+                break
+            last = products[-1]
+            products = await self.product_repository.find_all(
+                limit=batch_size, after=(last.created_at, last.id)
+            )
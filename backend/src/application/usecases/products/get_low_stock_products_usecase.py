@@ -0,0 +1,25 @@
+from typing import Optional
+from src.domain.repositories.product_repository import ProductRepository
+from src.application.usecases.products.cursor import encode_low_stock_cursor, decode_low_stock_cursor
+
+
+class GetLowStockProductsUseCase:
+    def __init__(self, product_repository: ProductRepository):
+        self.product_repository = product_repository
+
+    async def execute(self, limit: int = 50, cursor: Optional[str] = None, type: Optional[str] = None) -> dict:
+        """Products at or below their reorder level, furthest below first"""
+        if limit < 1 or limit > 100:
+            raise ValueError("Limit must be between 1 and 100")
+
+        after = decode_low_stock_cursor(cursor) if cursor else None
+
+        # Fetch one extra row to know whether another page follows
+        products = await self.product_repository.find_low_stock(limit + 1, after, type)
+        has_more = len(products) > limit
+        products = products[:limit]
+
+        return {
+            "products": [product.to_dict() for product in products],
+            "next_cursor": encode_low_stock_cursor(products[-1]) if has_more else None,
+        }
@@ -0,0 +1,16 @@
+from src.domain.repositories.product_repository import ProductRepository
+
+
+class GetProductUseCase:
+    def __init__(self, product_repository: ProductRepository):
+        self.product_repository = product_repository
+
+    async def execute(self, product_id: int) -> dict:
+        if product_id < 1:
+            raise ValueError("Product ID must be a positive number")
+
+        product = await self.product_repository.find_by_id(product_id)
+        if not product:
+            raise ValueError("Product not found")
+
+        return product.to_dict()
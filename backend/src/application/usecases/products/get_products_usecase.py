@@ -1,17 +1,34 @@
-from typing import Dict, Any, List
-from src.domain.repositories.product_repository import ProductRepository
+from datetime import datetime, timezone
+from typing import Dict, Any, Optional, Tuple
+from src.domain.repositories.product_repository import (
+    ProductRepository,
+    PRODUCT_SORTS,
+    PRODUCT_FILTERS,
+    DEFAULT_PRODUCT_SORT,
+)
+from src.application.usecases.products.cursor import encode_cursor, decode_cursor
+
+TOTAL_MODES = ("exact", "estimate", "none")
+# Below this many rows an exact COUNT(*) of the whole catalog is cheap and more reliable
+# than planner statistics. Filtered totals are never counted by default: a filter without
+# an index would turn that COUNT into a sequential scan on every page
+EXACT_COUNT_THRESHOLD = 10000
 
 
 class GetProductsUseCase:
     def __init__(self, product_repository: ProductRepository):
         self.product_repository = product_repository
 
-    async def execute(self, options: Dict[str, Any] = None) -> List[dict]:
+    async def execute(self, options: Dict[str, Any] = None) -> dict:
         if options is None:
             options = {}
 
         page = options.get("page", 1)
         limit = options.get("limit", 10)
+        cursor = options.get("cursor")
+        total_mode = options.get("total", "estimate")
+        sort = options.get("sort") or DEFAULT_PRODUCT_SORT
+        filters = {name: options.get(name) for name in PRODUCT_FILTERS}
 
         # Validate pagination parameters
         if page < 1:
@@ -20,7 +37,65 @@ class GetProductsUseCase:
         if limit < 1 or limit > 100:
             raise ValueError("Limit must be between 1 and 100")
 
-        offset = (page - 1) * limit
-        products = await self.product_repository.find_all(limit=limit, offset=offset)
+        if total_mode not in TOTAL_MODES:
+            raise ValueError("Total must be one of: exact, estimate, none")
+
+        if sort not in PRODUCT_SORTS:
+            raise ValueError(f"Sort must be one of: {', '.join(PRODUCT_SORTS)}")
+
+        self._validate_range(filters, "min_price", "max_price")
+        self._validate_range(filters, "min_quantity", "max_quantity")
+
+        updated_since = filters["updated_since"]
+        if updated_since is not None and updated_since.tzinfo is not None:
+            # updated_at is stored naive from datetime.utcnow(); naive input is taken as UTC too
+            filters["updated_since"] = updated_since.astimezone(timezone.utc).replace(tzinfo=None)
+
+        filters = {name: value for name, value in filters.items() if value is not None}
+
+        # Fetch one extra row to know whether another page follows
+        page_options = {"limit": limit + 1, "filters": filters, "sort": sort}
+        if cursor:
+            cursor_sort, page_options["after"] = decode_cursor(cursor)
+            if cursor_sort != sort:
+                raise ValueError("Cursor was issued for a different sort")
+        else:
+            page_options["offset"] = (page - 1) * limit
+
+        total = None
+        if total_mode == "exact":
+            products, total = await self.product_repository.find_all_with_total(**page_options)
+            if total is None:
+                # Past the last page there is no row to carry the count
+                total = await self.product_repository.count(filters)
+        else:
+            products = await self.product_repository.find_all(**page_options)
+            if total_mode == "estimate":
+                total, total_mode = await self._estimated_total(filters)
+
+        has_more = len(products) > limit
+        products = products[:limit]
+
+        # Native values: the response schema converts price and timestamps while encoding the page
+        return {
+            "products": [product.to_native_dict() for product in products],
+            "next_cursor": encode_cursor(products[-1], sort) if has_more else None,
+            "total": total,
+            "total_mode": total_mode,
+        }
+
+    async def version(self) -> Tuple[int, datetime]:
+        """Catalog version and change time; read before the page so it can only be older than the rows"""
+        return await self.product_repository.catalog_version()
+
+    @staticmethod
+    def _validate_range(filters: Dict[str, Any], low: str, high: str) -> None:
+        if filters[low] is not None and filters[high] is not None and filters[low] > filters[high]:
+            raise ValueError(f"{low} must not be greater than {high}")
 
-        return [product.to_dict() for product in products] 
\ No newline at end of file
+    async def _estimated_total(self, filters: Optional[Dict[str, Any]] = None) -> Tuple[int, str]:
+        """Planner estimate; the unfiltered total is counted exactly when small or never analyzed"""
+        estimate = await self.product_repository.estimate_count(filters)
+        if not filters and (estimate is None or estimate < EXACT_COUNT_THRESHOLD):
+            return await self.product_repository.count(filters), "exact"
+        return estimate, "estimate"
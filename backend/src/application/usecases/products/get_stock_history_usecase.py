@@ -0,0 +1,38 @@
+from datetime import datetime, timezone
+from typing import Optional
+from src.domain.repositories.product_repository import ProductRepository
+
+MAX_MOVEMENTS_LIMIT = 500
+
+
+class GetStockHistoryUseCase:
+    """Reads a product's stock movement ledger; deleted products keep their history"""
+
+    def __init__(self, product_repository: ProductRepository):
+        self.product_repository = product_repository
+
+    async def movements(self, product_id: int, limit: int = 50, before_id: Optional[int] = None) -> dict:
+        if product_id < 1:
+            raise ValueError("Product ID must be a positive number")
+
+        if limit < 1 or limit > MAX_MOVEMENTS_LIMIT:
+            raise ValueError(f"Limit must be between 1 and {MAX_MOVEMENTS_LIMIT}")
+
+        movements = await self.product_repository.find_stock_movements(product_id, limit, before_id)
+
+        return {
+            "movements": [movement.to_dict() for movement in movements],
+            # Pass back as before_id for the next (older) page
+            "next_before_id": movements[-1].id if len(movements) == limit else None,
+        }
+
+    async def quantity_as_of(self, product_id: int, at: datetime) -> dict:
+        if product_id < 1:
+            raise ValueError("Product ID must be a positive number")
+
+        if at.tzinfo is None:
+            at = at.replace(tzinfo=timezone.utc)
+
+        quantity = await self.product_repository.quantity_as_of(product_id, at)
+
+        return {"product_id": product_id, "at": at.isoformat(), "quantity": quantity}
@@ -0,0 +1,36 @@
+from typing import Dict, List, Optional
+from src.domain.entities.product import Product
+from src.domain.repositories.product_repository import ProductRepository
+
+MAX_LOOKUP_KEYS = 5000
+
+
+class LookupProductsUseCase:
+    def __init__(self, product_repository: ProductRepository):
+        self.product_repository = product_repository
+
+    async def execute(self, ids: Optional[List[int]] = None, skus: Optional[List[str]] = None) -> dict:
+        # Duplicate keys are looked up and returned once, at their first position
+        ids = list(dict.fromkeys(ids or []))
+        skus = list(dict.fromkeys(skus or []))
+
+        # Validate input
+        if not ids and not skus:
+            raise ValueError("At least one id or SKU is required")
+
+        if len(ids) + len(skus) > MAX_LOOKUP_KEYS:
+            raise ValueError(f"At most {MAX_LOOKUP_KEYS} ids and SKUs can be looked up at once")
+
+        products = await self.product_repository.find_many(ids, skus)
+
+        by_id: Dict[int, Product] = {product.id: product for product in products}
+        by_sku: Dict[str, Product] = {product.sku: product for product in products}
+
+        # Request order: ids first, then SKUs, each as given
+        ordered = [by_id[id] for id in ids if id in by_id]
+        ordered += [by_sku[sku] for sku in skus if sku in by_sku]
+        return {
+            "products": [product.to_dict() for product in ordered],
+            "not_found_ids": [id for id in ids if id not in by_id],
+            "not_found_skus": [sku for sku in skus if sku not in by_sku],
+        }
@@ -0,0 +1,33 @@
+from datetime import datetime
+from typing import Dict, Any, Tuple
+from src.domain.repositories.product_repository import ProductRepository
+
+MIN_QUERY_LENGTH = 2
+MAX_QUERY_LENGTH = 100
+
+
+class SearchProductsUseCase:
+    def __init__(self, product_repository: ProductRepository):
+        self.product_repository = product_repository
+
+    async def execute(self, options: Dict[str, Any]) -> dict:
+        term = (options.get("q") or "").strip()
+        limit = options.get("limit", 20)
+
+        # Validate search parameters
+        if len(term) < MIN_QUERY_LENGTH:
+            raise ValueError(f"Search query must be at least {MIN_QUERY_LENGTH} characters long")
+
+        if len(term) > MAX_QUERY_LENGTH:
+            raise ValueError(f"Search query must be at most {MAX_QUERY_LENGTH} characters long")
+
+        if limit < 1 or limit > 100:
+            raise ValueError("Limit must be between 1 and 100")
+
+        products = await self.product_repository.search(term, limit)
+
+        return {"products": [product.to_native_dict() for product in products]}
+
+    async def version(self) -> Tuple[int, datetime]:
+        """Catalog version and change time; read before searching so it can only be older than the rows"""
+        return await self.product_repository.catalog_version()
@@ -1,11 +1,32 @@
+from typing import Dict, Any, List, Optional, Tuple
+from src.domain.entities.stock_movement import StockMovement
 from src.domain.repositories.product_repository import ProductRepository
 
+MAX_BATCH_ITEMS = 5000
+MAX_REASON_LENGTH = 100
+
+
+def _movement_reason(reason: Optional[str], default: str) -> str:
+    """Caller-supplied ledger reason, or the operation's default"""
+    if reason is None:
+        return default
+    reason = reason.strip()
+    if not reason or len(reason) > MAX_REASON_LENGTH:
+        raise ValueError(f"Reason must be between 1 and {MAX_REASON_LENGTH} characters")
+    return reason
+
 
 class UpdateProductQuantityUseCase:
     def __init__(self, product_repository: ProductRepository):
         self.product_repository = product_repository
 
-    async def execute(self, id: int, quantity: int) -> dict:
+    async def execute(
+        self,
+        id: int,
+        quantity: int,
+        reason: Optional[str] = None,
+        user_id: Optional[int] = None
+    ) -> dict:
         # Validate input
         if not id:
             raise ValueError("Product ID is required")
@@ -13,13 +34,97 @@ class UpdateProductQuantityUseCase:
         if not isinstance(quantity, int) or quantity < 0:
             raise ValueError("Quantity must be a non-negative number")
 
-        # Find product
+        # Set the quantity and append the ledger entry in one statement
+        updated_product = await self.product_repository.set_quantity(
+            id, quantity, _movement_reason(reason, StockMovement.SET), user_id
+        )
+        if not updated_product:
+            raise ValueError("Product not found")
+
+        return updated_product.to_dict()
+
+    async def adjust(
+        self,
+        id: int,
+        delta: int,
+        reason: Optional[str] = None,
+        user_id: Optional[int] = None
+    ) -> dict:
+        # Validate input
+        if not id:
+            raise ValueError("Product ID is required")
+
+        if not isinstance(delta, int) or delta == 0:
+            raise ValueError("Delta must be a non-zero number")
+
+        # Apply the change in a single conditional UPDATE
+        adjusted_product = await self.product_repository.adjust_quantity(
+            id, delta, _movement_reason(reason, StockMovement.ADJUSTED), user_id
+        )
+        if adjusted_product:
+            return adjusted_product.to_dict()
+
+        # Only on failure: work out whether the product is missing or short on stock
         product = await self.product_repository.find_by_id(id)
         if not product:
             raise ValueError("Product not found")
+        raise ValueError(
+            f"Insufficient stock: cannot adjust quantity {product.quantity} by {delta}"
+        )
+
+    async def set_reorder_level(self, id: int, reorder_level: int) -> dict:
+        # Validate input
+        if not id:
+            raise ValueError("Product ID is required")
+
+        if not isinstance(reorder_level, int) or reorder_level < 0:
+            raise ValueError("Reorder level must be a non-negative number")
+
+        updated_product = await self.product_repository.set_reorder_level(id, reorder_level)
+        if not updated_product:
+            raise ValueError("Product not found")
+
+        return updated_product.to_dict()
+
+    async def execute_batch(
+        self,
+        items: List[Dict[str, Any]],
+        reason: Optional[str] = None,
+        user_id: Optional[int] = None
+    ) -> dict:
+        # Validate input
+        if not items:
+            raise ValueError("At least one item is required")
+
+        reason = _movement_reason(reason, StockMovement.SET)
+
+        if len(items) > MAX_BATCH_ITEMS:
+            raise ValueError(f"At most {MAX_BATCH_ITEMS} items can be updated at once")
+
+        requested: List[Tuple[Optional[int], Optional[str], int]] = []
+        for item in items:
+            id = item.get("id")
+            sku = item.get("sku")
+            quantity = item.get("quantity")
+
+            if (id is None) == (sku is None):
+                raise ValueError("Each item must have either an id or a SKU")
+
+            if not isinstance(quantity, int) or quantity < 0:
+                raise ValueError("Quantity must be a non-negative number")
+
+            requested.append((id, sku, quantity))
 
-        # Update quantity
-        product.update_quantity(quantity)
-        updated_product = await self.product_repository.update(product)
+        # Apply all changes in a single statement; items keep their order so the last one
+        # naming a product wins
+        updated_products = await self.product_repository.update_quantities(requested, reason, user_id)
 
-        return updated_product.to_dict() 
\ No newline at end of file
+        updated_ids = {product.id for product in updated_products}
+        updated_skus = {product.sku for product in updated_products}
+        requested_ids = dict.fromkeys(id for id, _, _ in requested if id is not None)
+        requested_skus = dict.fromkeys(sku for _, sku, _ in requested if sku is not None)
+        return {
+            "products": [product.to_dict() for product in updated_products],
+            "not_found_ids": [id for id in requested_ids if id not in updated_ids],
+            "not_found_skus": [sku for sku in requested_skus if sku not in updated_skus],
+        }
@@ -0,0 +1,70 @@
+from decimal import Decimal
+from typing import Dict, Any, Optional
+from src.domain.entities.product import Product
+from src.domain.repositories.product_repository import ProductRepository
+
+
+class UpdateProductUseCase:
+    def __init__(self, product_repository: ProductRepository):
+        self.product_repository = product_repository
+
+    async def execute(
+        self,
+        id: int,
+        product_data: Dict[str, Any],
+        expected_version: Optional[int] = None
+    ) -> dict:
+        name = product_data.get("name")
+        type_ = product_data.get("type")
+        sku = product_data.get("sku")
+        price = product_data.get("price")
+        # Omitted (None) keeps the stored reorder level
+        reorder_level = product_data.get("reorderLevel")
+
+        # Validate input
+        if not id:
+            raise ValueError("Product ID is required")
+
+        if not all([name, type_, sku, price is not None]):
+            raise ValueError("Name, type, SKU, and price are required")
+
+        if not isinstance(price, (int, float, Decimal)) or price < 0:
+            raise ValueError("Price must be a non-negative number")
+
+        if reorder_level is not None and (not isinstance(reorder_level, int) or reorder_level < 0):
+            raise ValueError("Reorder level must be a non-negative number")
+
+        if len(sku) < 3:
+            raise ValueError("SKU must be at least 3 characters long")
+
+        # Quantity is not part of a details update; it only changes through the stock ledger
+        product = Product(
+            id=id,
+            name=name,
+            type=type_,
+            sku=sku,
+            image_url=product_data.get("imageUrl"),
+            description=product_data.get("description"),
+            quantity=None,
+            price=Decimal(str(price)),
+            reorder_level=reorder_level
+        )
+
+        # One conditional UPDATE; no read unless it matched nothing
+        updated_product = await self.product_repository.update(product, expected_version)
+        if updated_product:
+            return updated_product.to_dict()
+
+        # Only on failure: work out whether the product is missing, was changed by someone
+        # else, or would take another product's SKU
+        current = await self.product_repository.find_by_id(id)
+        if not current:
+            raise ValueError("Product not found")
+        if expected_version is not None and current.version != expected_version:
+            raise ValueError(f"Product has been modified since version {expected_version}")
+        if current.sku != sku:
+            owner = await self.product_repository.find_by_sku(sku)
+            if owner and owner.id != id:
+                raise ValueError("Product with this SKU already exists")
+        # The row or the SKU's owner changed between the UPDATE and these reads
+        raise ValueError("Product has been modified concurrently")
@@ -1,4 +1,5 @@
 from .user import User
 from .product import Product
+from .stock_movement import StockMovement
 
-__all__ = ["User", "Product"] 
\ No newline at end of file
+__all__ = ["User", "Product", "StockMovement"]
@@ -4,6 +4,12 @@ from decimal import Decimal
 
 
 class Product:
+    # Slots instead of a per-instance __dict__: listings build many short-lived entities
+    __slots__ = (
+        "id", "name", "type", "sku", "image_url", "description",
+        "quantity", "price", "created_at", "updated_at", "reorder_level", "version",
+    )
+
     def __init__(
         self,
         id: Optional[int],
@@ -15,7 +21,9 @@ class Product:
         quantity: int,
         price: Decimal,
         created_at: Optional[datetime] = None,
-        updated_at: Optional[datetime] = None
+        updated_at: Optional[datetime] = None,
+        reorder_level: int = 0,
+        version: int = 1
     ):
         self.id = id
         self.name = name
@@ -25,8 +33,16 @@ class Product:
         self.description = description
         self.quantity = quantity
         self.price = price
-        self.created_at = created_at or datetime.now()
-        self.updated_at = updated_at or datetime.now()
+        if created_at is None or updated_at is None:
+            now = datetime.utcnow()
+            created_at = created_at or now
+            updated_at = updated_at or now
+        self.created_at = created_at
+        self.updated_at = updated_at
+        # Stock at or below this level is due for reordering
+        self.reorder_level = reorder_level
+        # Incremented by every write; conditional updates compare it to detect lost updates
+        self.version = version
 
     @classmethod
     def create(
@@ -37,9 +53,11 @@ class Product:
         image_url: Optional[str],
         description: Optional[str],
         quantity: int,
-        price: Decimal
+        price: Decimal,
+        reorder_level: int = 0
     ) -> 'Product':
         """Create a new Product instance"""
+        now = datetime.utcnow()
         return cls(
             id=None,
             name=name,
@@ -49,8 +67,9 @@ class Product:
             description=description,
             quantity=quantity,
             price=price,
-            created_at=datetime.now(),
-            updated_at=datetime.now()
+            created_at=now,
+            updated_at=now,
+            reorder_level=reorder_level
         )
 
     def update_quantity(self, new_quantity: int) -> None:
@@ -58,7 +77,7 @@ class Product:
         if new_quantity < 0:
             raise ValueError("Quantity cannot be negative")
         self.quantity = new_quantity
-        self.updated_at = datetime.now()
+        self.updated_at = datetime.utcnow()
 
     def to_dict(self) -> dict:
         """Convert Product to dictionary for JSON serialization"""
@@ -73,4 +92,27 @@ class Product:
             "price": float(self.price),
             "created_at": self.created_at.isoformat() if self.created_at else None,
             "updated_at": self.updated_at.isoformat() if self.updated_at else None,
+            "reorder_level": self.reorder_level,
+            "version": self.version,
+        }
+
+    def to_native_dict(self) -> dict:
+        """Convert Product to a dictionary of native values (Decimal price, datetime timestamps)
+
+        For encoders that convert these themselves: float() and isoformat() dominate the cost
+        of to_dict() on a page of products.
+        """
+        return {
+            "id": self.id,
+            "name": self.name,
+            "type": self.type,
+            "sku": self.sku,
+            "image_url": self.image_url,
+            "description": self.description,
+            "quantity": self.quantity,
+            "price": self.price,
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
+            "reorder_level": self.reorder_level,
+            "version": self.version,
         } 
\ No newline at end of file
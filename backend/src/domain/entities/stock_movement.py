@@ -0,0 +1,45 @@
+from datetime import datetime
+from typing import Optional
+
+
+class StockMovement:
+    """One append-only change to a product's quantity and the balance it left behind"""
+
+    __slots__ = ("id", "product_id", "delta", "quantity_after", "reason", "user_id", "created_at")
+
+    # Reasons recorded when the caller does not give one
+    CREATED = "created"
+    IMPORTED = "imported"
+    SET = "set"
+    ADJUSTED = "adjusted"
+    OPENING_BALANCE = "opening balance"
+
+    def __init__(
+        self,
+        id: Optional[int],
+        product_id: int,
+        delta: int,
+        quantity_after: int,
+        reason: str,
+        user_id: Optional[int],
+        created_at: datetime
+    ):
+        self.id = id
+        self.product_id = product_id
+        self.delta = delta
+        self.quantity_after = quantity_after
+        self.reason = reason
+        self.user_id = user_id
+        self.created_at = created_at
+
+    def to_dict(self) -> dict:
+        """Convert StockMovement to dictionary for JSON serialization"""
+        return {
+            "id": self.id,
+            "product_id": self.product_id,
+            "delta": self.delta,
+            "quantity_after": self.quantity_after,
+            "reason": self.reason,
+            "user_id": self.user_id,
+            "created_at": self.created_at.isoformat() if self.created_at else None,
+        }
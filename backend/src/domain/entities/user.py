@@ -3,6 +3,8 @@ from typing import Optional
 
 
 class User:
+    __slots__ = ("id", "username", "password_hash", "created_at", "updated_at")
+
     def __init__(
         self,
         id: Optional[int],
@@ -14,18 +16,23 @@ class User:
         self.id = id
         self.username = username
         self.password_hash = password_hash
-        self.created_at = created_at or datetime.now()
-        self.updated_at = updated_at or datetime.now()
+        if created_at is None or updated_at is None:
+            now = datetime.utcnow()
+            created_at = created_at or now
+            updated_at = updated_at or now
+        self.created_at = created_at
+        self.updated_at = updated_at
 
     @classmethod
     def create(cls, username: str, password_hash: str) -> 'User':
         """Create a new User instance"""
+        now = datetime.utcnow()
         return cls(
             id=None,
             username=username,
             password_hash=password_hash,
-            created_at=datetime.now(),
-            updated_at=datetime.now()
+            created_at=now,
+            updated_at=now
         )
 
     def to_dict(self) -> dict:
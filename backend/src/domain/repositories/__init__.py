@@ -1,4 +1,4 @@
 from .user_repository import UserRepository
-from .product_repository import ProductRepository
+from .product_repository import ProductRepository, PRODUCT_SORTS, PRODUCT_FILTERS, DEFAULT_PRODUCT_SORT
 
-__all__ = ["UserRepository", "ProductRepository"] 
\ No newline at end of file
+__all__ = ["UserRepository", "ProductRepository", "PRODUCT_SORTS", "PRODUCT_FILTERS", "DEFAULT_PRODUCT_SORT"] 
\ No newline at end of file
@@ -1,6 +1,18 @@
 from abc import ABC, abstractmethod
-from typing import Optional, List
+from datetime import datetime
+from typing import Any, Optional, List, Tuple, Dict
 from src.domain.entities.product import Product
+from src.domain.entities.stock_movement import StockMovement
+
+
+# Orderings a product listing may request; a leading "-" means descending. Every sort
+# breaks ties on id, so (sort value, id) is a unique keyset position
+PRODUCT_SORTS = ("-created_at", "created_at", "-updated_at", "price", "-price", "name")
+DEFAULT_PRODUCT_SORT = "-created_at"
+
+# Listing filters: type (exact match), min_price/max_price, min_quantity/max_quantity
+# (inclusive) and updated_since; None values are ignored
+PRODUCT_FILTERS = ("type", "min_price", "max_price", "min_quantity", "max_quantity", "updated_since")
 
 
 class ProductRepository(ABC):
@@ -17,18 +29,103 @@ class ProductRepository(ABC):
         pass
 
     @abstractmethod
-    async def find_all(self, limit: int = 10, offset: int = 0) -> List[Product]:
-        """Find all products with pagination"""
+    async def find_many(self, ids: List[int], skus: List[str]) -> List[Product]:
+        """Find every product whose ID is in ids or whose SKU is in skus in one query, in no particular order"""
+        pass
+
+    @abstractmethod
+    async def find_all(
+        self,
+        limit: int = 10,
+        offset: int = 0,
+        after: Optional[Tuple[Any, int]] = None,
+        filters: Optional[Dict[str, Any]] = None,
+        sort: str = DEFAULT_PRODUCT_SORT
+    ) -> List[Product]:
+        """Find products matching filters in sort order, paginated by offset or by a (sort value, id) keyset"""
+        pass
+
+    @abstractmethod
+    async def find_all_with_total(
+        self,
+        limit: int = 10,
+        offset: int = 0,
+        after: Optional[Tuple[Any, int]] = None,
+        filters: Optional[Dict[str, Any]] = None,
+        sort: str = DEFAULT_PRODUCT_SORT
+    ) -> Tuple[List[Product], Optional[int]]:
+        """Same page as find_all plus the exact count of matching products from the same query (None if the page is empty)"""
+        pass
+
+    @abstractmethod
+    async def search(self, term: str, limit: int = 20) -> List[Product]:
+        """Find products by ranked full-text and fuzzy matching on name, description and SKU"""
+        pass
+
+    @abstractmethod
+    async def create(self, product: Product, user_id: Optional[int] = None) -> Optional[Product]:
+        """Create a new product, recording its initial quantity as a stock movement; None if the SKU already exists"""
+        pass
+
+    @abstractmethod
+    async def create_many(self, products: List[Product], user_id: Optional[int] = None) -> List[str]:
+        """Insert products and their initial stock movements in one statement, skipping existing SKUs; returns the SKUs inserted"""
+        pass
+
+    @abstractmethod
+    async def update(self, product: Product, expected_version: Optional[int] = None) -> Optional[Product]:
+        """Update a product's details (not its quantity or, when None, its reorder level) and bump its version; None if it is missing, its version is not expected_version, or the SKU belongs to another product"""
+        pass
+
+    @abstractmethod
+    async def set_quantity(
+        self,
+        id: int,
+        quantity: int,
+        reason: str = StockMovement.SET,
+        user_id: Optional[int] = None
+    ) -> Optional[Product]:
+        """Set a product's quantity and record the movement; returns None if the product is missing"""
+        pass
+
+    @abstractmethod
+    async def update_quantities(
+        self,
+        items: List[Tuple[Optional[int], Optional[str], int]],
+        reason: str = StockMovement.SET,
+        user_id: Optional[int] = None
+    ) -> List[Product]:
+        """Set many product quantities and record their movements in one statement
+
+        items are (id, sku, quantity) in request order, each naming a product by id or by SKU;
+        if a product is named more than once the last item wins. Returns the products updated.
+        """
         pass
 
     @abstractmethod
-    async def create(self, product: Product) -> Product:
-        """Create a new product"""
+    async def adjust_quantity(
+        self,
+        id: int,
+        delta: int,
+        reason: str = StockMovement.ADJUSTED,
+        user_id: Optional[int] = None
+    ) -> Optional[Product]:
+        """Atomically add delta to a product's quantity and record the movement; returns None if missing or it would go negative"""
         pass
 
     @abstractmethod
-    async def update(self, product: Product) -> Product:
-        """Update an existing product"""
+    async def set_reorder_level(self, id: int, reorder_level: int) -> Optional[Product]:
+        """Set the quantity at or below which a product counts as low on stock; None if missing"""
+        pass
+
+    @abstractmethod
+    async def find_low_stock(
+        self,
+        limit: int = 50,
+        after: Optional[Tuple[int, int]] = None,
+        type: Optional[str] = None
+    ) -> List[Product]:
+        """Products with quantity <= reorder_level ordered by (quantity - reorder_level, id), optionally of one type"""
         pass
 
     @abstractmethod
@@ -37,6 +134,31 @@ class ProductRepository(ABC):
         pass
 
     @abstractmethod
-    async def count(self) -> int:
-        """Count total number of products"""
-        pass 
\ No newline at end of file
+    async def find_stock_movements(
+        self,
+        product_id: int,
+        limit: int = 50,
+        before_id: Optional[int] = None
+    ) -> List[StockMovement]:
+        """A product's stock movements newest first, optionally only those older than before_id"""
+        pass
+
+    @abstractmethod
+    async def quantity_as_of(self, product_id: int, at: datetime) -> Optional[int]:
+        """A product's quantity at a point in time (None if the ledger has no movement by then)"""
+        pass
+
+    @abstractmethod
+    async def count(self, filters: Optional[Dict[str, Any]] = None) -> int:
+        """Count products, optionally only those matching filters"""
+        pass
+
+    @abstractmethod
+    async def estimate_count(self, filters: Optional[Dict[str, Any]] = None) -> Optional[int]:
+        """Cheap approximate number of (matching) products from planner statistics (None if unknown)"""
+        pass
+
+    @abstractmethod
+    async def catalog_version(self) -> Tuple[int, datetime]:
+        """Version counter bumped by every write to products, and when it last changed"""
+        pass
@@ -17,8 +17,8 @@ class UserRepository(ABC):
         pass
 
     @abstractmethod
-    async def create(self, user: User) -> User:
-        """Create a new user"""
+    async def create(self, user: User) -> Optional[User]:
+        """Create a new user; None if the username is already taken"""
         pass
 
     @abstractmethod
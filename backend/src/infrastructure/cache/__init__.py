@@ -0,0 +1,15 @@
+from .ttl_cache import TTLCache
+from .user_cache import user_cache
+from .product_cache import ProductCache, product_cache
+from .single_flight import SingleFlight
+from .page_cache import page_cache, page_flight
+
+__all__ = [
+    "TTLCache",
+    "user_cache",
+    "ProductCache",
+    "product_cache",
+    "SingleFlight",
+    "page_cache",
+    "page_flight",
+]
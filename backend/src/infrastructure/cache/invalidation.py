@@ -0,0 +1,127 @@
+import asyncio
+import logging
+import os
+from typing import Dict, Optional
+
+import asyncpg
+from sqlalchemy.engine import make_url
+
+from src.infrastructure.cache.product_cache import product_cache
+from src.infrastructure.cache.user_cache import user_cache
+from src.infrastructure.database.connection import DATABASE_URL
+
+logger = logging.getLogger(__name__)
+
+# Fed by the notify_cache_invalidation() triggers on products and users
+CACHE_INVALIDATION_CHANNEL = "cache_invalidation"
+
+
+class CacheInvalidationListener:
+    """Evicts cached rows in this worker when any process changes them in the database
+
+    Keeps one dedicated connection LISTENing for "<table>:<id>,<id>" / "<table>:*"
+    payloads. Notifications are lost while disconnected, so every (re)connect clears
+    the caches it serves before trusting them again.
+    """
+
+    def __init__(
+        self,
+        dsn: str,
+        caches: Dict[str, object],
+        keepalive_seconds: float = 30,
+        reconnect_delay_seconds: float = 1
+    ):
+        self.dsn = dsn
+        self.caches = caches
+        self.keepalive_seconds = keepalive_seconds
+        self.reconnect_delay_seconds = reconnect_delay_seconds
+        self._task: Optional[asyncio.Task] = None
+        self.connected = False
+        self.connects = 0
+        self.notifications = 0
+        self.invalidated_keys = 0
+        self.full_clears = 0
+
+    async def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self._listen()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning("Cache invalidation listener disconnected: %s", e)
+            await asyncio.sleep(self.reconnect_delay_seconds)
+
+    async def _listen(self) -> None:
+        connection = await asyncpg.connect(self.dsn)
+        lost = asyncio.Event()
+        connection.add_termination_listener(lambda _: lost.set())
+        try:
+            await connection.add_listener(CACHE_INVALIDATION_CHANNEL, self._on_notification)
+            self._clear_all()
+            self.connects += 1
+            self.connected = True
+
+            # A silently dropped TCP connection never fires the termination listener;
+            # an idle round-trip every keepalive_seconds surfaces it
+            while not lost.is_set():
+                try:
+                    await asyncio.wait_for(lost.wait(), self.keepalive_seconds)
+                except asyncio.TimeoutError:
+                    await connection.fetchval("SELECT 1", timeout=self.keepalive_seconds)
+        finally:
+            self.connected = False
+            connection.terminate()
+
+    def _on_notification(self, connection, pid, channel, payload: str) -> None:
+        self.notifications += 1
+        table, _, ids = payload.partition(":")
+        cache = self.caches.get(table)
+        if cache is None:
+            return
+        if ids == "*":
+            self.full_clears += 1
+            cache.clear()
+            return
+        for id in ids.split(","):
+            self.invalidated_keys += 1
+            cache.invalidate(int(id))
+
+    def _clear_all(self) -> None:
+        self.full_clears += 1
+        for cache in self.caches.values():
+            cache.clear()
+
+    def stats(self) -> dict:
+        """Counters for monitoring"""
+        return {
+            "connected": self.connected,
+            "connects": self.connects,
+            "notifications": self.notifications,
+            "invalidated_keys": self.invalidated_keys,
+            "full_clears": self.full_clears,
+        }
+
+
+# Each worker process has its own caches, so each runs its own listener
+# (CACHE_INVALIDATION_ENABLED=false turns it off, e.g. for a single-worker deployment)
+CACHE_INVALIDATION_ENABLED = os.getenv("CACHE_INVALIDATION_ENABLED", "true").lower() == "true"
+
+cache_invalidation_listener = CacheInvalidationListener(
+    dsn=make_url(DATABASE_URL).set(drivername="postgresql").render_as_string(hide_password=False),
+    caches={"products": product_cache, "users": user_cache},
+    keepalive_seconds=float(os.getenv("CACHE_INVALIDATION_KEEPALIVE_SECONDS", "30"))
+)
@@ -0,0 +1,14 @@
+import os
+from src.infrastructure.cache.single_flight import SingleFlight
+from src.infrastructure.cache.ttl_cache import TTLCache
+
+# Serialized list and search responses. Keys start with the catalog version, which every
+# write to products bumps in its own transaction, so a write retires all older pages at
+# once; the LRU bound and PAGE_CACHE_TTL_SECONDS only limit memory (0 disables the cache)
+page_cache = TTLCache(
+    max_size=int(os.getenv("PAGE_CACHE_MAX_SIZE", "256")),
+    ttl_seconds=float(os.getenv("PAGE_CACHE_TTL_SECONDS", "60"))
+)
+
+# Identical list/search queries in flight in this worker share one database fetch
+page_flight = SingleFlight()
@@ -0,0 +1,131 @@
+import copy
+import os
+import sys
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Optional
+from src.domain.entities.product import Product
+
+
+def _estimate_size(product: Product) -> int:
+    """Approximate bytes held by a cached product and its field values"""
+    return sys.getsizeof(product) + sum(
+        sys.getsizeof(getattr(product, name)) for name in Product.__slots__
+    )
+
+
+class ProductCache:
+    """Bounded LRU of Product entities addressable by both id and SKU, with a time-to-live"""
+
+    def __init__(
+        self,
+        max_size: int,
+        ttl_seconds: float,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries: "OrderedDict[int, tuple]" = OrderedDict()
+        self._ids_by_sku: Dict[str, int] = {}
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        # Bumped by every invalidation, so a fill that raced one can be dropped
+        self.generation = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_size > 0 and self.ttl_seconds > 0
+
+    def get_by_id(self, id: int) -> Optional[Product]:
+        entry = self._entries.get(id)
+        if entry is None or entry[0] <= self._clock():
+            if entry is not None:
+                self._remove(id)
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(id)
+        self.hits += 1
+        # Callers may mutate entities, so never hand out the cached instance
+        return copy.copy(entry[1])
+
+    def get_by_sku(self, sku: str) -> Optional[Product]:
+        id = self._ids_by_sku.get(sku)
+        if id is None:
+            self.misses += 1
+            return None
+        return self.get_by_id(id)
+
+    def set(self, product: Product, generation: Optional[int] = None) -> None:
+        """Cache product; pass the generation read before loading it to skip fills that raced an invalidation"""
+        if not self.enabled or product.id is None:
+            return
+        if generation is not None and generation != self.generation:
+            # Raced an invalidation: drop any older copy too, since it cannot be trusted either
+            self._remove(product.id)
+            return
+
+        self._remove(product.id)
+        cached = copy.copy(product)
+        size = _estimate_size(cached)
+        self._entries[product.id] = (self._clock() + self.ttl_seconds, cached, size)
+        self._ids_by_sku[product.sku] = product.id
+        self._bytes += size
+        while len(self._entries) > self.max_size:
+            self._remove(next(iter(self._entries)))
+            self.evictions += 1
+
+    def invalidate(self, id: int) -> None:
+        self.generation += 1
+        if self._remove(id):
+            self.invalidations += 1
+
+    def invalidate_sku(self, sku: str) -> None:
+        id = self._ids_by_sku.get(sku)
+        if id is not None:
+            self.invalidate(id)
+
+    def clear(self) -> None:
+        self.generation += 1
+        self.invalidations += len(self._entries)
+        self._entries.clear()
+        self._ids_by_sku.clear()
+        self._bytes = 0
+
+    def _remove(self, id: int) -> bool:
+        entry = self._entries.pop(id, None)
+        if entry is None:
+            return False
+        product = entry[1]
+        if self._ids_by_sku.get(product.sku) == id:
+            del self._ids_by_sku[product.sku]
+        self._bytes -= entry[2]
+        return True
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> dict:
+        """Counters for monitoring"""
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else None,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+            "memory_bytes": self._bytes,
+        }
+
+
+product_cache = ProductCache(
+    max_size=int(os.getenv("PRODUCT_CACHE_MAX_SIZE", "10000")),
+    ttl_seconds=float(os.getenv("PRODUCT_CACHE_TTL_SECONDS", "60"))
+)
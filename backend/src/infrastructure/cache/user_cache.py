@@ -0,0 +1,9 @@
+import os
+from src.infrastructure.cache.ttl_cache import TTLCache
+
+# Authenticated users keyed by id; USER_CACHE_TTL_SECONDS bounds how stale an entry can be
+# (0 disables the cache)
+user_cache = TTLCache(
+    max_size=int(os.getenv("USER_CACHE_MAX_SIZE", "1024")),
+    ttl_seconds=float(os.getenv("USER_CACHE_TTL_SECONDS", "30"))
+)
@@ -1,9 +1,8 @@
 import os
-from databases import Database
-from sqlalchemy import create_engine, MetaData
-from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.engine import make_url
 from dotenv import load_dotenv
+from src.infrastructure.database.database import Database
+from src.infrastructure.database.replica import ReplicaRouter
 
 load_dotenv()
 
@@ -12,31 +11,55 @@ DATABASE_URL = os.getenv("DATABASE_URL")
 if not DATABASE_URL:
     raise ValueError("DATABASE_URL environment variable is not set")
 
-# Create database instance for async operations
-database = Database(DATABASE_URL)
+# Connection pool settings (per worker process; size max_size x workers x replicas
+# against the server's max_connections). The pool keeps up to min_size connections
+# open and opens overflow connections up to max_size. DB_POOL_MAX_CONNECTION_AGE_SECONDS
+# is a maximum age, not an idle timeout: a connection opened longer ago than that is
+# closed and replaced the next time it is checked out, however busy it has been
+DB_POOL_MIN_SIZE = int(os.getenv("DB_POOL_MIN_SIZE", "2"))
+DB_POOL_MAX_SIZE = int(os.getenv("DB_POOL_MAX_SIZE", "10"))
+DB_POOL_ACQUIRE_TIMEOUT_SECONDS = float(os.getenv("DB_POOL_ACQUIRE_TIMEOUT_SECONDS", "10"))
+DB_POOL_MAX_CONNECTION_AGE_SECONDS = float(os.getenv("DB_POOL_MAX_CONNECTION_AGE_SECONDS", "300"))
+DB_STATEMENT_TIMEOUT_MS = int(os.getenv("DB_STATEMENT_TIMEOUT_MS", "30000"))
 
-# Create engine for sync operations (migrations, etc.)
-engine = create_engine(DATABASE_URL)
+# Optional streaming replica for read-only traffic. Reads fall back to the primary while
+# the replica is more than DB_REPLICA_MAX_LAG_SECONDS behind (sampled every
+# DB_REPLICA_LAG_CHECK_SECONDS) or unreachable
+DATABASE_REPLICA_URL = os.getenv("DATABASE_REPLICA_URL")
+DB_REPLICA_MAX_LAG_SECONDS = float(os.getenv("DB_REPLICA_MAX_LAG_SECONDS", "1"))
+DB_REPLICA_LAG_CHECK_SECONDS = float(os.getenv("DB_REPLICA_LAG_CHECK_SECONDS", "1"))
 
-# Create sessionmaker
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
-# Create declarative base
-Base = declarative_base()
+def _create_database(url: str, read_only: bool = False) -> Database:
+    """One async engine (asyncpg driver) with this worker's pool settings"""
+    server_settings = {"statement_timeout": str(DB_STATEMENT_TIMEOUT_MS)}
+    if read_only:
+        server_settings["default_transaction_read_only"] = "on"
+    return Database(
+        make_url(url).set(drivername="postgresql+asyncpg"),
+        read_only=read_only,
+        pool_size=DB_POOL_MIN_SIZE,
+        max_overflow=max(DB_POOL_MAX_SIZE - DB_POOL_MIN_SIZE, 0),
+        pool_timeout=DB_POOL_ACQUIRE_TIMEOUT_SECONDS,
+        pool_recycle=DB_POOL_MAX_CONNECTION_AGE_SECONDS,
+        connect_args={"server_settings": server_settings}
+    )
 
-# Metadata for migrations
-metadata = MetaData()
 
+# The primary serves writes, schema creation and every read not routed to the replica
+database = _create_database(DATABASE_URL)
+replica_router = ReplicaRouter(
+    database,
+    _create_database(DATABASE_REPLICA_URL, read_only=True) if DATABASE_REPLICA_URL else None,
+    max_lag_seconds=DB_REPLICA_MAX_LAG_SECONDS,
+    check_interval_seconds=DB_REPLICA_LAG_CHECK_SECONDS
+)
 
 async def get_database():
     """Get database connection for dependency injection"""
     return database
 
 
-def get_db_session():
-    """Get database session for dependency injection"""
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close() 
\ No newline at end of file
+async def get_read_database():
+    """Database for read-only endpoints: the replica when configured and caught up, else the primary"""
+    return replica_router.reader()
@@ -0,0 +1,165 @@
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from functools import lru_cache
+from typing import Any, AsyncIterator, List, Optional, Union
+from sqlalchemy import exc, text
+from sqlalchemy.engine import Row
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine, create_async_engine
+from sqlalchemy.sql.elements import TextClause
+
+
+@lru_cache(maxsize=512)
+def _statement(query: str) -> TextClause:
+    # Reusing one TextClause per query string skips re-parsing bind parameters and
+    # lets SQLAlchemy's compiled cache and asyncpg's prepared statement cache hit
+    return text(query)
+
+
+class PoolStats:
+    """Acquire counters for the engine's connection pool"""
+
+    def __init__(self):
+        self.acquired = 0
+        self.timeouts = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+
+    def record_wait(self, seconds: float) -> None:
+        self.acquired += 1
+        self.wait_seconds_total += seconds
+        self.wait_seconds_max = max(self.wait_seconds_max, seconds)
+
+
+class Database:
+    """Async query interface over a single SQLAlchemy AsyncEngine (asyncpg driver)
+
+    Standalone statements run on a pooled connection in autocommit mode; statements
+    issued inside ``transaction()`` share that transaction's connection.
+    """
+
+    def __init__(self, url, read_only: bool = False, **engine_options):
+        self.url = url
+        # Set for replica connections; results may lag the primary and must not fill shared caches
+        self.read_only = read_only
+        self.engine_options = engine_options
+        self.engine: Optional[AsyncEngine] = None
+        self._transactional_engine: Optional[AsyncEngine] = None
+        self.acquire_stats = PoolStats()
+        self._transaction_connection: ContextVar[Optional[AsyncConnection]] = ContextVar(
+            "transaction_connection", default=None
+        )
+
+    @property
+    def is_connected(self) -> bool:
+        return self.engine is not None
+
+    async def connect(self) -> None:
+        if self.engine is None:
+            # Autocommit by default so standalone statements skip BEGIN/COMMIT round-trips;
+            # transaction() switches its connection back to READ COMMITTED
+            self.engine = create_async_engine(self.url, isolation_level="AUTOCOMMIT", **self.engine_options)
+            self._transactional_engine = self.engine.execution_options(isolation_level="READ COMMITTED")
+
+    async def prewarm(self, size: int) -> None:
+        """Open up to size pooled connections now so early requests skip connection setup"""
+        connections = await asyncio.gather(*(self.engine.connect() for _ in range(size)))
+        for connection in connections:
+            await connection.close()
+
+    async def disconnect(self) -> None:
+        if self.engine is not None:
+            await self.engine.dispose()
+            self.engine = None
+            self._transactional_engine = None
+
+    async def _checkout(self, engine: AsyncEngine) -> AsyncConnection:
+        started = time.perf_counter()
+        try:
+            connection = await engine.connect()
+        except exc.TimeoutError:
+            self.acquire_stats.timeouts += 1
+            raise
+        self.acquire_stats.record_wait(time.perf_counter() - started)
+        return connection
+
+    @asynccontextmanager
+    async def connection(self) -> AsyncIterator[AsyncConnection]:
+        """The current transaction's connection, or a pooled autocommit connection"""
+        current = self._transaction_connection.get()
+        if current is not None:
+            yield current
+            return
+
+        connection = await self._checkout(self.engine)
+        try:
+            yield connection
+        finally:
+            await connection.close()
+
+    @asynccontextmanager
+    async def transaction(self) -> AsyncIterator[AsyncConnection]:
+        """Run the enclosed statements in one transaction; nested calls join the outer one"""
+        current = self._transaction_connection.get()
+        if current is not None:
+            yield current
+            return
+
+        connection = await self._checkout(self._transactional_engine)
+        token = self._transaction_connection.set(connection)
+        try:
+            async with connection.begin():
+                yield connection
+        finally:
+            self._transaction_connection.reset(token)
+            await connection.close()
+
+    async def fetch_all(self, query: Union[str, TextClause], values: Optional[dict] = None) -> List[Row]:
+        async with self.connection() as connection:
+            result = await connection.execute(self._compile(query), values or {})
+            return result.fetchall()
+
+    async def fetch_one(self, query: Union[str, TextClause], values: Optional[dict] = None) -> Optional[Row]:
+        async with self.connection() as connection:
+            result = await connection.execute(self._compile(query), values or {})
+            return result.first()
+
+    async def fetch_val(self, query: Union[str, TextClause], values: Optional[dict] = None) -> Any:
+        async with self.connection() as connection:
+            result = await connection.execute(self._compile(query), values or {})
+            return result.scalar()
+
+    async def execute(self, query: Union[str, TextClause], values: Optional[dict] = None) -> int:
+        """Run a statement and return the number of rows it affected"""
+        async with self.connection() as connection:
+            result = await connection.execute(self._compile(query), values or {})
+            return result.rowcount
+
+    @staticmethod
+    def _compile(query: Union[str, TextClause]) -> TextClause:
+        return _statement(query) if isinstance(query, str) else query
+
+    def pool_stats(self) -> dict:
+        """Pool occupancy and acquire latency for this worker"""
+        counters = self.acquire_stats
+        pool = self.engine.pool if self.engine is not None else None
+        pool_size = self.engine_options.get("pool_size", 5)
+        server_settings = self.engine_options.get("connect_args", {}).get("server_settings", {})
+        return {
+            "connected": pool is not None,
+            "min_size": pool_size,
+            "max_size": pool_size + self.engine_options.get("max_overflow", 10),
+            "size": pool.checkedin() + pool.checkedout() if pool is not None else 0,
+            "idle": pool.checkedin() if pool is not None else 0,
+            "in_use": pool.checkedout() if pool is not None else 0,
+            "acquired": counters.acquired,
+            "acquire_timeouts": counters.timeouts,
+            "acquire_timeout_seconds": self.engine_options.get("pool_timeout"),
+            "acquire_wait_ms_avg": (
+                round(counters.wait_seconds_total / counters.acquired * 1000, 3) if counters.acquired else None
+            ),
+            "acquire_wait_ms_max": round(counters.wait_seconds_max * 1000, 3),
+            "statement_timeout_ms": server_settings.get("statement_timeout"),
+            "max_connection_age_seconds": self.engine_options.get("pool_recycle"),
+        }
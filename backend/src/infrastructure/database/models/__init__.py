@@ -1,7 +1,9 @@
 from .user import UserModel
 from .product import ProductModel
+from .catalog_state import CatalogStateModel
+from .stock_movement import StockMovementModel
 
-# Use the same Base from connection.py to avoid conflicts
-from src.infrastructure.database.connection import Base
+# Shared declarative base for every model
+from .base import Base
 
-__all__ = ["Base", "UserModel", "ProductModel"] 
\ No newline at end of file
+__all__ = ["Base", "UserModel", "ProductModel", "CatalogStateModel", "StockMovementModel"]
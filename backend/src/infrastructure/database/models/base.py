@@ -0,0 +1,5 @@
+from sqlalchemy.ext.declarative import declarative_base
+
+# Declarative base for the ORM models; only schema creation and Alembic import it,
+# so the request path never loads the ORM
+Base = declarative_base()
@@ -0,0 +1,57 @@
+from sqlalchemy import DDL, Table, event
+
+# Statement-level triggers publish the ids of updated/deleted rows on this channel so every
+# worker can evict them from its in-process caches; must match the listener's channel
+CACHE_INVALIDATION_CHANNEL = "cache_invalidation"
+
+# Payload is "<table>:<id>,<id>,..." or "<table>:*". NOTIFY payloads are capped at 8000 bytes,
+# so large statements (and TRUNCATE, which has no transition table) ask for a full clear
+NOTIFY_CACHE_INVALIDATION_FUNCTION = f"""
+CREATE OR REPLACE FUNCTION notify_cache_invalidation() RETURNS trigger AS $$
+DECLARE
+    ids TEXT;
+BEGIN
+    IF TG_OP = 'TRUNCATE' THEN
+        ids := '*';
+    ELSE
+        SELECT string_agg(id::text, ',') INTO ids FROM changed_rows;
+        IF ids IS NULL THEN
+            RETURN NULL;
+        END IF;
+        IF length(ids) > 7900 THEN
+            ids := '*';
+        END IF;
+    END IF;
+    PERFORM pg_notify('{CACHE_INVALIDATION_CHANNEL}', TG_TABLE_NAME || ':' || ids);
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+
+def cache_invalidation_triggers(table_name: str) -> list:
+    """CREATE TRIGGER statements that notify listeners when rows of table_name change"""
+    return [
+        f"""
+        CREATE TRIGGER {table_name}_notify_cache_update
+        AFTER UPDATE ON {table_name} REFERENCING OLD TABLE AS changed_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION notify_cache_invalidation()
+        """,
+        f"""
+        CREATE TRIGGER {table_name}_notify_cache_delete
+        AFTER DELETE ON {table_name} REFERENCING OLD TABLE AS changed_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION notify_cache_invalidation()
+        """,
+        f"""
+        CREATE TRIGGER {table_name}_notify_cache_truncate
+        AFTER TRUNCATE ON {table_name}
+        FOR EACH STATEMENT EXECUTE FUNCTION notify_cache_invalidation()
+        """,
+    ]
+
+
+def listen_for_cache_invalidation(table: Table) -> None:
+    """Install the notify triggers whenever create_all creates table"""
+    event.listen(table, "after_create", DDL(NOTIFY_CACHE_INVALIDATION_FUNCTION))
+    for statement in cache_invalidation_triggers(table.name):
+        event.listen(table, "after_create", DDL(statement))
@@ -0,0 +1,79 @@
+from sqlalchemy import Column, Integer, BigInteger, DateTime, DDL, CheckConstraint, event, func
+from src.infrastructure.database.models.base import Base
+
+# The catalog version is spread over this many counter rows so concurrent writers rarely
+# lock the same one; readers sum them. Must match STRIPES in migration 0010
+CATALOG_VERSION_STRIPES = 16
+
+
+class CatalogStateModel(Base):
+    """Striped counters whose sum is the product catalog version used for HTTP validators"""
+    __tablename__ = "catalog_state"
+
+    id = Column(Integer, primary_key=True)
+    version = Column(BigInteger, nullable=False, default=0)
+    updated_at = Column("updated_at", DateTime(timezone=True), default=func.now(), nullable=False)
+
+    __table_args__ = (
+        CheckConstraint(f"id >= 0 AND id < {CATALOG_VERSION_STRIPES}", name="ck_catalog_state_stripe"),
+    )
+
+    def __repr__(self):
+        return f"<CatalogState(id={self.id}, version={self.version})>"
+
+
+event.listen(
+    CatalogStateModel.__table__,
+    "after_create",
+    DDL(
+        "INSERT INTO catalog_state (id, version, updated_at) "
+        f"SELECT stripe, 0, now() FROM generate_series(0, {CATALOG_VERSION_STRIPES - 1}) AS stripe "
+        "ON CONFLICT (id) DO NOTHING"
+    )
+)
+
+# Bump one stripe per writing statement (not per row), in the writer's transaction, so
+# readers never see the new version before the rows it describes. The stripe follows the
+# backend pid, so writers on different connections usually lock different rows, and
+# statements that changed nothing (ON CONFLICT DO NOTHING, an UPDATE matching no row)
+# leave the version alone
+BUMP_CATALOG_VERSION_FUNCTION = f"""
+CREATE OR REPLACE FUNCTION bump_catalog_version() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP <> 'TRUNCATE' THEN
+        IF NOT EXISTS (SELECT 1 FROM changed_rows) THEN
+            RETURN NULL;
+        END IF;
+    END IF;
+    UPDATE catalog_state SET version = version + 1, updated_at = now()
+    WHERE id = mod(pg_backend_pid(), {CATALOG_VERSION_STRIPES});
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+
+def catalog_version_triggers(table_name: str) -> list:
+    """CREATE TRIGGER statements that bump the catalog version when rows of table_name change"""
+    return [
+        f"""
+        CREATE TRIGGER {table_name}_bump_catalog_version_insert
+        AFTER INSERT ON {table_name} REFERENCING NEW TABLE AS changed_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION bump_catalog_version()
+        """,
+        f"""
+        CREATE TRIGGER {table_name}_bump_catalog_version_update
+        AFTER UPDATE ON {table_name} REFERENCING NEW TABLE AS changed_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION bump_catalog_version()
+        """,
+        f"""
+        CREATE TRIGGER {table_name}_bump_catalog_version_delete
+        AFTER DELETE ON {table_name} REFERENCING OLD TABLE AS changed_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION bump_catalog_version()
+        """,
+        f"""
+        CREATE TRIGGER {table_name}_bump_catalog_version_truncate
+        AFTER TRUNCATE ON {table_name}
+        FOR EACH STATEMENT EXECUTE FUNCTION bump_catalog_version()
+        """,
+    ]
@@ -1,5 +1,11 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, Numeric, func
-from src.infrastructure.database.connection import Base
+from datetime import datetime
+
+from sqlalchemy import (
+    Column, Integer, String, Text, DateTime, Numeric, Index, CheckConstraint, DDL, event, func, literal_column, text
+)
+from src.infrastructure.database.models.base import Base
+from src.infrastructure.database.models.cache_invalidation import listen_for_cache_invalidation
+from src.infrastructure.database.models.catalog_state import BUMP_CATALOG_VERSION_FUNCTION, catalog_version_triggers
 
 
 class ProductModel(Base):
@@ -13,8 +19,56 @@ class ProductModel(Base):
     description = Column(Text, nullable=True)
     quantity = Column(Integer, nullable=False, default=0)
     price = Column(Numeric(10, 2), nullable=False)
-    created_at = Column("created_at", DateTime, default=func.now(), nullable=False)
-    updated_at = Column("updated_at", DateTime, default=func.now(), onupdate=func.now(), nullable=False)
+    created_at = Column("created_at", DateTime, default=datetime.utcnow, nullable=False)
+    updated_at = Column("updated_at", DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    reorder_level = Column(Integer, nullable=False, default=0, server_default=text("0"))
+    # Row version for optimistic concurrency: every UPDATE sets version = version + 1
+    version = Column(Integer, nullable=False, default=1, server_default=text("1"))
+
+    __table_args__ = (
+        # Keyset pagination order for listings: ORDER BY created_at DESC, id DESC
+        Index("ix_products_created_at_id", "created_at", "id"),
+        # The other listing sorts, each with id as tie-breaker, and the type-filtered
+        # variants of the two most common ones
+        Index("ix_products_type_created_at_id", "type", "created_at", "id"),
+        Index("ix_products_type_price_id", "type", "price", "id"),
+        Index("ix_products_price_id", "price", "id"),
+        Index("ix_products_updated_at_id", "updated_at", "id"),
+        Index("ix_products_name_id", "name", "id"),
+        # Full-text search document; must match SEARCH_DOCUMENT in the product repository
+        Index(
+            "ix_products_search_document",
+            func.to_tsvector(
+                literal_column("'english'"),
+                func.coalesce(name, literal_column("''"))
+                .op("||")(literal_column("' '"))
+                .op("||")(func.coalesce(description, literal_column("''")))
+            ),
+            postgresql_using="gin"
+        ),
+        # Trigram indexes for fuzzy and partial SKU/name matching (requires pg_trgm)
+        Index("ix_products_sku_trgm", sku, postgresql_using="gin", postgresql_ops={"sku": "gin_trgm_ops"}),
+        Index("ix_products_name_trgm", name, postgresql_using="gin", postgresql_ops={"name": "gin_trgm_ops"}),
+        CheckConstraint("reorder_level >= 0", name="ck_products_reorder_level_non_negative"),
+        # Low-stock listing: holds only rows at or below their reorder level, ordered by how
+        # far below it they are, so the query scales with low items rather than the catalog
+        Index(
+            "ix_products_low_stock",
+            quantity - reorder_level,
+            id,
+            postgresql_where=quantity <= reorder_level
+        ),
+    )
 
     def __repr__(self):
-        return f"<Product(id={self.id}, name='{self.name}', sku='{self.sku}')>" 
\ No newline at end of file
+        return f"<Product(id={self.id}, name='{self.name}', sku='{self.sku}')>"
+
+
+event.listen(ProductModel.__table__, "before_create", DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+
+# Every writing statement bumps the catalog version (see catalog_state)
+event.listen(ProductModel.__table__, "after_create", DDL(BUMP_CATALOG_VERSION_FUNCTION))
+for statement in catalog_version_triggers(ProductModel.__table__.name):
+    event.listen(ProductModel.__table__, "after_create", DDL(statement))
+
+listen_for_cache_invalidation(ProductModel.__table__)
@@ -0,0 +1,28 @@
+from sqlalchemy import Column, Integer, BigInteger, String, DateTime, Index, text
+from src.infrastructure.database.models.base import Base
+
+
+class StockMovementModel(Base):
+    """Append-only ledger of quantity changes, written in the same statement as the change"""
+    __tablename__ = "stock_movements"
+
+    id = Column(BigInteger, primary_key=True, autoincrement=True)
+    # No foreign key: the history outlives deleted products
+    product_id = Column(Integer, nullable=False)
+    delta = Column(Integer, nullable=False)
+    # Balance after this movement, so "quantity as of T" is the last movement at or before T
+    quantity_after = Column(Integer, nullable=False)
+    reason = Column(String(100), nullable=False)
+    user_id = Column(Integer, nullable=True)
+    # clock_timestamp() rather than now(): evaluated after the product row lock is taken,
+    # so timestamps follow the order in which changes were applied
+    created_at = Column(
+        "created_at", DateTime(timezone=True), server_default=text("clock_timestamp()"), nullable=False
+    )
+
+    __table_args__ = (
+        Index("ix_stock_movements_product_id_created_at", "product_id", "created_at", "id"),
+    )
+
+    def __repr__(self):
+        return f"<StockMovement(product_id={self.product_id}, delta={self.delta}, reason='{self.reason}')>"
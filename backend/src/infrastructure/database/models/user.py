@@ -1,5 +1,8 @@
-from sqlalchemy import Column, Integer, String, DateTime, func
-from src.infrastructure.database.connection import Base
+from datetime import datetime
+
+from sqlalchemy import Column, Integer, String, DateTime
+from src.infrastructure.database.models.base import Base
+from src.infrastructure.database.models.cache_invalidation import listen_for_cache_invalidation
 
 
 class UserModel(Base):
@@ -8,8 +11,11 @@ class UserModel(Base):
     id = Column(Integer, primary_key=True, autoincrement=True)
     username = Column(String(50), unique=True, nullable=False, index=True)
     password_hash = Column("password_hash", String(255), nullable=False)
-    created_at = Column("created_at", DateTime, default=func.now(), nullable=False)
-    updated_at = Column("updated_at", DateTime, default=func.now(), onupdate=func.now(), nullable=False)
+    created_at = Column("created_at", DateTime, default=datetime.utcnow, nullable=False)
+    updated_at = Column("updated_at", DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
 
     def __repr__(self):
-        return f"<User(id={self.id}, username='{self.username}')>" 
\ No newline at end of file
+        return f"<User(id={self.id}, username='{self.username}')>"
+
+
+listen_for_cache_invalidation(UserModel.__table__)
@@ -0,0 +1,116 @@
+import asyncio
+import logging
+from typing import Optional
+from src.infrastructure.database.database import Database
+
+logger = logging.getLogger(__name__)
+
+# Seconds the replica is behind the primary: 0 when it has replayed everything it received
+# (or is not a standby at all), otherwise the age of the last replayed commit, which
+# overstates lag after a quiet period and so errs towards the primary. NULL (unhealthy)
+# when no WAL receiver is streaming, since a standby cut off from the primary has also
+# replayed everything it received, or when no transaction has been replayed since the
+# replica started. Without pg_read_all_stats the receiver's status reads as NULL, so only
+# a running receiver process is required then
+REPLICA_LAG_QUERY = """
+    SELECT CASE
+        WHEN NOT pg_is_in_recovery() THEN 0
+        WHEN NOT EXISTS (
+            SELECT 1 FROM pg_stat_wal_receiver WHERE COALESCE(status, 'streaming') = 'streaming'
+        ) THEN NULL
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp())
+    END
+"""
+
+
+class ReplicaRouter:
+    """Chooses the database that serves a read: the streaming replica while it keeps up, else the primary
+
+    Replica lag is sampled in the background every check_interval_seconds, so routing a
+    request costs no round-trip. Without a replica every read goes to the primary.
+    """
+
+    def __init__(
+        self,
+        primary: Database,
+        replica: Optional[Database] = None,
+        max_lag_seconds: float = 1.0,
+        check_interval_seconds: float = 1.0
+    ):
+        self.primary = primary
+        self.replica = replica
+        self.max_lag_seconds = max_lag_seconds
+        self.check_interval_seconds = check_interval_seconds
+        self.lag_seconds: Optional[float] = None
+        self._task: Optional[asyncio.Task] = None
+        self.replica_reads = 0
+        self.primary_fallbacks = 0
+
+    @property
+    def replica_healthy(self) -> bool:
+        return (
+            self.replica is not None
+            and self.replica.is_connected
+            and self.lag_seconds is not None
+            and self.lag_seconds <= self.max_lag_seconds
+        )
+
+    def reader(self) -> Database:
+        """Database for a read-only request; writes and read-your-writes paths use the primary directly"""
+        if self.replica is None:
+            return self.primary
+        if self.replica_healthy:
+            self.replica_reads += 1
+            return self.replica
+        self.primary_fallbacks += 1
+        return self.primary
+
+    async def start(self) -> None:
+        if self.replica is None or self._task is not None:
+            return
+        await self.replica.connect()
+        # Measure once before serving so the first requests are routed on a real sample
+        await self._check_lag()
+        self._task = asyncio.create_task(self._monitor())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self.replica is not None:
+            await self.replica.disconnect()
+
+    async def _monitor(self) -> None:
+        while True:
+            await asyncio.sleep(self.check_interval_seconds)
+            await self._check_lag()
+
+    async def _check_lag(self) -> None:
+        try:
+            lag = await asyncio.wait_for(
+                self.replica.fetch_val(REPLICA_LAG_QUERY), self.check_interval_seconds * 2
+            )
+            self.lag_seconds = max(float(lag), 0.0) if lag is not None else None
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            # An unreachable replica counts as infinitely behind until the next good sample
+            logger.warning("Replica lag check failed: %s", e)
+            self.lag_seconds = None
+
+    def stats(self) -> dict:
+        """Routing counters and the last lag sample"""
+        return {
+            "configured": self.replica is not None,
+            "healthy": self.replica_healthy,
+            "lag_seconds": round(self.lag_seconds, 3) if self.lag_seconds is not None else None,
+            "max_lag_seconds": self.max_lag_seconds,
+            "replica_reads": self.replica_reads,
+            "primary_fallbacks": self.primary_fallbacks,
+            "pool": self.replica.pool_stats() if self.replica is not None else None,
+        }
@@ -1,4 +1,5 @@
 from .sqlalchemy_user_repository import SQLAlchemyUserRepository
 from .sqlalchemy_product_repository import SQLAlchemyProductRepository
+from .cached_product_repository import CachedProductRepository
 
-__all__ = ["SQLAlchemyUserRepository", "SQLAlchemyProductRepository"] 
\ No newline at end of file
+__all__ = ["SQLAlchemyUserRepository", "SQLAlchemyProductRepository", "CachedProductRepository"]
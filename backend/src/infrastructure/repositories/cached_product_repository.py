@@ -0,0 +1,196 @@
+from datetime import datetime
+from typing import Any, Optional, List, Tuple, Dict
+from src.domain.entities.product import Product
+from src.domain.entities.stock_movement import StockMovement
+from src.domain.repositories.product_repository import ProductRepository, DEFAULT_PRODUCT_SORT
+from src.infrastructure.cache.product_cache import ProductCache
+
+
+class CachedProductRepository(ProductRepository):
+    """Read-through cache for single-product lookups in front of another ProductRepository"""
+
+    def __init__(self, repository: ProductRepository, cache: ProductCache, populate: bool = True):
+        self.repository = repository
+        self.cache = cache
+        # Off for replica reads: an invalidation can arrive before the replica replays the
+        # change, so a lagging row would be cached with a current generation
+        self.populate = populate
+
+    async def find_by_id(self, id: int) -> Optional[Product]:
+        product = self.cache.get_by_id(id)
+        if product is not None:
+            return product
+
+        generation = self.cache.generation
+        product = await self.repository.find_by_id(id)
+        if product is not None and self.populate:
+            self.cache.set(product, generation)
+        return product
+
+    async def find_by_sku(self, sku: str) -> Optional[Product]:
+        product = self.cache.get_by_sku(sku)
+        if product is not None:
+            return product
+
+        generation = self.cache.generation
+        product = await self.repository.find_by_sku(sku)
+        if product is not None and self.populate:
+            self.cache.set(product, generation)
+        return product
+
+    async def find_many(self, ids: List[int], skus: List[str]) -> List[Product]:
+        found: Dict[int, Product] = {}
+        missing_ids, missing_skus = [], []
+        for id in ids:
+            product = self.cache.get_by_id(id)
+            if product is not None:
+                found[product.id] = product
+            else:
+                missing_ids.append(id)
+        for sku in skus:
+            product = self.cache.get_by_sku(sku)
+            if product is not None:
+                found[product.id] = product
+            else:
+                missing_skus.append(sku)
+
+        if missing_ids or missing_skus:
+            generation = self.cache.generation
+            for product in await self.repository.find_many(missing_ids, missing_skus):
+                found[product.id] = product
+                if self.populate:
+                    self.cache.set(product, generation)
+        return list(found.values())
+
+    async def find_all(
+        self,
+        limit: int = 10,
+        offset: int = 0,
+        after: Optional[Tuple[Any, int]] = None,
+        filters: Optional[Dict[str, Any]] = None,
+        sort: str = DEFAULT_PRODUCT_SORT
+    ) -> List[Product]:
+        return await self.repository.find_all(
+            limit=limit, offset=offset, after=after, filters=filters, sort=sort
+        )
+
+    async def find_all_with_total(
+        self,
+        limit: int = 10,
+        offset: int = 0,
+        after: Optional[Tuple[Any, int]] = None,
+        filters: Optional[Dict[str, Any]] = None,
+        sort: str = DEFAULT_PRODUCT_SORT
+    ) -> Tuple[List[Product], Optional[int]]:
+        return await self.repository.find_all_with_total(
+            limit=limit, offset=offset, after=after, filters=filters, sort=sort
+        )
+
+    async def search(self, term: str, limit: int = 20) -> List[Product]:
+        return await self.repository.search(term, limit)
+
+    async def create(self, product: Product, user_id: Optional[int] = None) -> Optional[Product]:
+        generation = self.cache.generation
+        created = await self.repository.create(product, user_id)
+        if created is not None:
+            self.cache.set(created, generation)
+        return created
+
+    async def create_many(self, products: List[Product], user_id: Optional[int] = None) -> List[str]:
+        return await self.repository.create_many(products, user_id)
+
+    async def update(self, product: Product, expected_version: Optional[int] = None) -> Optional[Product]:
+        # Read before writing, like fills: an invalidation from another worker that lands
+        # between the write and set() may describe a newer row than the one returned
+        generation = self.cache.generation
+        try:
+            updated = await self.repository.update(product, expected_version)
+        except Exception:
+            self.cache.invalidate(product.id)
+            raise
+        if updated is None:
+            # A version conflict means the cached copy is older than the row
+            self.cache.invalidate(product.id)
+        else:
+            self.cache.set(updated, generation)
+        return updated
+
+    async def set_quantity(
+        self,
+        id: int,
+        quantity: int,
+        reason: str = StockMovement.SET,
+        user_id: Optional[int] = None
+    ) -> Optional[Product]:
+        generation = self.cache.generation
+        updated = await self.repository.set_quantity(id, quantity, reason, user_id)
+        if updated is not None:
+            self.cache.set(updated, generation)
+        return updated
+
+    async def update_quantities(
+        self,
+        items: List[Tuple[Optional[int], Optional[str], int]],
+        reason: str = StockMovement.SET,
+        user_id: Optional[int] = None
+    ) -> List[Product]:
+        generation = self.cache.generation
+        updated = await self.repository.update_quantities(items, reason, user_id)
+        for product in updated:
+            self.cache.set(product, generation)
+        return updated
+
+    async def adjust_quantity(
+        self,
+        id: int,
+        delta: int,
+        reason: str = StockMovement.ADJUSTED,
+        user_id: Optional[int] = None
+    ) -> Optional[Product]:
+        generation = self.cache.generation
+        adjusted = await self.repository.adjust_quantity(id, delta, reason, user_id)
+        if adjusted is not None:
+            self.cache.set(adjusted, generation)
+        return adjusted
+
+    async def set_reorder_level(self, id: int, reorder_level: int) -> Optional[Product]:
+        generation = self.cache.generation
+        updated = await self.repository.set_reorder_level(id, reorder_level)
+        if updated is not None:
+            self.cache.set(updated, generation)
+        return updated
+
+    async def find_low_stock(
+        self,
+        limit: int = 50,
+        after: Optional[Tuple[int, int]] = None,
+        type: Optional[str] = None
+    ) -> List[Product]:
+        return await self.repository.find_low_stock(limit, after, type)
+
+    async def delete(self, id: int) -> bool:
+        try:
+            return await self.repository.delete(id)
+        finally:
+            self.cache.invalidate(id)
+
+    async def find_stock_movements(
+        self,
+        product_id: int,
+        limit: int = 50,
+        before_id: Optional[int] = None
+    ) -> List[StockMovement]:
+        return await self.repository.find_stock_movements(product_id, limit, before_id)
+
+    async def quantity_as_of(self, product_id: int, at: datetime) -> Optional[int]:
+        return await self.repository.quantity_as_of(product_id, at)
+
+    async def count(self, filters: Optional[Dict[str, Any]] = None) -> int:
+        return await self.repository.count(filters)
+
+    async def estimate_count(self, filters: Optional[Dict[str, Any]] = None) -> Optional[int]:
+        return await self.repository.estimate_count(filters)
+
+    async def catalog_version(self) -> Tuple[int, datetime]:
+        # Never cached: validators must reflect writes from every process
+        return await self.repository.catalog_version()
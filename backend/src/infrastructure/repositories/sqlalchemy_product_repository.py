@@ -1,8 +1,64 @@
-from typing import Optional, List
-from decimal import Decimal
-from databases import Database
+import json
+from datetime import datetime
+from typing import Any, Optional, List, Tuple, Dict
+from sqlalchemy import exc
+from src.infrastructure.database.database import Database
 from src.domain.entities.product import Product
-from src.domain.repositories.product_repository import ProductRepository
+from src.domain.entities.stock_movement import StockMovement
+from src.domain.repositories.product_repository import ProductRepository, DEFAULT_PRODUCT_SORT
+
+
+# Must match the ix_products_search_document expression index on ProductModel
+SEARCH_DOCUMENT = "to_tsvector('english', coalesce(name, '') || ' ' || coalesce(description, ''))"
+
+# Unique index on products.sku (ProductModel.sku, migration 0001)
+SKU_UNIQUE_INDEX = "ix_products_sku"
+
+
+# Selected in Product constructor order so rows map onto entities positionally
+PRODUCT_COLUMNS = (
+    "id, name, type, sku, image_url, description, quantity, price, created_at, updated_at, reorder_level, version"
+)
+_PRODUCT_WIDTH = len(Product.__slots__)
+
+
+def _to_product(row) -> Product:
+    """Map a row whose leading columns are PRODUCT_COLUMNS to a Product entity"""
+    # Positional slicing skips per-key lookups, and NUMERIC already arrives as
+    # Decimal so price needs no conversion
+    return Product(*row[:_PRODUCT_WIDTH])
+
+
+# Column and direction for each of PRODUCT_SORTS; each has an index on (column, id)
+# (and on (type, column, id) for the common type-filtered listings)
+_SORT_COLUMNS = {
+    "-created_at": ("created_at", "DESC"),
+    "created_at": ("created_at", "ASC"),
+    "-updated_at": ("updated_at", "DESC"),
+    "price": ("price", "ASC"),
+    "-price": ("price", "DESC"),
+    "name": ("name", "ASC"),
+}
+
+# Condition for each of PRODUCT_FILTERS, bound to a parameter of the same name
+_FILTER_CONDITIONS = {
+    "type": "type = :type",
+    "min_price": "price >= :min_price",
+    "max_price": "price <= :max_price",
+    "min_quantity": "quantity >= :min_quantity",
+    "max_quantity": "quantity <= :max_quantity",
+    "updated_since": "updated_at >= :updated_since",
+}
+
+# Every statement that changes products.quantity appends to stock_movements in the same
+# statement (a data-modifying CTE), so the ledger and the balance commit together
+STOCK_MOVEMENT_COLUMNS = "id, product_id, delta, quantity_after, reason, user_id, created_at"
+
+
+def _to_products(rows) -> List[Product]:
+    """Map a page of rows whose leading columns are PRODUCT_COLUMNS to Product entities"""
+    width = _PRODUCT_WIDTH
+    return [Product(*row[:width]) for row in rows]
 
 
 class SQLAlchemyProductRepository(ProductRepository):
@@ -11,8 +67,8 @@ class SQLAlchemyProductRepository(ProductRepository):
 
     async def find_by_id(self, id: int) -> Optional[Product]:
         try:
-            query = """
-                SELECT id, name, type, sku, image_url, description, quantity, price, created_at, updated_at 
+            query = f"""
+                SELECT {PRODUCT_COLUMNS}
                 FROM products WHERE id = :id
             """
             result = await self.database.fetch_one(
@@ -22,25 +78,14 @@ class SQLAlchemyProductRepository(ProductRepository):
             if not result:
                 return None
 
-            return Product(
-                id=result["id"],
-                name=result["name"],
-                type=result["type"],
-                sku=result["sku"],
-                image_url=result["image_url"],
-                description=result["description"],
-                quantity=result["quantity"],
-                price=Decimal(str(result["price"])),
-                created_at=result["created_at"],
-                updated_at=result["updated_at"]
-            )
+            return _to_product(result)
         except Exception as e:
             raise Exception(f"Error finding product by ID: {str(e)}")
 
     async def find_by_sku(self, sku: str) -> Optional[Product]:
         try:
-            query = """
-                SELECT id, name, type, sku, image_url, description, quantity, price, created_at, updated_at 
+            query = f"""
+                SELECT {PRODUCT_COLUMNS}
                 FROM products WHERE sku = :sku
             """
             result = await self.database.fetch_one(
@@ -50,59 +95,161 @@ class SQLAlchemyProductRepository(ProductRepository):
             if not result:
                 return None
 
-            return Product(
-                id=result["id"],
-                name=result["name"],
-                type=result["type"],
-                sku=result["sku"],
-                image_url=result["image_url"],
-                description=result["description"],
-                quantity=result["quantity"],
-                price=Decimal(str(result["price"])),
-                created_at=result["created_at"],
-                updated_at=result["updated_at"]
-            )
+            return _to_product(result)
         except Exception as e:
             raise Exception(f"Error finding product by SKU: {str(e)}")
 
-    async def find_all(self, limit: int = 10, offset: int = 0) -> List[Product]:
+    async def find_many(self, ids: List[int], skus: List[str]) -> List[Product]:
         try:
-            query = """
-                SELECT id, name, type, sku, image_url, description, quantity, price, created_at, updated_at 
-                FROM products 
-                ORDER BY created_at DESC
-                LIMIT :limit OFFSET :offset
+            if not ids and not skus:
+                return []
+
+            # One array parameter per key, so the statement (and its prepared plan) is
+            # the same however many keys are asked for; each side is a primary key or
+            # unique index probe
+            query = f"""
+                SELECT {PRODUCT_COLUMNS}
+                FROM products
+                WHERE id = ANY(CAST(:ids AS INTEGER[])) OR sku = ANY(CAST(:skus AS VARCHAR[]))
             """
             results = await self.database.fetch_all(
-                query=query, values={"limit": limit, "offset": offset}
+                query=query, values={"ids": list(ids), "skus": list(skus)}
             )
+
+            return _to_products(results)
+        except Exception as e:
+            raise Exception(f"Error finding products by ID or SKU: {str(e)}")
+
+    async def find_all(
+        self,
+        limit: int = 10,
+        offset: int = 0,
+        after: Optional[Tuple[Any, int]] = None,
+        filters: Optional[Dict[str, Any]] = None,
+        sort: str = DEFAULT_PRODUCT_SORT
+    ) -> List[Product]:
+        try:
+            query, values = self._page_query(limit, offset, after, filters=filters, sort=sort)
+            results = await self.database.fetch_all(query=query, values=values)
             
-            products = []
-            for result in results:
-                product = Product(
-                    id=result["id"],
-                    name=result["name"],
-                    type=result["type"],
-                    sku=result["sku"],
-                    image_url=result["image_url"],
-                    description=result["description"],
-                    quantity=result["quantity"],
-                    price=Decimal(str(result["price"])),
-                    created_at=result["created_at"],
-                    updated_at=result["updated_at"]
-                )
-                products.append(product)
-                
-            return products
+            return _to_products(results)
         except Exception as e:
             raise Exception(f"Error finding all products: {str(e)}")
 
-    async def create(self, product: Product) -> Product:
+    async def find_all_with_total(
+        self,
+        limit: int = 10,
+        offset: int = 0,
+        after: Optional[Tuple[Any, int]] = None,
+        filters: Optional[Dict[str, Any]] = None,
+        sort: str = DEFAULT_PRODUCT_SORT
+    ) -> Tuple[List[Product], Optional[int]]:
         try:
-            query = """
-                INSERT INTO products (name, type, sku, image_url, description, quantity, price, created_at, updated_at)
-                VALUES (:name, :type, :sku, :image_url, :description, :quantity, :price, :created_at, :updated_at)
-                RETURNING id, name, type, sku, image_url, description, quantity, price, created_at, updated_at
+            query, values = self._page_query(limit, offset, after, True, filters, sort)
+            results = await self.database.fetch_all(query=query, values=values)
+
+            total = results[0].total if results else None
+            return _to_products(results), total
+        except Exception as e:
+            raise Exception(f"Error finding all products: {str(e)}")
+
+    @staticmethod
+    def _filter_conditions(filters: Optional[Dict[str, Any]]) -> Tuple[List[str], dict]:
+        """SQL conditions and bind values for the non-None listing filters"""
+        conditions, values = [], {}
+        for name, value in (filters or {}).items():
+            if value is not None:
+                conditions.append(_FILTER_CONDITIONS[name])
+                values[name] = value
+        return conditions, values
+
+    @staticmethod
+    def _page_query(
+        limit: int,
+        offset: int,
+        after: Optional[Tuple[Any, int]],
+        with_total: bool = False,
+        filters: Optional[Dict[str, Any]] = None,
+        sort: str = DEFAULT_PRODUCT_SORT
+    ) -> Tuple[str, dict]:
+        column, direction = _SORT_COLUMNS[sort]
+        conditions, values = SQLAlchemyProductRepository._filter_conditions(filters)
+
+        # The total is an uncorrelated scalar subquery, so Postgres evaluates it once per
+        # statement (unlike COUNT(*) OVER (), it neither forces every row through the
+        # sort nor gets cut short by the keyset condition)
+        total_column = ""
+        if with_total:
+            total_where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+            total_column = f", (SELECT COUNT(*) FROM products {total_where}) AS total"
+
+        if after is not None:
+            # Keyset pagination: seek past the last seen (sort value, id) using the
+            # matching ({column}, id) index
+            comparison = "<" if direction == "DESC" else ">"
+            conditions = conditions + [f"({column}, id) {comparison} (:after_value, :after_id)"]
+            values["after_value"], values["after_id"] = after
+        else:
+            values["offset"] = offset
+        values["limit"] = limit
+
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        query = f"""
+            SELECT {PRODUCT_COLUMNS}{total_column}
+            FROM products
+            {where}
+            ORDER BY {column} {direction}, id {direction}
+            LIMIT :limit{"" if after is not None else " OFFSET :offset"}
+        """
+        return query, values
+
+    async def search(self, term: str, limit: int = 20) -> List[Product]:
+        try:
+            # Full-text matches on name/description use the GIN tsvector index; trigram
+            # similarity and substring matches on SKU/name use the pg_trgm GIN indexes
+            query = f"""
+                SELECT {PRODUCT_COLUMNS}
+                FROM products, websearch_to_tsquery('english', :term) AS tsq
+                WHERE {SEARCH_DOCUMENT} @@ tsq
+                   OR sku % :term
+                   OR name % :term
+                   OR sku ILIKE :pattern
+                ORDER BY ts_rank_cd({SEARCH_DOCUMENT}, tsq)
+                       + GREATEST(similarity(sku, :term), similarity(name, :term)) DESC,
+                         id DESC
+                LIMIT :limit
+            """
+            escaped = term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+            results = await self.database.fetch_all(
+                query=query,
+                values={"term": term, "pattern": f"%{escaped}%", "limit": limit}
+            )
+
+            return _to_products(results)
+        except Exception as e:
+            raise Exception(f"Error searching products: {str(e)}")
+
+    async def create(self, product: Product, user_id: Optional[int] = None) -> Optional[Product]:
+        try:
+            # A taken SKU inserts nothing (and so records no movement) rather than raising,
+            # which also settles concurrent creates of the same SKU without an error
+            query = f"""
+                WITH created AS (
+                    INSERT INTO products (
+                        name, type, sku, image_url, description, quantity, price, created_at, updated_at, reorder_level
+                    )
+                    VALUES (
+                        :name, :type, :sku, :image_url, :description, :quantity, :price, :created_at, :updated_at,
+                        :reorder_level
+                    )
+                    ON CONFLICT (sku) DO NOTHING
+                    RETURNING {PRODUCT_COLUMNS}
+                ),
+                movement AS (
+                    INSERT INTO stock_movements (product_id, delta, quantity_after, reason, user_id)
+                    SELECT id, quantity, quantity, :reason, :user_id FROM created
+                )
+                SELECT {PRODUCT_COLUMNS} FROM created
             """
             result = await self.database.fetch_one(
                 query=query,
@@ -115,38 +262,85 @@ class SQLAlchemyProductRepository(ProductRepository):
                     "quantity": product.quantity,
                     "price": product.price,
                     "created_at": product.created_at,
-                    "updated_at": product.updated_at
+                    "updated_at": product.updated_at,
+                    "reorder_level": product.reorder_level,
+                    "reason": StockMovement.CREATED,
+                    "user_id": user_id
                 }
             )
 
-            return Product(
-                id=result["id"],
-                name=result["name"],
-                type=result["type"],
-                sku=result["sku"],
-                image_url=result["image_url"],
-                description=result["description"],
-                quantity=result["quantity"],
-                price=Decimal(str(result["price"])),
-                created_at=result["created_at"],
-                updated_at=result["updated_at"]
-            )
+            if not result:
+                return None
+
+            return _to_product(result)
         except Exception as e:
             raise Exception(f"Error creating product: {str(e)}")
 
-    async def update(self, product: Product) -> Product:
+    async def create_many(self, products: List[Product], user_id: Optional[int] = None) -> List[str]:
         try:
-            # First check if product exists
-            existing = await self.find_by_id(product.id)
-            if not existing:
-                raise Exception("Product not found")
+            if not products:
+                return []
 
+            # One statement per batch: columns are sent as arrays so the number of bind
+            # parameters stays constant regardless of batch size
             query = """
+                WITH created AS (
+                    INSERT INTO products (
+                        name, type, sku, image_url, description, quantity, price, created_at, updated_at, reorder_level
+                    )
+                    SELECT * FROM unnest(
+                        CAST(:names AS VARCHAR[]), CAST(:types AS VARCHAR[]), CAST(:skus AS VARCHAR[]),
+                        CAST(:image_urls AS VARCHAR[]), CAST(:descriptions AS TEXT[]),
+                        CAST(:quantities AS INTEGER[]), CAST(:prices AS NUMERIC[]),
+                        CAST(:created_ats AS TIMESTAMP[]), CAST(:updated_ats AS TIMESTAMP[]),
+                        CAST(:reorder_levels AS INTEGER[])
+                    )
+                    ON CONFLICT (sku) DO NOTHING
+                    RETURNING id, sku, quantity
+                ),
+                movements AS (
+                    INSERT INTO stock_movements (product_id, delta, quantity_after, reason, user_id)
+                    SELECT id, quantity, quantity, :reason, :user_id FROM created
+                )
+                SELECT sku FROM created
+            """
+            results = await self.database.fetch_all(
+                query=query,
+                values={
+                    "names": [product.name for product in products],
+                    "types": [product.type for product in products],
+                    "skus": [product.sku for product in products],
+                    "image_urls": [product.image_url for product in products],
+                    "descriptions": [product.description for product in products],
+                    "quantities": [product.quantity for product in products],
+                    "prices": [product.price for product in products],
+                    "created_ats": [product.created_at for product in products],
+                    "updated_ats": [product.updated_at for product in products],
+                    "reorder_levels": [product.reorder_level for product in products],
+                    "reason": StockMovement.IMPORTED,
+                    "user_id": user_id
+                }
+            )
+
+            return [result.sku for result in results]
+        except Exception as e:
+            raise Exception(f"Error creating products: {str(e)}")
+
+    async def update(self, product: Product, expected_version: Optional[int] = None) -> Optional[Product]:
+        try:
+            # Conditional on the version the caller read, so a concurrent edit makes this
+            # match no row instead of being overwritten; a SKU taken by another product also
+            # matches nothing. Quantity is left to set_quantity / adjust_quantity, which
+            # record the change in the stock ledger. A reorder level of None keeps the stored one
+            query = f"""
                 UPDATE products 
                 SET name = :name, type = :type, sku = :sku, image_url = :image_url, 
-                    description = :description, quantity = :quantity, price = :price, updated_at = :updated_at
-                WHERE id = :id
-                RETURNING id, name, type, sku, image_url, description, quantity, price, created_at, updated_at
+                    description = :description, price = :price, updated_at = :updated_at,
+                    reorder_level = COALESCE(CAST(:reorder_level AS INTEGER), reorder_level),
+                    version = version + 1
+                WHERE id = :id AND (CAST(:expected_version AS INTEGER) IS NULL OR version = :expected_version)
+                  AND NOT EXISTS (SELECT 1 FROM products other WHERE other.sku = :sku AND other.id <> :id)
+                RETURNING {PRODUCT_COLUMNS}
             """
             result = await self.database.fetch_one(
                 query=query,
@@ -157,27 +351,231 @@ class SQLAlchemyProductRepository(ProductRepository):
                     "sku": product.sku,
                     "image_url": product.image_url,
                     "description": product.description,
-                    "quantity": product.quantity,
                     "price": product.price,
-                    "updated_at": product.updated_at
+                    "updated_at": product.updated_at,
+                    "reorder_level": product.reorder_level,
+                    "expected_version": expected_version
                 }
             )
 
-            return Product(
-                id=result["id"],
-                name=result["name"],
-                type=result["type"],
-                sku=result["sku"],
-                image_url=result["image_url"],
-                description=result["description"],
-                quantity=result["quantity"],
-                price=Decimal(str(result["price"])),
-                created_at=result["created_at"],
-                updated_at=result["updated_at"]
-            )
+            if not result:
+                return None
+
+            return _to_product(result)
+        except exc.IntegrityError as e:
+            # The NOT EXISTS check cannot see a SKU claimed by a transaction that commits
+            # after this statement started; the unique index still rejects it, and the
+            # caller reports it the same way as a SKU that was already taken
+            if SKU_UNIQUE_INDEX in str(e):
+                return None
+            raise Exception(f"Error updating product: {str(e)}")
         except Exception as e:
             raise Exception(f"Error updating product: {str(e)}")
 
+    async def set_quantity(
+        self,
+        id: int,
+        quantity: int,
+        reason: str = StockMovement.SET,
+        user_id: Optional[int] = None
+    ) -> Optional[Product]:
+        try:
+            # Lock the row to read the quantity being replaced, so the ledger records the
+            # exact delta even when other writers race this one
+            query = f"""
+                WITH previous AS (
+                    SELECT id, quantity FROM products WHERE id = :id FOR UPDATE
+                ),
+                updated AS (
+                    UPDATE products p
+                    SET quantity = :quantity, updated_at = :updated_at, version = p.version + 1
+                    FROM previous
+                    WHERE p.id = previous.id
+                    RETURNING p.id, p.name, p.type, p.sku, p.image_url, p.description, p.quantity, p.price,
+                              p.created_at, p.updated_at, p.reorder_level, p.version,
+                              previous.quantity AS previous_quantity
+                ),
+                movement AS (
+                    INSERT INTO stock_movements (product_id, delta, quantity_after, reason, user_id)
+                    SELECT id, quantity - previous_quantity, quantity, :reason, :user_id
+                    FROM updated WHERE quantity <> previous_quantity
+                )
+                SELECT {PRODUCT_COLUMNS} FROM updated
+            """
+            result = await self.database.fetch_one(
+                query=query,
+                values={
+                    "id": id,
+                    "quantity": quantity,
+                    "updated_at": datetime.utcnow(),
+                    "reason": reason,
+                    "user_id": user_id
+                }
+            )
+
+            if not result:
+                return None
+
+            return _to_product(result)
+        except Exception as e:
+            raise Exception(f"Error setting product quantity: {str(e)}")
+
+    async def update_quantities(
+        self,
+        items: List[Tuple[Optional[int], Optional[str], int]],
+        reason: str = StockMovement.SET,
+        user_id: Optional[int] = None
+    ) -> List[Product]:
+        try:
+            if not items:
+                return []
+
+            # Join the requested rows (by id or by SKU) against products and apply them in
+            # one set-based UPDATE; items keep their request order as position, so if a
+            # product is named twice (even once by id and once by SKU) the last item wins
+            query = f"""
+                WITH requested AS (
+                    SELECT * FROM unnest(
+                        CAST(:ids AS INTEGER[]), CAST(:skus AS VARCHAR[]), CAST(:quantities AS INTEGER[])
+                    ) WITH ORDINALITY AS r(id, sku, quantity, position)
+                ),
+                targets AS (
+                    SELECT DISTINCT ON (id) id, quantity FROM (
+                        SELECT p.id, r.quantity, r.position FROM requested r JOIN products p ON p.id = r.id
+                        UNION ALL
+                        SELECT p.id, r.quantity, r.position FROM requested r JOIN products p ON p.sku = r.sku
+                    ) matched
+                    ORDER BY id, position DESC
+                ),
+                previous AS (
+                    SELECT p.id, p.quantity FROM products p JOIN targets t ON t.id = p.id
+                    ORDER BY p.id
+                    FOR UPDATE OF p
+                ),
+                updated AS (
+                    UPDATE products p
+                    SET quantity = t.quantity, updated_at = :updated_at, version = p.version + 1
+                    FROM targets t JOIN previous ON previous.id = t.id
+                    WHERE p.id = t.id
+                    RETURNING p.id, p.name, p.type, p.sku, p.image_url, p.description, p.quantity, p.price,
+                              p.created_at, p.updated_at, p.reorder_level, p.version,
+                              previous.quantity AS previous_quantity
+                ),
+                movements AS (
+                    INSERT INTO stock_movements (product_id, delta, quantity_after, reason, user_id)
+                    SELECT id, quantity - previous_quantity, quantity, :reason, :user_id
+                    FROM updated WHERE quantity <> previous_quantity
+                )
+                SELECT {PRODUCT_COLUMNS} FROM updated
+            """
+            results = await self.database.fetch_all(
+                query=query,
+                values={
+                    "ids": [id for id, _, _ in items],
+                    "skus": [sku for _, sku, _ in items],
+                    "quantities": [quantity for _, _, quantity in items],
+                    "updated_at": datetime.utcnow(),
+                    "reason": reason,
+                    "user_id": user_id
+                }
+            )
+
+            return _to_products(results)
+        except Exception as e:
+            raise Exception(f"Error updating product quantities: {str(e)}")
+
+    async def adjust_quantity(
+        self,
+        id: int,
+        delta: int,
+        reason: str = StockMovement.ADJUSTED,
+        user_id: Optional[int] = None
+    ) -> Optional[Product]:
+        try:
+            # The guard and the increment run in the same statement, so concurrent
+            # adjustments serialise on the row lock instead of losing updates
+            query = f"""
+                WITH adjusted AS (
+                    UPDATE products
+                    SET quantity = quantity + :delta, updated_at = :updated_at, version = version + 1
+                    WHERE id = :id AND quantity + :delta >= 0
+                    RETURNING {PRODUCT_COLUMNS}
+                ),
+                movement AS (
+                    INSERT INTO stock_movements (product_id, delta, quantity_after, reason, user_id)
+                    SELECT id, :delta, quantity, :reason, :user_id FROM adjusted
+                )
+                SELECT {PRODUCT_COLUMNS} FROM adjusted
+            """
+            result = await self.database.fetch_one(
+                query=query,
+                values={
+                    "id": id,
+                    "delta": delta,
+                    "updated_at": datetime.utcnow(),
+                    "reason": reason,
+                    "user_id": user_id
+                }
+            )
+
+            if not result:
+                return None
+
+            return _to_product(result)
+        except Exception as e:
+            raise Exception(f"Error adjusting product quantity: {str(e)}")
+
+    async def set_reorder_level(self, id: int, reorder_level: int) -> Optional[Product]:
+        try:
+            query = f"""
+                UPDATE products
+                SET reorder_level = :reorder_level, updated_at = :updated_at, version = version + 1
+                WHERE id = :id
+                RETURNING {PRODUCT_COLUMNS}
+            """
+            result = await self.database.fetch_one(
+                query=query,
+                values={"id": id, "reorder_level": reorder_level, "updated_at": datetime.utcnow()}
+            )
+
+            if not result:
+                return None
+
+            return _to_product(result)
+        except Exception as e:
+            raise Exception(f"Error setting reorder level: {str(e)}")
+
+    async def find_low_stock(
+        self,
+        limit: int = 50,
+        after: Optional[Tuple[int, int]] = None,
+        type: Optional[str] = None
+    ) -> List[Product]:
+        try:
+            # The predicate and sort key match the partial index ix_products_low_stock, so
+            # the scan touches only low-stock rows and stops after :limit of them
+            conditions = ["quantity <= reorder_level"]
+            values = {"limit": limit}
+            if type is not None:
+                conditions.append("type = :type")
+                values["type"] = type
+            if after is not None:
+                conditions.append("(quantity - reorder_level, id) > (:shortfall, :id)")
+                values["shortfall"], values["id"] = after
+
+            query = f"""
+                SELECT {PRODUCT_COLUMNS}
+                FROM products
+                WHERE {" AND ".join(conditions)}
+                ORDER BY quantity - reorder_level, id
+                LIMIT :limit
+            """
+            results = await self.database.fetch_all(query=query, values=values)
+
+            return _to_products(results)
+        except Exception as e:
+            raise Exception(f"Error finding low-stock products: {str(e)}")
+
     async def delete(self, id: int) -> bool:
         try:
             # First check if product exists
@@ -191,10 +589,79 @@ class SQLAlchemyProductRepository(ProductRepository):
         except Exception as e:
             raise Exception(f"Error deleting product: {str(e)}")
 
-    async def count(self) -> int:
+    async def find_stock_movements(
+        self,
+        product_id: int,
+        limit: int = 50,
+        before_id: Optional[int] = None
+    ) -> List[StockMovement]:
+        try:
+            query = f"""
+                SELECT {STOCK_MOVEMENT_COLUMNS} FROM stock_movements
+                WHERE product_id = :product_id AND (CAST(:before_id AS BIGINT) IS NULL OR id < :before_id)
+                ORDER BY id DESC
+                LIMIT :limit
+            """
+            results = await self.database.fetch_all(
+                query=query,
+                values={"product_id": product_id, "before_id": before_id, "limit": limit}
+            )
+            return [StockMovement(*row) for row in results]
+        except Exception as e:
+            raise Exception(f"Error finding stock movements: {str(e)}")
+
+    async def quantity_as_of(self, product_id: int, at: datetime) -> Optional[int]:
+        try:
+            # Each movement stores the balance it produced, so this is one index probe on
+            # (product_id, created_at) rather than a replay of the ledger
+            query = """
+                SELECT quantity_after FROM stock_movements
+                WHERE product_id = :product_id AND created_at <= :at
+                ORDER BY created_at DESC, id DESC
+                LIMIT 1
+            """
+            return await self.database.fetch_val(query=query, values={"product_id": product_id, "at": at})
+        except Exception as e:
+            raise Exception(f"Error reading stock as of {at.isoformat()}: {str(e)}")
+
+    async def count(self, filters: Optional[Dict[str, Any]] = None) -> int:
+        try:
+            conditions, values = self._filter_conditions(filters)
+            where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+            query = f"SELECT COUNT(*) as total FROM products {where}"
+            result = await self.database.fetch_one(query=query, values=values)
+            return result.total
+        except Exception as e:
+            raise Exception(f"Error counting products: {str(e)}") 
+
+    async def estimate_count(self, filters: Optional[Dict[str, Any]] = None) -> Optional[int]:
+        try:
+            conditions, values = self._filter_conditions(filters)
+            if conditions:
+                # The planner's row estimate for the filtered scan: no rows are read
+                query = f"EXPLAIN (FORMAT JSON) SELECT 1 FROM products WHERE {' AND '.join(conditions)}"
+                plan = await self.database.fetch_val(query=query, values=values)
+                if isinstance(plan, str):
+                    plan = json.loads(plan)
+                return int(plan[0]["Plan"]["Plan Rows"])
+
+            # reltuples is maintained by VACUUM/ANALYZE and is -1 until the table is first analyzed
+            query = "SELECT CAST(reltuples AS BIGINT) AS estimate FROM pg_class WHERE oid = CAST('products' AS regclass)"
+            result = await self.database.fetch_one(query=query)
+            if not result or result.estimate < 0:
+                return None
+            return result.estimate
+        except Exception as e:
+            raise Exception(f"Error estimating product count: {str(e)}")
+
+    async def catalog_version(self) -> Tuple[int, datetime]:
         try:
-            query = "SELECT COUNT(*) as total FROM products"
+            # Striped counters maintained by the products_bump_catalog_version_* statement
+            # triggers; each stripe only grows, so their sum does too
+            query = "SELECT CAST(sum(version) AS BIGINT) AS version, max(updated_at) AS updated_at FROM catalog_state"
             result = await self.database.fetch_one(query=query)
-            return result["total"]
+            if result.version is None:
+                raise Exception("catalog_state is not initialised")
+            return result.version, result.updated_at
         except Exception as e:
-            raise Exception(f"Error counting products: {str(e)}") 
\ No newline at end of file
+            raise Exception(f"Error reading catalog version: {str(e)}")
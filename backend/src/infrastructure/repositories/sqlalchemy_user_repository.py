@@ -1,8 +1,17 @@
 from typing import Optional
-from databases import Database
+from src.infrastructure.database.database import Database
 from src.domain.entities.user import User
 from src.domain.repositories.user_repository import UserRepository
-from src.infrastructure.database.models.user import UserModel
+from src.infrastructure.cache.user_cache import user_cache
+
+
+# Selected in User constructor order so rows map onto entities positionally
+USER_COLUMNS = "id, username, password_hash, created_at, updated_at"
+
+
+def _to_user(row) -> User:
+    """Map a row selected as USER_COLUMNS to a User entity"""
+    return User(*row[:len(User.__slots__)])
 
 
 class SQLAlchemyUserRepository(UserRepository):
@@ -11,8 +20,8 @@ class SQLAlchemyUserRepository(UserRepository):
 
     async def find_by_username(self, username: str) -> Optional[User]:
         try:
-            query = """
-                SELECT id, username, password_hash, created_at, updated_at 
+            query = f"""
+                SELECT {USER_COLUMNS}
                 FROM users WHERE username = :username
             """
             result = await self.database.fetch_one(
@@ -22,20 +31,14 @@ class SQLAlchemyUserRepository(UserRepository):
             if not result:
                 return None
 
-            return User(
-                id=result["id"],
-                username=result["username"],
-                password_hash=result["password_hash"],
-                created_at=result["created_at"],
-                updated_at=result["updated_at"]
-            )
+            return _to_user(result)
         except Exception as e:
             raise Exception(f"Error finding user by username: {str(e)}")
 
     async def find_by_id(self, id: int) -> Optional[User]:
         try:
-            query = """
-                SELECT id, username, password_hash, created_at, updated_at 
+            query = f"""
+                SELECT {USER_COLUMNS}
                 FROM users WHERE id = :id
             """
             result = await self.database.fetch_one(
@@ -45,22 +48,17 @@ class SQLAlchemyUserRepository(UserRepository):
             if not result:
                 return None
 
-            return User(
-                id=result["id"],
-                username=result["username"],
-                password_hash=result["password_hash"],
-                created_at=result["created_at"],
-                updated_at=result["updated_at"]
-            )
+            return _to_user(result)
         except Exception as e:
             raise Exception(f"Error finding user by ID: {str(e)}")
 
-    async def create(self, user: User) -> User:
+    async def create(self, user: User) -> Optional[User]:
         try:
-            query = """
+            query = f"""
                 INSERT INTO users (username, password_hash, created_at, updated_at)
                 VALUES (:username, :password_hash, :created_at, :updated_at)
-                RETURNING id, username, password_hash, created_at, updated_at
+                ON CONFLICT (username) DO NOTHING
+                RETURNING {USER_COLUMNS}
             """
             result = await self.database.fetch_one(
                 query=query,
@@ -72,13 +70,10 @@ class SQLAlchemyUserRepository(UserRepository):
                 }
             )
 
-            return User(
-                id=result["id"],
-                username=result["username"],
-                password_hash=result["password_hash"],
-                created_at=result["created_at"],
-                updated_at=result["updated_at"]
-            )
+            if not result:
+                return None
+
+            return _to_user(result)
         except Exception as e:
             raise Exception(f"Error creating user: {str(e)}")
 
@@ -89,11 +84,11 @@ class SQLAlchemyUserRepository(UserRepository):
             if not existing:
                 raise Exception("User not found")
 
-            query = """
+            query = f"""
                 UPDATE users 
                 SET username = :username, password_hash = :password_hash, updated_at = :updated_at
                 WHERE id = :id
-                RETURNING id, username, password_hash, created_at, updated_at
+                RETURNING {USER_COLUMNS}
             """
             result = await self.database.fetch_one(
                 query=query,
@@ -104,14 +99,9 @@ class SQLAlchemyUserRepository(UserRepository):
                     "updated_at": user.updated_at
                 }
             )
+            user_cache.invalidate(user.id)
 
-            return User(
-                id=result["id"],
-                username=result["username"],
-                password_hash=result["password_hash"],
-                created_at=result["created_at"],
-                updated_at=result["updated_at"]
-            )
+            return _to_user(result)
         except Exception as e:
             raise Exception(f"Error updating user: {str(e)}")
 
@@ -124,6 +114,7 @@ class SQLAlchemyUserRepository(UserRepository):
 
             query = "DELETE FROM users WHERE id = :id"
             await self.database.execute(query=query, values={"id": id})
+            user_cache.invalidate(id)
             return True
         except Exception as e:
             raise Exception(f"Error deleting user: {str(e)}") 
\ No newline at end of file
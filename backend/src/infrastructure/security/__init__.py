@@ -0,0 +1,3 @@
+from .password_hasher import PasswordHasher, PasswordHasherBusyError, password_hasher
+
+__all__ = ["PasswordHasher", "PasswordHasherBusyError", "password_hasher"]
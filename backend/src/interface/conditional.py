@@ -0,0 +1,70 @@
+import hashlib
+import json
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Optional
+
+# Let clients and proxies keep a copy, but revalidate it on every use
+CACHE_CONTROL = "private, no-cache"
+
+
+def _as_utc(value: datetime) -> datetime:
+    # Naive timestamps are written with datetime.utcnow(), so they are already UTC
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def catalog_etag(version: int, **params) -> str:
+    """Strong validator for a catalog read: the catalog version plus the query that shaped the body"""
+    digest = hashlib.sha1(json.dumps(params, sort_keys=True, default=str).encode()).hexdigest()[:16]
+    return f'"{version}-{digest}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match uses the weak comparison, so a W/ prefix on the client's copy is ignored"""
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
+
+
+def product_etag(version: int) -> str:
+    """Strong validator for a single product: its row version"""
+    return f'"{version}"'
+
+
+def if_match_version(if_match: str) -> Optional[int]:
+    """Row version an If-Match header requires, or None for "*" (any current version)
+
+    If-Match uses the strong comparison, so weak tags and anything that is not one of our
+    product ETags can never match and raise ValueError.
+    """
+    if_match = if_match.strip()
+    if if_match == "*":
+        return None
+    if not (len(if_match) > 2 and if_match.startswith('"') and if_match.endswith('"')):
+        raise ValueError("If-Match must be a single product ETag or *")
+    try:
+        return int(if_match[1:-1])
+    except ValueError:
+        raise ValueError("If-Match must be a single product ETag or *")
+
+
+def http_date(value: datetime) -> str:
+    """Format a timestamp as an IMF-fixdate for Last-Modified"""
+    return format_datetime(_as_utc(value).replace(microsecond=0), usegmt=True)
+
+
+def not_modified_since(if_modified_since: Optional[str], last_modified: datetime) -> bool:
+    """True when the client's copy is at least as new as last_modified (HTTP dates have 1s resolution)"""
+    if not if_modified_since:
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    return _as_utc(last_modified).replace(microsecond=0) <= _as_utc(since)
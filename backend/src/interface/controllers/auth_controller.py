@@ -1,8 +1,9 @@
 from fastapi import HTTPException, Depends
-from databases import Database
+from src.infrastructure.database.database import Database
 from src.application.usecases.auth import RegisterUserUseCase, LoginUserUseCase
 from src.infrastructure.repositories import SQLAlchemyUserRepository
 from src.infrastructure.database.connection import get_database
+from src.infrastructure.security.password_hasher import PasswordHasherBusyError
 from src.interface.schemas.auth_schemas import (
     UserRegisterRequest, 
     UserLoginRequest, 
@@ -35,6 +36,8 @@ class AuthController:
                 message="User registered successfully",
                 data=user_data
             )
+        except PasswordHasherBusyError as e:
+            raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "1"})
         except ValueError as e:
             if "already exists" in str(e):
                 raise HTTPException(status_code=409, detail=str(e))
@@ -61,6 +64,8 @@ class AuthController:
                 message="Login successful",
                 data=result
             )
+        except PasswordHasherBusyError as e:
+            raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "1"})
         except ValueError as e:
             if "Invalid credentials" in str(e):
                 raise HTTPException(status_code=401, detail=str(e))
@@ -1,35 +1,116 @@
-from fastapi import HTTPException, Depends, Query
-from databases import Database
+from datetime import datetime
+from decimal import Decimal
+from fastapi import HTTPException, Depends, Query, Request, Response
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from src.infrastructure.database.database import Database
+from pydantic import TypeAdapter, ValidationError
 from src.application.usecases.products import (
     CreateProductUseCase, 
+    GetProductUseCase,
     GetProductsUseCase, 
-    UpdateProductQuantityUseCase
+    UpdateProductUseCase,
+    GetLowStockProductsUseCase,
+    GetStockHistoryUseCase,
+    UpdateProductQuantityUseCase,
+    BulkImportProductsUseCase,
+    ExportProductsUseCase,
+    SearchProductsUseCase,
+    LookupProductsUseCase
 )
-from src.infrastructure.repositories import SQLAlchemyProductRepository
+from src.domain.repositories import DEFAULT_PRODUCT_SORT
+from src.infrastructure.repositories import SQLAlchemyProductRepository, CachedProductRepository
+from src.infrastructure.cache.product_cache import product_cache
+from src.infrastructure.cache.page_cache import page_cache, page_flight
 from src.infrastructure.database.connection import get_database
 from src.interface.schemas.product_schemas import (
     ProductCreateRequest,
+    ProductUpdateRequest,
     UpdateQuantityRequest,
+    AdjustQuantityRequest,
+    UpdateReorderLevelRequest,
+    BatchUpdateQuantityRequest,
+    ProductLookupRequest,
     StandardResponse,
-    ProductResponse
+    PRODUCT_LIST_RESPONSE,
+    PRODUCT_SEARCH_RESPONSE,
+    encode_response
 )
-from typing import List
+from src.interface.streaming import (
+    iter_ndjson_rows,
+    iter_csv_rows,
+    encode_ndjson,
+    encode_csv,
+    gzip_chunks
+)
+from src.interface.conditional import (
+    CACHE_CONTROL,
+    catalog_etag,
+    etag_matches,
+    http_date,
+    if_match_version,
+    not_modified_since,
+    product_etag
+)
+from typing import AsyncIterator, Awaitable, Callable, List, Optional, Tuple
+
+NDJSON_CONTENT_TYPES = {"application/x-ndjson", "application/ndjson", "application/jsonl"}
+CSV_CONTENT_TYPES = {"text/csv", "application/csv"}
+EXPORT_FORMATS = {
+    "ndjson": (encode_ndjson, "application/x-ndjson"),
+    "csv": (encode_csv, "text/csv"),
+}
 
 
 class ProductController:
     def __init__(self):
         pass
 
+    @staticmethod
+    def _product_repository(database: Database) -> CachedProductRepository:
+        """Product repository backed by the shared in-process product cache"""
+        return CachedProductRepository(
+            SQLAlchemyProductRepository(database), product_cache, populate=not database.read_only
+        )
+
+    @staticmethod
+    async def _cached_page(key: tuple, load: Callable[[], Awaitable[dict]], response: TypeAdapter) -> bytes:
+        """Serialized response body for a versioned key: cached, else one load shared by concurrent requests"""
+        body = page_cache.get(key)
+        if body is not None:
+            return body
+
+        async def fill() -> bytes:
+            # The route returns raw bytes, which FastAPI does not check against its response_model,
+            # so validate against that schema here; once per cache fill, not per request
+            body = encode_response(response, await load())
+            page_cache.set(key, body)
+            return body
+
+        return await page_flight.do(key, fill)
+
+    @staticmethod
+    async def _page_database(database: Database, primary_database: Database, version: int) -> Database:
+        """Database to load a page of catalog `version` from: the replica once it has replayed that version
+
+        The version is read from the primary so cached pages never predate a client's own
+        writes; a lagging replica would otherwise fill that key with older rows.
+        """
+        if database is primary_database:
+            return database
+        replica_version, _ = await SQLAlchemyProductRepository(database).catalog_version()
+        return database if replica_version >= version else primary_database
+
     async def create_product(
         self, 
         request: ProductCreateRequest, 
-        database: Database = Depends(get_database)
+        database: Database = Depends(get_database),
+        user_id: Optional[int] = None
     ) -> StandardResponse:
         try:
-            product_repository = SQLAlchemyProductRepository(database)
+            product_repository = self._product_repository(database)
             create_usecase = CreateProductUseCase(product_repository)
             
-            product_data = await create_usecase.execute(request.dict())
+            product_data = await create_usecase.execute(request.dict(), user_id)
             
             return StandardResponse(
                 success=True,
@@ -43,39 +124,280 @@ class ProductController:
         except Exception as e:
             raise HTTPException(status_code=500, detail="Internal server error")
 
+    async def bulk_import_products(
+        self,
+        request: Request,
+        batch_size: int,
+        database: Database = Depends(get_database),
+        user_id: Optional[int] = None
+    ) -> StandardResponse:
+        content_type = request.headers.get("content-type", "").split(";")[0].strip().lower()
+        if content_type in NDJSON_CONTENT_TYPES:
+            rows = iter_ndjson_rows(request.stream())
+        elif content_type in CSV_CONTENT_TYPES:
+            rows = iter_csv_rows(request.stream())
+        else:
+            raise HTTPException(
+                status_code=415,
+                detail="Content-Type must be application/x-ndjson or text/csv"
+            )
+
+        try:
+            product_repository = self._product_repository(database)
+            bulk_usecase = BulkImportProductsUseCase(product_repository)
+
+            result = await bulk_usecase.execute(self._validate_import_rows(rows), batch_size, user_id)
+
+            return StandardResponse(
+                success=True,
+                message=f"Imported {result['inserted']} of {result['received']} products",
+                data=result
+            )
+        except ValueError as e:
+            if "too long" in str(e):
+                raise HTTPException(status_code=413, detail=str(e))
+            raise HTTPException(status_code=400, detail=str(e))
+        except Exception as e:
+            raise HTTPException(status_code=500, detail="Internal server error")
+
+    @staticmethod
+    async def _validate_import_rows(
+        rows: AsyncIterator[Tuple[int, Optional[dict]]]
+    ) -> AsyncIterator[Tuple[int, Optional[dict], Optional[str]]]:
+        """Apply the ProductCreateRequest rules to each imported row"""
+        async for row_number, row in rows:
+            if row is None:
+                yield row_number, None, "Row could not be parsed"
+                continue
+            try:
+                yield row_number, ProductCreateRequest(**row).dict(), None
+            except ValidationError as e:
+                message = "; ".join(
+                    f"{' -> '.join(str(loc) for loc in error['loc'])}: {error['msg']}"
+                    for error in e.errors()
+                )
+                yield row_number, row, message
+
     async def get_products(
         self,
         page: int = Query(1, ge=1, description="Page number"),
         limit: int = Query(10, ge=1, le=100, description="Items per page"),
+        cursor: Optional[str] = Query(None, description="Opaque cursor from a previous next_cursor"),
+        total: str = Query("estimate", description="How to count products: exact, estimate or none"),
+        if_none_match: Optional[str] = None,
+        database: Database = Depends(get_database),
+        type: Optional[str] = None,
+        min_price: Optional[Decimal] = None,
+        max_price: Optional[Decimal] = None,
+        min_quantity: Optional[int] = None,
+        max_quantity: Optional[int] = None,
+        updated_since: Optional[datetime] = None,
+        sort: str = DEFAULT_PRODUCT_SORT,
+        primary_database: Optional[Database] = None
+    ) -> Response:
+        try:
+            options = {
+                "page": page,
+                "limit": limit,
+                "cursor": cursor,
+                "total": total,
+                "type": type,
+                "min_price": min_price,
+                "max_price": max_price,
+                "min_quantity": min_quantity,
+                "max_quantity": max_quantity,
+                "updated_since": updated_since,
+                "sort": sort,
+            }
+            primary_database = primary_database or database
+
+            # Answer revalidations from the version row alone, before any rows are read or serialized
+            version, modified_at = await GetProductsUseCase(self._product_repository(primary_database)).version()
+            headers = {
+                "ETag": catalog_etag(version, **options),
+                "Last-Modified": http_date(modified_at),
+                "Cache-Control": CACHE_CONTROL,
+            }
+            if etag_matches(if_none_match, headers["ETag"]):
+                return Response(status_code=304, headers=headers)
+            
+            async def load() -> dict:
+                page_database = await self._page_database(database, primary_database, version)
+                result = await GetProductsUseCase(self._product_repository(page_database)).execute(options)
+                return {
+                    "success": True,
+                    "message": "Products retrieved successfully",
+                    "data": {
+                        "products": result["products"],
+                        "page": page,
+                        "limit": limit,
+                        "next_cursor": result["next_cursor"],
+                        "total": result["total"],
+                        "total_mode": result["total_mode"]
+                    }
+                }
+
+            # The ETag already identifies the catalog version and every parameter that shapes the body
+            body = await self._cached_page(("products", headers["ETag"]), load, PRODUCT_LIST_RESPONSE)
+            return Response(content=body, media_type="application/json", headers=headers)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        except Exception as e:
+            raise HTTPException(status_code=500, detail="Internal server error")
+
+    async def get_product(
+        self,
+        product_id: int,
+        if_modified_since: Optional[str] = None,
+        response: Optional[Response] = None,
         database: Database = Depends(get_database)
     ) -> StandardResponse:
         try:
-            product_repository = SQLAlchemyProductRepository(database)
-            get_usecase = GetProductsUseCase(product_repository)
-            
-            products = await get_usecase.execute({"page": page, "limit": limit})
-            
+            product_repository = self._product_repository(database)
+            get_usecase = GetProductUseCase(product_repository)
+
+            product = await get_usecase.execute(product_id)
+
+            last_modified = datetime.fromisoformat(product["updated_at"])
+            headers = {
+                "ETag": product_etag(product["version"]),
+                "Last-Modified": http_date(last_modified),
+                "Cache-Control": CACHE_CONTROL,
+            }
+            if not_modified_since(if_modified_since, last_modified):
+                return Response(status_code=304, headers=headers)
+            if response is not None:
+                response.headers.update(headers)
+
             return StandardResponse(
                 success=True,
-                message="Products retrieved successfully",
-                data={"products": products, "page": page, "limit": limit}
+                message="Product retrieved successfully",
+                data=product
             )
         except ValueError as e:
+            if "not found" in str(e):
+                raise HTTPException(status_code=404, detail=str(e))
             raise HTTPException(status_code=400, detail=str(e))
         except Exception as e:
             raise HTTPException(status_code=500, detail="Internal server error")
 
+    async def get_low_stock_products(
+        self,
+        limit: int,
+        cursor: Optional[str],
+        type: Optional[str],
+        database: Database = Depends(get_database)
+    ) -> ORJSONResponse:
+        try:
+            product_repository = self._product_repository(database)
+            low_stock_usecase = GetLowStockProductsUseCase(product_repository)
+
+            result = await low_stock_usecase.execute(limit, cursor, type)
+
+            return ORJSONResponse(
+                content={
+                    "success": True,
+                    "message": "Low-stock products retrieved successfully",
+                    "data": {
+                        "products": result["products"],
+                        "limit": limit,
+                        "type": type,
+                        "next_cursor": result["next_cursor"]
+                    }
+                }
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        except Exception as e:
+            raise HTTPException(status_code=500, detail="Internal server error")
+
+    async def search_products(
+        self,
+        q: str,
+        limit: int,
+        database: Database = Depends(get_database),
+        primary_database: Optional[Database] = None
+    ) -> Response:
+        try:
+            primary_database = primary_database or database
+
+            async def load() -> dict:
+                page_database = await self._page_database(database, primary_database, version)
+                search_usecase = SearchProductsUseCase(self._product_repository(page_database))
+                result = await search_usecase.execute({"q": q, "limit": limit})
+                return {
+                    "success": True,
+                    "message": "Products retrieved successfully",
+                    "data": {"products": result["products"], "q": q, "limit": limit}
+                }
+
+            version, _ = await SearchProductsUseCase(self._product_repository(primary_database)).version()
+            body = await self._cached_page(("search", version, q, limit), load, PRODUCT_SEARCH_RESPONSE)
+            return Response(content=body, media_type="application/json")
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        except Exception as e:
+            raise HTTPException(status_code=500, detail="Internal server error")
+
+    async def lookup_products(
+        self,
+        request: ProductLookupRequest,
+        database: Database = Depends(get_database)
+    ) -> ORJSONResponse:
+        try:
+            product_repository = self._product_repository(database)
+            lookup_usecase = LookupProductsUseCase(product_repository)
+
+            result = await lookup_usecase.execute(request.ids, request.skus)
+
+            return ORJSONResponse(
+                content={
+                    "success": True,
+                    "message": f"Found {len(result['products'])} products",
+                    "data": result
+                }
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        except Exception as e:
+            raise HTTPException(status_code=500, detail="Internal server error")
+
+    def export_products(
+        self,
+        format: str,
+        gzip: bool,
+        batch_size: int,
+        database: Database = Depends(get_database)
+    ) -> StreamingResponse:
+        if format not in EXPORT_FORMATS:
+            raise HTTPException(status_code=400, detail="Format must be ndjson or csv")
+
+        encode, media_type = EXPORT_FORMATS[format]
+        product_repository = self._product_repository(database)
+        export_usecase = ExportProductsUseCase(product_repository)
+
+        body = encode(export_usecase.execute(batch_size))
+        headers = {"Content-Disposition": f'attachment; filename="products.{format}"'}
+        if gzip:
+            body = gzip_chunks(body)
+            headers["Content-Encoding"] = "gzip"
+
+        return StreamingResponse(body, media_type=media_type, headers=headers)
+
     async def update_product_quantity(
         self,
         product_id: int,
         request: UpdateQuantityRequest,
-        database: Database = Depends(get_database)
+        database: Database = Depends(get_database),
+        user_id: Optional[int] = None
     ) -> StandardResponse:
         try:
-            product_repository = SQLAlchemyProductRepository(database)
+            product_repository = self._product_repository(database)
             update_usecase = UpdateProductQuantityUseCase(product_repository)
             
-            updated_product = await update_usecase.execute(product_id, request.quantity)
+            updated_product = await update_usecase.execute(
+                product_id, request.quantity, request.reason, user_id
+            )
             
             return StandardResponse(
                 success=True,
@@ -87,4 +409,166 @@ class ProductController:
                 raise HTTPException(status_code=404, detail=str(e))
             raise HTTPException(status_code=400, detail=str(e))
         except Exception as e:
-            raise HTTPException(status_code=500, detail="Internal server error") 
\ No newline at end of file
+            raise HTTPException(status_code=500, detail="Internal server error")
+
+    async def adjust_product_quantity(
+        self,
+        product_id: int,
+        request: AdjustQuantityRequest,
+        database: Database = Depends(get_database),
+        user_id: Optional[int] = None
+    ) -> StandardResponse:
+        try:
+            product_repository = self._product_repository(database)
+            update_usecase = UpdateProductQuantityUseCase(product_repository)
+            
+            adjusted_product = await update_usecase.adjust(
+                product_id, request.delta, request.reason, user_id
+            )
+            
+            return StandardResponse(
+                success=True,
+                message="Product quantity adjusted successfully",
+                data=adjusted_product
+            )
+        except ValueError as e:
+            if "not found" in str(e):
+                raise HTTPException(status_code=404, detail=str(e))
+            if "Insufficient stock" in str(e):
+                raise HTTPException(status_code=409, detail=str(e))
+            raise HTTPException(status_code=400, detail=str(e))
+        except Exception as e:
+            raise HTTPException(status_code=500, detail="Internal server error")
+
+    async def update_product(
+        self,
+        product_id: int,
+        request: ProductUpdateRequest,
+        if_match: Optional[str] = None,
+        response: Optional[Response] = None,
+        database: Database = Depends(get_database)
+    ) -> StandardResponse:
+        # Without a version to compare, concurrent editors would silently overwrite each other
+        if not if_match:
+            raise HTTPException(status_code=428, detail="If-Match header is required")
+        try:
+            expected_version = if_match_version(if_match)
+        except ValueError as e:
+            raise HTTPException(status_code=412, detail=str(e))
+
+        try:
+            product_repository = self._product_repository(database)
+            update_usecase = UpdateProductUseCase(product_repository)
+
+            updated_product = await update_usecase.execute(product_id, request.dict(), expected_version)
+            if response is not None:
+                response.headers["ETag"] = product_etag(updated_product["version"])
+
+            return StandardResponse(
+                success=True,
+                message="Product updated successfully",
+                data=updated_product
+            )
+        except ValueError as e:
+            if "not found" in str(e):
+                raise HTTPException(status_code=404, detail=str(e))
+            if "has been modified" in str(e):
+                raise HTTPException(status_code=412, detail=str(e))
+            if "already exists" in str(e):
+                raise HTTPException(status_code=409, detail=str(e))
+            raise HTTPException(status_code=400, detail=str(e))
+        except Exception as e:
+            raise HTTPException(status_code=500, detail="Internal server error")
+
+    async def update_reorder_level(
+        self,
+        product_id: int,
+        request: UpdateReorderLevelRequest,
+        database: Database = Depends(get_database)
+    ) -> StandardResponse:
+        try:
+            product_repository = self._product_repository(database)
+            update_usecase = UpdateProductQuantityUseCase(product_repository)
+
+            updated_product = await update_usecase.set_reorder_level(product_id, request.reorder_level)
+
+            return StandardResponse(
+                success=True,
+                message="Reorder level updated successfully",
+                data=updated_product
+            )
+        except ValueError as e:
+            if "not found" in str(e):
+                raise HTTPException(status_code=404, detail=str(e))
+            raise HTTPException(status_code=400, detail=str(e))
+        except Exception as e:
+            raise HTTPException(status_code=500, detail="Internal server error")
+
+    async def update_product_quantities(
+        self,
+        request: BatchUpdateQuantityRequest,
+        database: Database = Depends(get_database),
+        user_id: Optional[int] = None
+    ) -> StandardResponse:
+        try:
+            product_repository = self._product_repository(database)
+            update_usecase = UpdateProductQuantityUseCase(product_repository)
+            
+            result = await update_usecase.execute_batch(
+                [item.dict() for item in request.items], request.reason, user_id
+            )
+            
+            return StandardResponse(
+                success=True,
+                message=f"Updated {len(result['products'])} product quantities",
+                data=result
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        except Exception as e:
+            raise HTTPException(status_code=500, detail="Internal server error")
+
+    async def get_stock_movements(
+        self,
+        product_id: int,
+        limit: int,
+        before_id: Optional[int],
+        database: Database = Depends(get_database)
+    ) -> StandardResponse:
+        try:
+            product_repository = self._product_repository(database)
+            history_usecase = GetStockHistoryUseCase(product_repository)
+
+            result = await history_usecase.movements(product_id, limit, before_id)
+
+            return StandardResponse(
+                success=True,
+                message="Stock movements retrieved successfully",
+                data=result
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        except Exception as e:
+            raise HTTPException(status_code=500, detail="Internal server error")
+
+    async def get_stock_as_of(
+        self,
+        product_id: int,
+        at: datetime,
+        database: Database = Depends(get_database)
+    ) -> StandardResponse:
+        try:
+            product_repository = self._product_repository(database)
+            history_usecase = GetStockHistoryUseCase(product_repository)
+
+            result = await history_usecase.quantity_as_of(product_id, at)
+
+            return StandardResponse(
+                success=True,
+                message="Stock level retrieved successfully",
+                data=result
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        except Exception as e:
+            raise HTTPException(status_code=500, detail="Internal server error")
@@ -2,10 +2,10 @@ import os
 from typing import Optional
 from fastapi import HTTPException, Depends, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from jose import JWTError, jwt
-from databases import Database
+from src.infrastructure.database.database import Database
 from src.infrastructure.repositories import SQLAlchemyUserRepository
 from src.infrastructure.database.connection import get_database
+from src.infrastructure.cache.user_cache import user_cache
 from src.domain.entities.user import User
 
 security = HTTPBearer()
@@ -15,6 +15,9 @@ async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
     database: Database = Depends(get_database)
 ) -> User:
+    # Deferred: python-jose pulls in the cryptography backends, which slows cold starts
+    from jose import JWTError, jwt
+
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Invalid authentication credentials",
@@ -35,14 +38,18 @@ async def get_current_user(
     except JWTError:
         raise credentials_exception
     
-    # Verify user still exists
-    user_repository = SQLAlchemyUserRepository(database)
-    user = await user_repository.find_by_id(int(user_id))
+    # Verify user still exists (recently verified users are served from the cache)
+    user = user_cache.get(int(user_id))
     if user is None:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="User not found"
-        )
+        generation = user_cache.generation
+        user_repository = SQLAlchemyUserRepository(database)
+        user = await user_repository.find_by_id(int(user_id))
+        if user is None:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="User not found"
+            )
+        user_cache.set(user.id, user, generation)
     
     return user
 
@@ -13,7 +13,8 @@ async def http_exception_handler(request: Request, exc: HTTPException):
             "success": False,
             "message": exc.detail,
             **({"stack": str(exc)} if os.getenv("ENV") == "development" else {})
-        }
+        },
+        headers=getattr(exc, "headers", None)
     )
 
 
@@ -1,5 +1,5 @@
 from fastapi import APIRouter, Depends
-from databases import Database
+from src.infrastructure.database.database import Database
 from src.interface.controllers.auth_controller import AuthController
 from src.interface.schemas.auth_schemas import (
     UserRegisterRequest,
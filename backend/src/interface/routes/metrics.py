@@ -0,0 +1,55 @@
+from fastapi import APIRouter, Depends
+from src.infrastructure.cache.user_cache import user_cache
+from src.infrastructure.cache.product_cache import product_cache
+from src.infrastructure.cache.page_cache import page_cache, page_flight
+from src.infrastructure.cache.invalidation import cache_invalidation_listener
+from src.infrastructure.security.password_hasher import password_hasher
+from src.infrastructure.database.connection import database, replica_router
+from src.interface.middleware.auth_middleware import get_current_user
+
+# Pool sizes, lag and cache internals are operational detail: authenticated callers only
+metrics_router = APIRouter(dependencies=[Depends(get_current_user)])
+
+
+@metrics_router.get("/cache")
+async def cache_metrics():
+    """
+    In-process cache statistics for this worker (Authentication required)
+    
+    - **user_cache**: Authenticated user lookups made by `get_current_user`
+    - **product_cache**: Product lookups by id and SKU, including estimated memory use
+    - **page_cache**: Serialized `GET /products` and search responses, keyed by catalog version
+    - **page_flight**: Identical list/search queries coalesced onto one in-flight database fetch
+    - **invalidation**: Cross-worker invalidations received over Postgres LISTEN/NOTIFY
+    """
+    return {
+        "user_cache": user_cache.stats(),
+        "product_cache": product_cache.stats(),
+        "page_cache": page_cache.stats(),
+        "page_flight": page_flight.stats(),
+        "invalidation": cache_invalidation_listener.stats(),
+    }
+
+
+@metrics_router.get("/auth")
+async def auth_metrics():
+    """
+    Password hashing pool statistics for this worker (Authentication required)
+    
+    - **pending**: Hash/verify operations queued or running
+    - **rejected**: Requests turned away with 503 because the queue was full
+    """
+    return {"password_hasher": password_hasher.stats()}
+
+
+@metrics_router.get("/db")
+async def db_metrics():
+    """
+    Database connection pool statistics for this worker (Authentication required)
+    
+    - **size** / **idle** / **in_use**: Open connections, connections waiting in the pool, and checked-out connections
+    - **acquire_wait_ms_avg** / **acquire_wait_ms_max**: Time spent waiting for a free connection
+    - **acquire_timeouts**: Acquires that gave up after **acquire_timeout_seconds**
+    - **replica**: Read replica lag, routing counts and pool (when DATABASE_REPLICA_URL is set)
+    """
+    return {"pool": database.pool_stats(), "replica": replica_router.stats()}
@@ -1,14 +1,27 @@
-from fastapi import APIRouter, Depends, Query
-from databases import Database
+from datetime import datetime
+from decimal import Decimal
+from typing import Optional
+from fastapi import APIRouter, Depends, Header, Query, Request, Response
+from src.infrastructure.database.database import Database
 from src.interface.controllers.product_controller import ProductController
 from src.interface.schemas.product_schemas import (
     ProductCreateRequest,
+    ProductUpdateRequest,
     UpdateQuantityRequest,
-    StandardResponse
+    AdjustQuantityRequest,
+    UpdateReorderLevelRequest,
+    BatchUpdateQuantityRequest,
+    ProductLookupRequest,
+    StandardResponse,
+    ProductListResponse,
+    ProductSearchResponse,
+    ProductLookupResponse,
+    ProductLowStockResponse
 )
 from src.interface.middleware.auth_middleware import get_current_user
-from src.infrastructure.database.connection import get_database
+from src.infrastructure.database.connection import get_database, get_read_database
 from src.domain.entities.user import User
+from src.domain.repositories import PRODUCT_SORTS, DEFAULT_PRODUCT_SORT
 
 products_router = APIRouter()
 product_controller = ProductController()
@@ -31,23 +44,162 @@ async def create_product(
     - **quantity**: Product quantity (must be non-negative)
     - **price**: Product price (must be non-negative)
     """
-    return await product_controller.create_product(request, database)
+    return await product_controller.create_product(request, database, current_user.id)
 
 
-@products_router.get("/", response_model=StandardResponse)
+@products_router.post("/bulk", response_model=StandardResponse)
+async def bulk_import_products(
+    request: Request,
+    batch_size: int = Query(1000, ge=1, le=5000, description="Rows per INSERT batch"),
+    database: Database = Depends(get_database),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Bulk import products from a streamed NDJSON or CSV body (Authentication required)
+    
+    - **Content-Type**: `application/x-ndjson` (one product object per line) or `text/csv` (header row required)
+    - Each row follows the same rules as `POST /products`
+    - Rows are inserted in batches of **batch_size**; existing SKUs are skipped and reported per row
+    - A line (or quoted CSV record) longer than 64 KiB aborts the import with 413
+    """
+    return await product_controller.bulk_import_products(request, batch_size, database, current_user.id)
+
+
+@products_router.post("/lookup", response_model=ProductLookupResponse)
+async def lookup_products(
+    request: ProductLookupRequest,
+    database: Database = Depends(get_read_database),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Get many products by ID and/or SKU in one query (Authentication required)
+    
+    - **ids**: Product IDs to fetch
+    - **skus**: Product SKUs to fetch (at most 5000 ids and SKUs together)
+    - Products come back in request order, ids first; unknown keys are reported in
+      **not_found_ids** / **not_found_skus**
+    """
+    return await product_controller.lookup_products(request, database)
+
+
+@products_router.get("/", response_model=ProductListResponse)
 async def get_products(
     page: int = Query(1, ge=1, description="Page number"),
     limit: int = Query(10, ge=1, le=100, description="Items per page"),
-    database: Database = Depends(get_database),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from a previous next_cursor"),
+    total: str = Query("estimate", pattern="^(exact|estimate|none)$", description="How to count products"),
+    type: Optional[str] = Query(None, max_length=50, description="Only products of this type"),
+    min_price: Optional[Decimal] = Query(None, ge=0, description="Minimum price (inclusive)"),
+    max_price: Optional[Decimal] = Query(None, ge=0, description="Maximum price (inclusive)"),
+    min_quantity: Optional[int] = Query(None, ge=0, description="Minimum quantity (inclusive)"),
+    max_quantity: Optional[int] = Query(None, ge=0, description="Maximum quantity (inclusive)"),
+    updated_since: Optional[datetime] = Query(None, description="Only products updated at or after this time"),
+    sort: str = Query(DEFAULT_PRODUCT_SORT, description="Sort order: " + ", ".join(PRODUCT_SORTS)),
+    if_none_match: Optional[str] = Header(None),
+    database: Database = Depends(get_read_database),
+    primary_database: Database = Depends(get_database),
     current_user: User = Depends(get_current_user)
 ):
     """
-    Get all products with pagination (Authentication required)
+    Get all products with pagination, filtering and sorting (Authentication required)
     
     - **page**: Page number (default: 1)
     - **limit**: Items per page (default: 10, max: 100)
+    - **cursor**: Continue after the last item of a previous page; takes precedence over page.
+      A cursor only continues the sort it was issued for
+    - **type**, **min_price**, **max_price**, **min_quantity**, **max_quantity**, **updated_since**:
+      Optional filters, combined with AND; ranges are inclusive. An **updated_since** without
+      an offset is read as UTC
+    - **sort**: `-created_at` (default, newest first), `created_at`, `-updated_at`, `price`,
+      `-price` or `name`; ties are broken by id
+    - **total**: `exact` counts in the same query, `estimate` (default) uses planner statistics
+      (filtered totals are always estimates; small unfiltered catalogs are counted exactly),
+      `none` skips counting; the mode used is echoed as **total_mode**
+    - Responses carry an **ETag** derived from the catalog version and these parameters;
+      send it back in **If-None-Match** to get `304 Not Modified` while the catalog is unchanged.
+      The version is read from the primary, so a page never predates the client's own writes
+    """
+    return await product_controller.get_products(
+        page, limit, cursor, total, if_none_match, database,
+        primary_database=primary_database,
+        type=type,
+        min_price=min_price,
+        max_price=max_price,
+        min_quantity=min_quantity,
+        max_quantity=max_quantity,
+        updated_since=updated_since,
+        sort=sort
+    )
+
+
+@products_router.get("/low-stock", response_model=ProductLowStockResponse)
+async def get_low_stock_products(
+    limit: int = Query(50, ge=1, le=100, description="Items per page"),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from a previous next_cursor"),
+    type: Optional[str] = Query(None, max_length=50, description="Only products of this type"),
+    database: Database = Depends(get_read_database),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Products at or below their reorder level (Authentication required)
+    
+    - Ordered by how far below the reorder level they are, most urgent first
+    - **cursor**: Pass the previous page's **next_cursor** to continue
+    - **type**: Optional product type filter
     """
-    return await product_controller.get_products(page, limit, database)
+    return await product_controller.get_low_stock_products(limit, cursor, type, database)
+
+
+@products_router.get("/search", response_model=ProductSearchResponse)
+async def search_products(
+    q: str = Query(..., min_length=2, max_length=100, description="Search text, SKU or partial SKU"),
+    limit: int = Query(20, ge=1, le=100, description="Maximum number of results"),
+    database: Database = Depends(get_read_database),
+    primary_database: Database = Depends(get_database),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Search products by name, description and SKU (Authentication required)
+    
+    - **q**: Words to match in name/description, or a (partial, misspelt) SKU or name
+    - **limit**: Maximum number of results (default: 20, max: 100)
+    - Results are ordered by relevance
+    """
+    return await product_controller.search_products(q, limit, database, primary_database)
+
+
+@products_router.get("/export")
+async def export_products(
+    format: str = Query("ndjson", pattern="^(ndjson|csv)$", description="ndjson or csv"),
+    gzip: bool = Query(False, description="Compress the stream with gzip"),
+    batch_size: int = Query(1000, ge=1, le=5000, description="Rows fetched per keyset read"),
+    database: Database = Depends(get_read_database),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Stream the whole catalog as NDJSON or CSV (Authentication required)
+    
+    - **format**: `ndjson` (default) or `csv`
+    - **gzip**: Send the body with `Content-Encoding: gzip`
+    - Rows are read in keyset-ordered batches, so memory use does not grow with catalog size
+    """
+    return product_controller.export_products(format, gzip, batch_size, database)
+
+
+@products_router.put("/quantities", response_model=StandardResponse)
+async def update_product_quantities(
+    request: BatchUpdateQuantityRequest,
+    database: Database = Depends(get_database),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Update many product quantities in one transaction (Authentication required)
+    
+    - **items**: List of `{id, quantity}` or `{sku, quantity}` (max 5000)
+    - **reason**: Optional stock ledger reason recorded for every changed product
+    - Unknown ids and SKUs are reported in **not_found_ids** / **not_found_skus**
+    """
+    return await product_controller.update_product_quantities(request, database, current_user.id)
 
 
 @products_router.put("/{product_id}/quantity", response_model=StandardResponse)
@@ -62,5 +214,117 @@ async def update_product_quantity(
     
     - **product_id**: ID of the product to update
     - **quantity**: New quantity (must be non-negative)
+    - **reason**: Optional stock ledger reason (default `set`)
+    """
+    return await product_controller.update_product_quantity(product_id, request, database, current_user.id)
+
+
+@products_router.put("/{product_id}/reorder-level", response_model=StandardResponse)
+async def update_reorder_level(
+    product_id: int,
+    request: UpdateReorderLevelRequest,
+    database: Database = Depends(get_database),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Set the quantity at or below which a product is listed by `GET /products/low-stock` (Authentication required)
+    
+    - **product_id**: ID of the product to update
+    - **reorder_level**: New reorder level (must be non-negative)
+    """
+    return await product_controller.update_reorder_level(product_id, request, database)
+
+
+@products_router.post("/{product_id}/adjust", response_model=StandardResponse)
+async def adjust_product_quantity(
+    product_id: int,
+    request: AdjustQuantityRequest,
+    database: Database = Depends(get_database),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Atomically increment or decrement product quantity (Authentication required)
+    
+    - **product_id**: ID of the product to adjust
+    - **delta**: Signed change, e.g. `-3` when picking three units
+    - **reason**: Optional stock ledger reason (default `adjusted`)
+    - Returns 409 if the adjustment would make the quantity negative
+    """
+    return await product_controller.adjust_product_quantity(product_id, request, database, current_user.id)
+
+
+@products_router.get("/{product_id}/movements", response_model=StandardResponse)
+async def get_stock_movements(
+    product_id: int,
+    limit: int = Query(50, ge=1, le=500, description="Movements per page"),
+    before_id: Optional[int] = Query(None, description="Return movements older than this id (next_before_id)"),
+    database: Database = Depends(get_read_database),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Stock movement ledger for a product, newest first (Authentication required)
+    
+    - Every quantity change is recorded with its **delta**, resulting **quantity_after**, **reason** and **user_id**
+    - History is kept after the product is deleted
+    """
+    return await product_controller.get_stock_movements(product_id, limit, before_id, database)
+
+
+@products_router.get("/{product_id}/stock", response_model=StandardResponse)
+async def get_stock_as_of(
+    product_id: int,
+    at: datetime = Query(..., description="Point in time (ISO 8601, e.g. 2026-10-01T00:00:00Z)"),
+    database: Database = Depends(get_read_database),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Product quantity as of a point in time (Authentication required)
+    
+    - **at**: Timestamp to evaluate; naive timestamps are read as UTC
+    - **quantity** is null if the ledger has no movement for the product by then
+    """
+    return await product_controller.get_stock_as_of(product_id, at, database)
+
+
+@products_router.get("/{product_id}", response_model=StandardResponse)
+async def get_product(
+    product_id: int,
+    response: Response,
+    if_modified_since: Optional[str] = Header(None),
+    database: Database = Depends(get_database),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Get a single product (Authentication required)
+    
+    - **product_id**: ID of the product
+    - Read from the primary, so the ETag reflects the client's own latest write
+    - Responses carry **Last-Modified**; send it back in **If-Modified-Since**
+      to get `304 Not Modified` while the product is unchanged
+    - Responses carry an **ETag** of the product's version; send it in **If-Match**
+      when updating the product
+    """
+    return await product_controller.get_product(product_id, if_modified_since, response, database)
+
+
+@products_router.put("/{product_id}", response_model=StandardResponse)
+async def update_product(
+    product_id: int,
+    request: ProductUpdateRequest,
+    response: Response,
+    if_match: Optional[str] = Header(None),
+    database: Database = Depends(get_database),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Replace a product's details (Authentication required)
+    
+    - **product_id**: ID of the product
+    - **name**, **type**, **sku**, **imageUrl**, **description**, **price**, **reorderLevel**:
+      Same rules as `POST /products`; quantity changes go through the quantity endpoints
+    - **reorderLevel** may be omitted to keep the current reorder level
+    - **If-Match**: Required. The **ETag** from `GET /products/{product_id}` (or `*` to
+      overwrite any version); `412 Precondition Failed` if the product changed since
+    - The response carries the new **ETag**
     """
-    return await product_controller.update_product_quantity(product_id, request, database) 
\ No newline at end of file
+    return await product_controller.update_product(product_id, request, if_match, response, database)
@@ -1,7 +1,13 @@
-from pydantic import BaseModel, Field
-from typing import Optional, List
+import orjson
+from pydantic import BaseModel, Field, TypeAdapter
+from typing import Annotated, Optional, List
 from datetime import datetime
 from decimal import Decimal
+# pydantic only accepts typing_extensions' TypedDict before Python 3.12
+from typing_extensions import TypedDict
+
+# Product ids are a Postgres integer; larger values cannot name a product and would fail the cast
+ProductId = Annotated[int, Field(ge=1, le=2**31 - 1)]
 
 
 class ProductCreateRequest(BaseModel):
@@ -12,9 +18,12 @@ class ProductCreateRequest(BaseModel):
     description: Optional[str] = Field(None, description="Product description")
     quantity: int = Field(..., ge=0, description="Product quantity")
     price: Decimal = Field(..., ge=0, description="Product price")
+    reorderLevel: int = Field(0, ge=0, description="Quantity at or below which the product is low on stock")
 
 
-class ProductResponse(BaseModel):
+# Response-only shapes are TypedDicts: validating a page of plain dicts against them costs
+# about half as much as building BaseModel instances, and they validate cached page bodies
+class ProductResponse(TypedDict):
     id: int
     name: str
     type: str
@@ -25,16 +34,112 @@ class ProductResponse(BaseModel):
     price: float
     created_at: datetime
     updated_at: datetime
+    reorder_level: int
+    version: int
+
+
+class ProductUpdateRequest(BaseModel):
+    name: str = Field(..., min_length=1, max_length=100, description="Product name")
+    type: str = Field(..., min_length=1, max_length=50, description="Product type")
+    sku: str = Field(..., min_length=3, max_length=50, description="Product SKU")
+    imageUrl: Optional[str] = Field(None, max_length=500, description="Product image URL")
+    description: Optional[str] = Field(None, description="Product description")
+    price: Decimal = Field(..., ge=0, description="Product price")
+    reorderLevel: Optional[int] = Field(
+        None, ge=0, description="Quantity at or below which the product is low on stock (omit to keep the current one)"
+    )
 
 
 class UpdateQuantityRequest(BaseModel):
     quantity: int = Field(..., ge=0, description="New quantity")
+    reason: Optional[str] = Field(None, max_length=100, description="Stock ledger reason (default: set)")
+
+
+class UpdateReorderLevelRequest(BaseModel):
+    reorder_level: int = Field(..., ge=0, description="Quantity at or below which the product is low on stock")
+
+
+class AdjustQuantityRequest(BaseModel):
+    delta: int = Field(..., description="Signed change to apply to the current quantity")
+    reason: Optional[str] = Field(None, max_length=100, description="Stock ledger reason (default: adjusted)")
+
+
+class QuantityUpdateItem(BaseModel):
+    id: Optional[ProductId] = Field(None, description="Product ID (provide either id or sku)")
+    sku: Optional[str] = Field(None, max_length=50, description="Product SKU (provide either id or sku)")
+    quantity: int = Field(..., ge=0, description="New quantity")
+
+
+class BatchUpdateQuantityRequest(BaseModel):
+    items: List[QuantityUpdateItem] = Field(..., min_length=1, max_length=5000, description="Quantity changes")
+    reason: Optional[str] = Field(None, max_length=100, description="Stock ledger reason for every item (default: set)")
+
+
+class ProductLookupRequest(BaseModel):
+    ids: List[ProductId] = Field(default_factory=list, max_length=5000, description="Product IDs")
+    skus: List[str] = Field(default_factory=list, max_length=5000, description="Product SKUs")
+
+
+class ProductListData(TypedDict):
+    products: List[ProductResponse]
+    page: int
+    limit: int
+    next_cursor: Optional[str]
+    total: Optional[int]
+    total_mode: str
 
 
-class ProductListResponse(BaseModel):
+class ProductListResponse(TypedDict):
     success: bool
     message: str
-    data: List[ProductResponse]
+    data: ProductListData
+
+
+class ProductSearchData(TypedDict):
+    products: List[ProductResponse]
+    q: str
+    limit: int
+
+
+class ProductSearchResponse(TypedDict):
+    success: bool
+    message: str
+    data: ProductSearchData
+
+
+class ProductLookupData(TypedDict):
+    products: List[ProductResponse]
+    not_found_ids: List[int]
+    not_found_skus: List[str]
+
+
+class ProductLookupResponse(TypedDict):
+    success: bool
+    message: str
+    data: ProductLookupData
+
+
+class ProductLowStockData(TypedDict):
+    products: List[ProductResponse]
+    limit: int
+    type: Optional[str]
+    next_cursor: Optional[str]
+
+
+class ProductLowStockResponse(TypedDict):
+    success: bool
+    message: str
+    data: ProductLowStockData
+
+
+# Built once: the cached list and search bodies are validated against these before encoding
+PRODUCT_LIST_RESPONSE = TypeAdapter(ProductListResponse)
+PRODUCT_SEARCH_RESPONSE = TypeAdapter(ProductSearchResponse)
+
+
+def encode_response(response: TypeAdapter, content: dict) -> bytes:
+    """Validate a response body once against its schema and encode it straight to JSON bytes"""
+    return orjson.dumps(response.validate_python(content))
 
 
 class StandardResponse(BaseModel):
@@ -0,0 +1,110 @@
+import csv
+import io
+import json
+import zlib
+import orjson
+from typing import AsyncIterator, List, Optional, Tuple
+from src.domain.entities.product import Product
+
+
+# Longest line (or multi-line CSV record) an import will buffer; a body without newlines
+# would otherwise be held in memory in full
+MAX_LINE_BYTES = 64 * 1024
+
+
+def _line_too_long() -> ValueError:
+    return ValueError(f"Import line is too long (limit {MAX_LINE_BYTES} bytes)")
+
+
+async def iter_lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[str]:
+    """Split a streamed request body into decoded lines without buffering the whole body"""
+    buffer = b""
+    async for chunk in chunks:
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            if len(line) > MAX_LINE_BYTES:
+                raise _line_too_long()
+            yield line.rstrip(b"\r").decode("utf-8-sig")
+        if len(buffer) > MAX_LINE_BYTES:
+            raise _line_too_long()
+    if buffer.strip():
+        yield buffer.rstrip(b"\r").decode("utf-8-sig")
+
+
+async def iter_ndjson_rows(chunks: AsyncIterator[bytes]) -> AsyncIterator[Tuple[int, Optional[dict]]]:
+    """Yield (row number, object) for each non-blank NDJSON line; undecodable lines yield None"""
+    row_number = 0
+    async for line in iter_lines(chunks):
+        if not line.strip():
+            continue
+        row_number += 1
+        try:
+            row = json.loads(line)
+        except ValueError:
+            row = None
+        yield row_number, row if isinstance(row, dict) else None
+
+
+async def iter_csv_rows(chunks: AsyncIterator[bytes]) -> AsyncIterator[Tuple[int, Optional[dict]]]:
+    """Yield (row number, object) for each CSV record, keyed by the header row"""
+    header = None
+    row_number = 0
+    record = ""
+    async for line in iter_lines(chunks):
+        record = f"{record}\n{line}" if record else line
+        if len(record) > MAX_LINE_BYTES:
+            raise _line_too_long()
+        # A quoted field may span lines; wait until its quotes are balanced
+        if record.count('"') % 2:
+            continue
+        fields, record = next(csv.reader([record]), []), ""
+        if not any(field.strip() for field in fields):
+            continue
+        if header is None:
+            header = [field.strip() for field in fields]
+            continue
+        row_number += 1
+        if len(fields) != len(header):
+            yield row_number, None
+            continue
+        # Empty cells mean "not provided" so optional fields fall back to their defaults
+        yield row_number, {key: value for key, value in zip(header, fields) if value != ""}
+    if record:
+        yield row_number + 1, None
+
+
+EXPORT_FIELDS = [
+    "id", "name", "type", "sku", "image_url", "description",
+    "quantity", "price", "created_at", "updated_at", "reorder_level", "version",
+]
+
+
+async def encode_ndjson(batches: AsyncIterator[List[Product]]) -> AsyncIterator[bytes]:
+    """Encode each batch of products as one chunk of NDJSON lines"""
+    async for products in batches:
+        yield b"".join(orjson.dumps(product.to_dict()) + b"\n" for product in products)
+
+
+async def encode_csv(batches: AsyncIterator[List[Product]]) -> AsyncIterator[bytes]:
+    """Encode batches of products as CSV, starting with a header row"""
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=EXPORT_FIELDS, lineterminator="\n")
+    writer.writeheader()
+    async for products in batches:
+        writer.writerows(product.to_dict() for product in products)
+        yield buffer.getvalue().encode()
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue().encode()
+
+
+async def gzip_chunks(chunks: AsyncIterator[bytes], level: int = 6) -> AsyncIterator[bytes]:
+    """Compress a byte stream on the fly into a single gzip member"""
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+    async for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
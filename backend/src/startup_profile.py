@@ -0,0 +1,88 @@
+import asyncio
+import builtins
+import sys
+import time
+from collections import defaultdict
+from typing import List, Tuple
+
+TOP_IMPORTS = 12
+
+
+class ImportTimer:
+    """Attributes time spent on first-time imports to top-level packages, excluding nested packages"""
+
+    def __init__(self):
+        self.seconds = defaultdict(float)
+        self._stack = []
+        self._original = None
+
+    def __enter__(self) -> "ImportTimer":
+        self._original = builtins.__import__
+        builtins.__import__ = self._import
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        builtins.__import__ = self._original
+
+    def _import(self, name, globals=None, locals=None, fromlist=(), level=0):
+        package = name.partition(".")[0]
+        if level or name in sys.modules or (self._stack and self._stack[-1][0] == package):
+            return self._original(name, globals, locals, fromlist, level)
+
+        frame = [package, 0.0]
+        self._stack.append(frame)
+        started = time.perf_counter()
+        try:
+            return self._original(name, globals, locals, fromlist, level)
+        finally:
+            elapsed = time.perf_counter() - started
+            self._stack.pop()
+            self.seconds[package] += elapsed - frame[1]
+            if self._stack:
+                self._stack[-1][1] += elapsed
+
+
+def _print_report(phases: List[Tuple[str, float]], imports: ImportTimer) -> None:
+    print("Startup profile")
+    for label, seconds in phases:
+        print(f"  {label:<36} {seconds * 1000:9.1f} ms")
+        if label == "import src.app":
+            slowest = sorted(imports.seconds.items(), key=lambda item: item[1], reverse=True)
+            for package, package_seconds in slowest[:TOP_IMPORTS]:
+                print(f"    {package:<34} {package_seconds * 1000:9.1f} ms")
+    print(f"  {'total (time to first request)':<36} {sum(seconds for _, seconds in phases) * 1000:9.1f} ms")
+
+
+def profile_startup() -> None:
+    """Build the app, run its startup hooks and serve one request in-process, timing each phase"""
+    phases = []
+
+    with ImportTimer() as imports:
+        started = time.perf_counter()
+        from src.app import create_app
+        phases.append(("import src.app", time.perf_counter() - started))
+
+    started = time.perf_counter()
+    app = create_app()
+    phases.append(("create_app()", time.perf_counter() - started))
+
+    async def boot():
+        started = time.perf_counter()
+        await app.router.startup()
+        hooks_seconds = time.perf_counter() - started
+        startup_timings = getattr(app.state, "startup_timings", [])
+        for label, seconds in startup_timings:
+            phases.append((f"startup: {label}", seconds))
+        phases.append(("startup: other hooks", hooks_seconds - sum(seconds for _, seconds in startup_timings)))
+
+        try:
+            import httpx
+            async with httpx.AsyncClient(app=app, base_url="http://startup-profile") as client:
+                started = time.perf_counter()
+                response = await client.get("/health")
+                phases.append((f"first request (GET /health {response.status_code})", time.perf_counter() - started))
+        finally:
+            await app.router.shutdown()
+
+    asyncio.run(boot())
+    _print_report(phases, imports)
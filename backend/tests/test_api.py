@@ -8,6 +8,7 @@ import requests
 import json
 import time
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any
 
 class InventoryAPITester:
@@ -107,6 +108,29 @@ class InventoryAPITester:
             print(f"   Error: {e}")
             return False
 
+    def test_bulk_import_products(self) -> bool:
+        """Test streamed NDJSON bulk import with one valid and one invalid row"""
+        try:
+            rows = [
+                {**self.test_product, "sku": f"BULK{int(time.time())}"},
+                {**self.test_product, "sku": "X", "quantity": -1},
+            ]
+            response = self.session.post(
+                f"{self.base_url}/products/bulk",
+                data="\n".join(json.dumps(row) for row in rows),
+                headers={"Content-Type": "application/x-ndjson"}
+            )
+            success = response.status_code == 200
+            if success:
+                data = response.json().get('data', {})
+                success = data.get('inserted') == 1 and data.get('failed') == 1
+            self.print_result("Bulk Import Products", success, response)
+            return success
+        except Exception as e:
+            self.print_result("Bulk Import Products", False)
+            print(f"   Error: {e}")
+            return False
+
     def test_get_products(self) -> bool:
         """Test getting products list"""
         try:
@@ -119,6 +143,195 @@ class InventoryAPITester:
             print(f"   Error: {e}")
             return False
 
+    def test_get_products_cursor(self) -> bool:
+        """Test keyset pagination with next_cursor"""
+        try:
+            response = self.session.get(f"{self.base_url}/products", params={"limit": 1})
+            success = response.status_code == 200
+            if success:
+                data = response.json().get('data', {})
+                next_cursor = data.get('next_cursor')
+                if next_cursor:
+                    next_response = self.session.get(
+                        f"{self.base_url}/products",
+                        params={"limit": 1, "cursor": next_cursor}
+                    )
+                    next_data = next_response.json().get('data', {})
+                    success = (
+                        next_response.status_code == 200
+                        and next_data.get('products', [{}])[0].get('id') != data['products'][0]['id']
+                    )
+                    response = next_response
+            self.print_result("Get Products (Cursor)", success, response)
+            return success
+        except Exception as e:
+            self.print_result("Get Products (Cursor)", False)
+            print(f"   Error: {e}")
+            return False
+
+    def test_get_products_filtered(self) -> bool:
+        """Test filters and sort on the product list, across cursor pages"""
+        try:
+            params = {"limit": 2, "type": "Electronics", "min_price": 1, "sort": "price"}
+            response = self.session.get(f"{self.base_url}/products", params=params)
+            success = response.status_code == 200
+            prices = []
+            while success:
+                data = response.json().get('data', {})
+                products = data.get('products', [])
+                success = all(p['type'] == "Electronics" and p['price'] >= 1 for p in products)
+                prices += [p['price'] for p in products]
+                if not data.get('next_cursor') or len(prices) >= 10:
+                    break
+                response = self.session.get(
+                    f"{self.base_url}/products",
+                    params={**params, "cursor": data['next_cursor']}
+                )
+                success = success and response.status_code == 200
+            success = success and prices == sorted(prices)
+            if success:
+                # A cursor only continues the sort it was issued for
+                if data.get('next_cursor'):
+                    response = self.session.get(
+                        f"{self.base_url}/products",
+                        params={**params, "sort": "name", "cursor": data['next_cursor']}
+                    )
+                    success = response.status_code == 400
+            if success:
+                response = self.session.get(f"{self.base_url}/products", params={"sort": "sku"})
+                success = response.status_code == 400
+            self.print_result("Get Products (Filtered)", success, response)
+            return success
+        except Exception as e:
+            self.print_result("Get Products (Filtered)", False)
+            print(f"   Error: {e}")
+            return False
+
+    def test_conditional_get(self) -> bool:
+        """Test ETag / If-None-Match on the list and If-Modified-Since on a single product"""
+        try:
+            response = self.session.get(f"{self.base_url}/products", params={"limit": 1})
+            etag = response.headers.get('ETag')
+            success = response.status_code == 200 and bool(etag)
+            if success:
+                response = self.session.get(
+                    f"{self.base_url}/products",
+                    params={"limit": 1},
+                    headers={"If-None-Match": etag}
+                )
+                success = response.status_code == 304
+            if success and self.test_product.get('id'):
+                url = f"{self.base_url}/products/{self.test_product['id']}"
+                response = self.session.get(url)
+                last_modified = response.headers.get('Last-Modified')
+                success = response.status_code == 200 and bool(last_modified)
+                if success:
+                    response = self.session.get(url, headers={"If-Modified-Since": last_modified})
+                    success = response.status_code == 304
+            self.print_result("Conditional GET", success, response)
+            return success
+        except Exception as e:
+            self.print_result("Conditional GET", False)
+            print(f"   Error: {e}")
+            return False
+
+    def test_lookup_products(self) -> bool:
+        """Test batch lookup by ids and SKUs, in request order with missing keys reported"""
+        try:
+            if not self.test_product.get('id'):
+                self.print_result("Lookup Products", False)
+                print("   Error: No product ID available")
+                return False
+
+            response = self.session.post(
+                f"{self.base_url}/products/lookup",
+                json={
+                    "ids": [999999999, self.test_product['id']],
+                    "skus": [self.test_product['sku'], "NO-SUCH-SKU"]
+                }
+            )
+            success = response.status_code == 200
+            if success:
+                data = response.json().get('data', {})
+                success = (
+                    [p['id'] for p in data.get('products', [])] == [self.test_product['id']] * 2
+                    and data.get('not_found_ids') == [999999999]
+                    and data.get('not_found_skus') == ["NO-SUCH-SKU"]
+                )
+            self.print_result("Lookup Products", success, response)
+            return success
+        except Exception as e:
+            self.print_result("Lookup Products", False)
+            print(f"   Error: {e}")
+            return False
+
+    def test_listing_after_write(self) -> bool:
+        """Test that a cached listing page is never served after a write changes it"""
+        try:
+            if not self.test_product.get('id'):
+                self.print_result("Listing After Write", False)
+                print("   Error: No product ID available")
+                return False
+
+            params = {"limit": 1, "sort": "-updated_at"}
+            self.session.get(f"{self.base_url}/products", params=params)
+            self.session.get(f"{self.base_url}/products", params=params)
+
+            quantity = int(time.time()) % 1000
+            self.session.put(
+                f"{self.base_url}/products/{self.test_product['id']}/quantity",
+                json={"quantity": quantity}
+            )
+            response = self.session.get(f"{self.base_url}/products", params=params)
+            success = response.status_code == 200
+            if success:
+                first = response.json().get('data', {}).get('products', [{}])[0]
+                success = first.get('id') == self.test_product['id'] and first.get('quantity') == quantity
+            self.print_result("Listing After Write", success, response)
+            return success
+        except Exception as e:
+            self.print_result("Listing After Write", False)
+            print(f"   Error: {e}")
+            return False
+
+    def test_search_products(self) -> bool:
+        """Test product search by partial SKU"""
+        try:
+            response = self.session.get(
+                f"{self.base_url}/products/search",
+                params={"q": self.test_product['sku'][:-2]}
+            )
+            success = response.status_code == 200
+            if success:
+                skus = [p['sku'] for p in response.json().get('data', {}).get('products', [])]
+                success = self.test_product['sku'] in skus
+            self.print_result("Search Products", success, response)
+            return success
+        except Exception as e:
+            self.print_result("Search Products", False)
+            print(f"   Error: {e}")
+            return False
+
+    def test_export_products(self) -> bool:
+        """Test streaming CSV export"""
+        try:
+            response = self.session.get(
+                f"{self.base_url}/products/export",
+                params={"format": "csv", "gzip": "true"},
+                stream=True
+            )
+            success = response.status_code == 200
+            if success:
+                header = next(response.iter_lines(decode_unicode=True))
+                success = header.startswith("id,name,type,sku")
+            response.close()
+            self.print_result("Export Products", success, response)
+            return success
+        except Exception as e:
+            self.print_result("Export Products", False)
+            print(f"   Error: {e}")
+            return False
+
     def test_update_product_quantity(self) -> bool:
         """Test updating product quantity"""
         try:
@@ -140,6 +353,200 @@ class InventoryAPITester:
             print(f"   Error: {e}")
             return False
 
+    def test_adjust_product_quantity(self) -> bool:
+        """Test relative quantity adjustment and the negative stock guard"""
+        try:
+            if not self.test_product.get('id'):
+                self.print_result("Adjust Product Quantity", False)
+                print("   Error: No product ID available")
+                return False
+
+            url = f"{self.base_url}/products/{self.test_product['id']}/adjust"
+            response = self.session.post(url, json={"delta": -5})
+            success = response.status_code == 200
+            if success:
+                response = self.session.post(url, json={"delta": -1000000})
+                success = response.status_code == 409
+            self.print_result("Adjust Product Quantity", success, response)
+            return success
+        except Exception as e:
+            self.print_result("Adjust Product Quantity", False)
+            print(f"   Error: {e}")
+            return False
+
+    def test_update_product_quantities(self) -> bool:
+        """Test batch quantity update by id and SKU with an unknown SKU"""
+        try:
+            if not self.test_product.get('id'):
+                self.print_result("Update Product Quantities", False)
+                print("   Error: No product ID available")
+                return False
+
+            response = self.session.put(
+                f"{self.base_url}/products/quantities",
+                json={"items": [
+                    {"id": self.test_product['id'], "quantity": 60},
+                    {"sku": f"MISSING{int(time.time())}", "quantity": 1},
+                ]}
+            )
+            success = response.status_code == 200
+            if success:
+                data = response.json().get('data', {})
+                success = (
+                    [p['quantity'] for p in data.get('products', [])] == [60]
+                    and len(data.get('not_found_skus', [])) == 1
+                )
+            self.print_result("Update Product Quantities", success, response)
+            return success
+        except Exception as e:
+            self.print_result("Update Product Quantities", False)
+            print(f"   Error: {e}")
+            return False
+
+    def test_low_stock_products(self) -> bool:
+        """Test raising the reorder level above stock lists the product as low on stock"""
+        try:
+            if not self.test_product.get('id'):
+                self.print_result("Low-Stock Products", False)
+                print("   Error: No product ID available")
+                return False
+
+            response = self.session.put(
+                f"{self.base_url}/products/{self.test_product['id']}/reorder-level",
+                json={"reorder_level": 1000}
+            )
+            success = response.status_code == 200
+            found, cursor = False, None
+            while success and not found:
+                params = {"type": self.test_product['type'], "limit": 100}
+                if cursor:
+                    params["cursor"] = cursor
+                response = self.session.get(f"{self.base_url}/products/low-stock", params=params)
+                success = response.status_code == 200
+                if success:
+                    data = response.json().get('data', {})
+                    found = any(p['id'] == self.test_product['id'] for p in data.get('products', []))
+                    cursor = data.get('next_cursor')
+                    if not cursor:
+                        break
+            success = success and found
+            self.print_result("Low-Stock Products", success, response)
+            return success
+        except Exception as e:
+            self.print_result("Low-Stock Products", False)
+            print(f"   Error: {e}")
+            return False
+
+    def test_stock_movements(self) -> bool:
+        """Test the stock ledger records every quantity change and answers as-of queries"""
+        try:
+            if not self.test_product.get('id'):
+                self.print_result("Stock Movements", False)
+                print("   Error: No product ID available")
+                return False
+
+            url = f"{self.base_url}/products/{self.test_product['id']}"
+            response = self.session.get(f"{url}/movements")
+            success = response.status_code == 200
+            if success:
+                movements = response.json().get('data', {}).get('movements', [])
+                # Newest first: the batch set to 60 ... back to the creation entry
+                success = (
+                    bool(movements)
+                    and movements[0]['quantity_after'] == 60
+                    and movements[-1]['reason'] == "created"
+                    and all(m['quantity_after'] - m['delta'] == n['quantity_after']
+                            for m, n in zip(movements, movements[1:]))
+                )
+            if success:
+                response = self.session.get(
+                    f"{url}/stock", params={"at": movements[-1]['created_at']}
+                )
+                success = (
+                    response.status_code == 200
+                    and response.json().get('data', {}).get('quantity') == movements[-1]['quantity_after']
+                )
+            self.print_result("Stock Movements", success, response)
+            return success
+        except Exception as e:
+            self.print_result("Stock Movements", False)
+            print(f"   Error: {e}")
+            return False
+
+    def test_concurrent_duplicate_creates(self) -> bool:
+        """Test that parallel creates of one SKU / username yield one 201 and 409s, never a 500"""
+        try:
+            suffix = int(time.time() * 1000)
+            product = {**self.test_product, "sku": f"RACE{suffix}"}
+            user = {"username": f"raceuser_{suffix}", "password": "testpass123"}
+            headers = {"Authorization": f"Bearer {self.auth_token}"}
+            attempts = 8
+
+            def create_product(_):
+                return requests.post(f"{self.base_url}/products", json=product, headers=headers)
+
+            def register_user(_):
+                return requests.post(f"{self.base_url}/auth/register", json=user)
+
+            success = True
+            response = None
+            with ThreadPoolExecutor(max_workers=attempts) as pool:
+                for create in (create_product, register_user):
+                    responses = list(pool.map(create, range(attempts)))
+                    statuses = sorted(r.status_code for r in responses)
+                    if statuses != [201] + [409] * (attempts - 1):
+                        success = False
+                        response = next((r for r in responses if r.status_code not in (201, 409)), responses[0])
+                        print(f"   Statuses: {statuses}")
+                        break
+            self.print_result("Concurrent Duplicate Creates", success, response)
+            return success
+        except Exception as e:
+            self.print_result("Concurrent Duplicate Creates", False)
+            print(f"   Error: {e}")
+            return False
+
+    def test_update_product_if_match(self) -> bool:
+        """Test optimistic concurrency on product updates: If-Match required, stale ETags get 412"""
+        try:
+            if not self.test_product.get('id'):
+                self.print_result("Update Product (If-Match)", False)
+                print("   Error: No product ID available")
+                return False
+
+            url = f"{self.base_url}/products/{self.test_product['id']}"
+            etag = self.session.get(url).headers.get('ETag')
+            details = {
+                "name": "Renamed Test Product",
+                "type": self.test_product['type'],
+                "sku": self.test_product['sku'],
+                "price": 89.99
+            }
+
+            response = self.session.put(url, json=details)
+            success = bool(etag) and response.status_code == 428
+            if success:
+                # Two editors holding the same ETag: exactly one write wins
+                headers = {"Authorization": f"Bearer {self.auth_token}", "If-Match": etag}
+                with ThreadPoolExecutor(max_workers=2) as pool:
+                    responses = list(pool.map(
+                        lambda price: requests.put(url, json={**details, "price": price}, headers=headers),
+                        [79.99, 69.99]
+                    ))
+                statuses = sorted(r.status_code for r in responses)
+                winner = next((r for r in responses if r.status_code == 200), None)
+                response = winner or responses[0]
+                success = statuses == [200, 412] and winner.headers.get('ETag') not in (None, etag)
+            if success:
+                response = self.session.get(url)
+                success = response.json().get('data', {}).get('price') == winner.json()['data']['price']
+            self.print_result("Update Product (If-Match)", success, response)
+            return success
+        except Exception as e:
+            self.print_result("Update Product (If-Match)", False)
+            print(f"   Error: {e}")
+            return False
+
     def test_unauthorized_access(self) -> bool:
         """Test unauthorized access to protected endpoints"""
         try:
@@ -209,8 +616,22 @@ class InventoryAPITester:
             ("Register User", self.test_register_user),
             ("Login User", self.test_login_user),
             ("Create Product", self.test_create_product),
+            ("Bulk Import Products", self.test_bulk_import_products),
             ("Get Products", self.test_get_products),
+            ("Get Products (Cursor)", self.test_get_products_cursor),
+            ("Get Products (Filtered)", self.test_get_products_filtered),
+            ("Conditional GET", self.test_conditional_get),
+            ("Listing After Write", self.test_listing_after_write),
+            ("Search Products", self.test_search_products),
+            ("Lookup Products", self.test_lookup_products),
+            ("Export Products", self.test_export_products),
             ("Update Product Quantity", self.test_update_product_quantity),
+            ("Adjust Product Quantity", self.test_adjust_product_quantity),
+            ("Update Product Quantities", self.test_update_product_quantities),
+            ("Low-Stock Products", self.test_low_stock_products),
+            ("Stock Movements", self.test_stock_movements),
+            ("Concurrent Duplicate Creates", self.test_concurrent_duplicate_creates),
+            ("Update Product (If-Match)", self.test_update_product_if_match),
             ("Unauthorized Access", self.test_unauthorized_access),
             ("Duplicate User Registration", self.test_duplicate_user_registration),
             ("Invalid Product Data Validation", self.test_invalid_product_data),
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Product Listing Query Plan Test Script
+Checks that every sort and common filter combination of GET /products is served by an index
+"""
+
+import asyncio
+import json
+import os
+import sys
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+from sqlalchemy.engine import make_url
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from src.domain.repositories import PRODUCT_SORTS
+from src.infrastructure.database.database import Database
+from src.infrastructure.repositories import SQLAlchemyProductRepository
+
+# A full walk of the primary key index is no better than a sequential scan, so a plan
+# only counts when it reads one of the indexes built for listings
+LISTING_INDEXES = {
+    "ix_products_created_at_id",
+    "ix_products_type_created_at_id",
+    "ix_products_type_price_id",
+    "ix_products_price_id",
+    "ix_products_updated_at_id",
+    "ix_products_name_id",
+}
+
+FILTER_COMBINATIONS = {
+    "no filters": {},
+    "type": {"type": "Electronics"},
+    "price range": {"min_price": Decimal("10"), "max_price": Decimal("50")},
+    "type + price range": {"type": "Electronics", "max_price": Decimal("50")},
+    "type + in stock": {"type": "Electronics", "min_quantity": 1},
+    "updated_since": {"updated_since": datetime.utcnow() - timedelta(days=1)},
+}
+
+
+def _plan_nodes(plan: dict):
+    yield plan
+    for child in plan.get("Plans", []):
+        yield from _plan_nodes(child)
+
+
+class QueryPlanTester:
+    def __init__(self, database_url: str):
+        self.database = Database(make_url(database_url).set(drivername="postgresql+asyncpg"))
+
+    def print_result(self, test_name: str, success: bool, detail: str = None):
+        """Print test result with formatting"""
+        status = "✅ PASS" if success else "❌ FAIL"
+        print(f"{status} {test_name}")
+        if detail and not success:
+            print(f"   {detail}")
+
+    async def explain(self, query: str, values: dict) -> dict:
+        """Plan a query with sequential scans priced out, without running it"""
+        async with self.database.transaction() as connection:
+            await connection.exec_driver_sql("SET LOCAL enable_seqscan = off")
+            plan = await self.database.fetch_val(f"EXPLAIN (FORMAT JSON) {query}", values)
+        return json.loads(plan)[0]["Plan"] if isinstance(plan, str) else plan[0]["Plan"]
+
+    async def test_listing_plan(self, sort: str, label: str, filters: dict, after=None) -> bool:
+        test_name = f"sort={sort}, {label}{', after cursor' if after else ''}"
+        try:
+            query, values = SQLAlchemyProductRepository._page_query(11, 0, after, filters=filters, sort=sort)
+            nodes = list(_plan_nodes(await self.explain(query, values)))
+            node_types = [node["Node Type"] for node in nodes]
+            indexes = {node.get("Index Name") for node in nodes} & LISTING_INDEXES
+
+            success = "Seq Scan" not in node_types and bool(indexes)
+            self.print_result(test_name, success, f"Plan nodes: {node_types}, indexes: {indexes or None}")
+            return success
+        except Exception as e:
+            self.print_result(test_name, False, f"Error: {e}")
+            return False
+
+    async def run_all_tests(self) -> bool:
+        """Plan every sort against every filter combination, plus a keyset page of each sort"""
+        print("🚀 Starting Product Listing Query Plan Tests")
+        print("=" * 50)
+
+        after_values = {
+            "created_at": datetime.utcnow(),
+            "updated_at": datetime.utcnow(),
+            "price": Decimal("25"),
+            "name": "M",
+        }
+
+        await self.database.connect()
+        try:
+            results = []
+            for sort in PRODUCT_SORTS:
+                for label, filters in FILTER_COMBINATIONS.items():
+                    results.append(await self.test_listing_plan(sort, label, filters))
+                after = (after_values[sort.lstrip("-")], 1000)
+                results.append(await self.test_listing_plan(sort, "no filters", {}, after))
+        finally:
+            await self.database.disconnect()
+
+        passed = sum(results)
+        print("=" * 50)
+        print(f"📊 Test Results: {passed}/{len(results)} tests passed")
+        return passed == len(results)
+
+
+def main():
+    """Main function to run tests"""
+    database_url = os.getenv("DATABASE_URL")
+    if not database_url:
+        print("DATABASE_URL must point at a migrated database")
+        sys.exit(1)
+
+    tester = QueryPlanTester(database_url)
+    success = asyncio.run(tester.run_all_tests())
+
+    sys.exit(0 if success else 1)
+
+if __name__ == "__main__":
+    main()